@@ -1,14 +1,18 @@
 """ CSV 관리 API """
 # backend/app/api/admin/csv_manage.py
 
+import os
+from typing import Optional
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
 
-from app.api.deps import require_admin
-from app.services.csv_service import CSVService
-from app.schemas.csv import CSVDataResponse
+from app.api.deps import require_admin, get_csv_service
+from app.core.config import settings
+from app.schemas.csv import CSVDataResponse, MaterializedViewRequest
+from app.services import csv_views
+from app.utils.logger import logger
 
 router = APIRouter(prefix="/admin/csv", tags=["admin-csv"])
-csv_service = CSVService()
+csv_service = get_csv_service()
 
 @router.post("/upload", response_model=CSVDataResponse)
 async def upload_csv(
@@ -33,16 +37,75 @@ async def upload_csv(
     # 파일 크기 검증 (100MB)
     # 빅데이터 처리 시 주의 필요
     # 실제 서비스에서는 더 큰 파일을 처리할 수 있도록 조정 가능
-    if file.size > 100 * 1024 * 1024:
+    # (크기를 알 수 없는 업로드는 저장 중 스트리밍 단계에서 검사)
+    if file.size and file.size > 100 * 1024 * 1024:
         raise HTTPException(
             status_code=400,
             detail="파일 크기는 100MB를 초과할 수 없습니다"
         )
     
-    result = await csv_service.upload_and_process(
-        file=file,
-        description=description,
-        backup_current=backup_current,
-        uploaded_by=session.get("user_id", "admin")
+    try:
+        result = await csv_service.upload_and_process(
+            file=file,
+            description=description,
+            backup_current=backup_current,
+            uploaded_by=session.get("user_id", "admin")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # 등록된 집계 조합 미리 계산 (백그라운드)
+    result['metadata']['view_refresh_task_id'] = _schedule_view_refresh(
+        os.path.join(settings.UPLOAD_DIR, os.path.basename(file.filename))
     )
-    return result
\ No newline at end of file
+    return result
+
+@router.get("/views")
+async def list_materialized_views(session: dict = Depends(require_admin)):
+    """미리 계산하는 집계 조합 목록"""
+    return {"views": csv_views.load_definitions()}
+
+@router.post("/views")
+async def save_materialized_view(
+    request: MaterializedViewRequest,
+    session: dict = Depends(require_admin)
+):
+    """
+    집계 조합 등록 (같은 이름이면 교체)
+    - 등록 후 현재 데이터셋에 대해 바로 계산
+    """
+    try:
+        csv_views.view_key(request.group_by, request.aggregate, request.date_range)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    definitions = [d for d in csv_views.load_definitions() if d.get("name") != request.name]
+    definitions.append(request.model_dump())
+    csv_views.save_definitions(definitions)
+    
+    return {"views": definitions, "task_id": _schedule_view_refresh()}
+
+@router.delete("/views/{name}")
+async def delete_materialized_view(name: str, session: dict = Depends(require_admin)):
+    """집계 조합 삭제"""
+    definitions = csv_views.load_definitions()
+    remaining = [d for d in definitions if d.get("name") != name]
+    if len(remaining) == len(definitions):
+        raise HTTPException(status_code=404, detail="등록되지 않은 뷰입니다")
+    csv_views.save_definitions(remaining)
+    return {"views": remaining, "task_id": _schedule_view_refresh()}
+
+def _schedule_view_refresh(file_path: Optional[str] = None) -> Optional[str]:
+    """
+    뷰 갱신 작업 등록 후 task_id 반환 (/admin/reports/tasks/{task_id} 로 조회)
+    - eager 모드는 dispatch 가 별도 스레드에서 실행
+    - 브로커에 연결할 수 없으면 None (뷰는 조회 시 실시간 계산)
+    """
+    from app.tasks.celery_app import dispatch
+    from app.tasks.data_tasks import refresh_materialized_views_task
+    
+    try:
+        return dispatch(refresh_materialized_views_task, file_path)
+    except Exception as e:
+        logger.warning(f"Materialized view refresh not scheduled, views will be computed on request: {e}")
+        return None
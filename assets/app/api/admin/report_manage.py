@@ -0,0 +1,55 @@
+""" 리포트 생성 작업 관리 API """
+# backend/app/api/admin/report_manage.py
+
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.deps import require_admin
+from app.core.config import settings
+
+router = APIRouter(prefix="/admin/reports", tags=["admin-reports"])
+
+@router.post("/generate")
+async def generate_report(
+    filename: Optional[str] = Query(None, description="업로드 폴더의 원본 PDF 파일명 (없으면 최신 파일)"),
+    session: dict = Depends(require_admin)
+):
+    """
+    월간 리포트 생성 작업 등록
+    - 작업 ID를 즉시 반환하고 진행 상황은 /tasks/{task_id}로 조회
+    """
+    from app.tasks.celery_app import dispatch
+    from app.tasks.report_tasks import generate_monthly_report
+    
+    pdf_path = None
+    if filename:
+        pdf_path = os.path.join(settings.UPLOAD_DIR, os.path.basename(filename))
+        if not os.path.exists(pdf_path):
+            raise HTTPException(status_code=404, detail="원본 PDF를 찾을 수 없습니다")
+    
+    # eager 모드에서도 요청 스레드(이벤트 루프)를 막지 않도록 dispatch 사용
+    task_id = dispatch(generate_monthly_report, pdf_path)
+    return {
+        "message": "리포트 생성 작업이 등록되었습니다",
+        "task_id": task_id
+    }
+
+@router.get("/tasks/{task_id}")
+async def get_task_status(
+    task_id: str,
+    session: dict = Depends(require_admin)
+):
+    """리포트 생성 작업 상태 및 진행 상황 조회"""
+    from app.tasks.celery_app import celery_app
+    
+    result = celery_app.AsyncResult(task_id)
+    info = result.info
+    
+    return {
+        "task_id": task_id,
+        "state": result.state,
+        "progress": info if result.state == "PROGRESS" else None,
+        "result": info if result.successful() else None,
+        "error": str(info) if result.failed() else None
+    }
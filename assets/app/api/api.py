@@ -5,7 +5,7 @@
 # backend/app/api/api.py
 from fastapi import APIRouter
 
-from app.api.admin import auth, csv_manage
+from app.api.admin import auth, csv_manage, report_manage
 from app.api.proxy import external
 from app.api.data import csv, reports
 
@@ -14,6 +14,7 @@ api_router = APIRouter()
 # 관리자 라우터
 api_router.include_router(auth.router)
 api_router.include_router(csv_manage.router)
+api_router.include_router(report_manage.router)
 
 # 공개 라우터
 api_router.include_router(external.router)
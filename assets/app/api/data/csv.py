@@ -2,13 +2,16 @@
 CSV 데이터 조회 API
 """
 # backend/app/api/data/csv.py
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from datetime import datetime
-import hashlib
 
 from app.api.deps import get_cache_service, get_csv_service
+from app.cache.keys import csv_current_key, csv_processed_key
+from app.core.config import settings
 from app.services.cache_service import CacheService
+from app.services import csv_export
 
 from app.schemas.csv import CSVDataResponse, CSVMetadataResponse
 
@@ -21,29 +24,32 @@ async def get_current_csv(
     filter: Optional[str] = Query(None),
     limit: int = Query(1000),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 대신 사용)"),
+    with_total: bool = Query(False, description="cursor 조회 시 total_count 계산 여부"),
     cache_service: CacheService = Depends(get_cache_service)
 ):
     """현재 CSV 데이터 조회"""
     # 캐시 키 생성
-    cache_key = f"csv:current:{hashlib.md5(f'{columns}:{filter}:{limit}:{offset}'.encode()).hexdigest()}"
-    
-    # 캐시 확인
-    cached = await cache_service.get(cache_key)
-    if cached:
-        return cached
-    
-    # 데이터 조회
-    data = await csv_service.get_current_data(
-        columns=columns,
-        filter=filter,
-        limit=limit,
-        offset=offset
+    cache_key = csv_current_key(
+        csv_service.get_version(), columns, filter, limit, offset, cursor, with_total
     )
     
-    # 캐시 저장 (1시간)
-    await cache_service.set(cache_key, data, ttl=3600)
+    async def produce():
+        return await csv_service.get_current_data(
+            columns=columns,
+            filter=filter,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            with_total=with_total
+        )
     
-    return data
+    # 캐시 확인 후 없으면 조회 (동시 요청은 한 번만 계산, 키에 데이터셋 버전이 포함되어 있어 길게 유지)
+    # 잘못된 필터 표현식은 400
+    try:
+        return await cache_service.get_or_compute(cache_key, produce, ttl=settings.CACHE_TTL_CSV)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/processed", response_model=CSVDataResponse)
 async def get_processed_csv(
@@ -54,20 +60,58 @@ async def get_processed_csv(
 ):
     """전처리된 CSV 데이터 조회"""
     # 캐시 키 생성
-    cache_key = f"csv:processed:{hashlib.md5(f'{group_by}:{aggregate}:{date_range}'.encode()).hexdigest()}"
+    cache_key = csv_processed_key(csv_service.get_version(), group_by, aggregate, date_range)
     
-    # 캐시 확인
-    cached = await cache_service.get(cache_key)
-    if cached:
-        return cached
+    async def produce():
+        return await csv_service.get_processed_data(
+            group_by=group_by,
+            aggregate=aggregate,
+            date_range=date_range
+        )
     
-    # 복잡한 집계 쿼리 처리
-    result = await csv_service.get_processed_data(
-        group_by=group_by,
-        aggregate=aggregate,
-        date_range=date_range
-    )
+    # 복잡한 집계 쿼리 처리 (동시 요청은 한 번만 계산)
+    try:
+        return await cache_service.get_or_compute(cache_key, produce, ttl=settings.CACHE_TTL_CSV)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/export")
+async def export_csv(
+    request: Request,
+    format: str = Query("ndjson", description="ndjson | csv | json"),
+    columns: Optional[List[str]] = Query(None),
+    filter: Optional[str] = Query(None),
+    date_range: Optional[str] = Query(None),
+    group_by: Optional[str] = Query(None),
+    aggregate: Optional[str] = Query(None)
+):
+    """
+    CSV 데이터 스트리밍 내보내기
+    - 전체 결과를 메모리에 만들지 않고 배치 단위로 전송
+    - Accept-Encoding 에 따라 zstd/gzip 압축
+    """
+    try:
+        chunks = await csv_service.export_data(
+            fmt=format,
+            columns=columns,
+            filter=filter,
+            group_by=group_by,
+            aggregate=aggregate,
+            date_range=date_range
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    await cache_service.set(cache_key, result, ttl=3600)
+    encoding = csv_export.negotiate_encoding(request.headers.get("accept-encoding"))
+    headers = {
+        "Content-Disposition": f'attachment; filename="export.{format}"',
+        "Vary": "Accept-Encoding"
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
     
-    return result
\ No newline at end of file
+    return StreamingResponse(
+        csv_export.compress(chunks, encoding),
+        media_type=csv_export.EXPORT_FORMATS[format],
+        headers=headers
+    )
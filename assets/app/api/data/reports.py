@@ -9,6 +9,7 @@ from datetime import datetime
 
 from app.core.config import settings
 from app.api.deps import get_cache_service, get_report_service
+from app.cache.keys import report_tag
 from app.services.cache_service import CacheService
 from app.services.report_service import ReportService
 from app.schemas.report import ReportDetailResponse, ReportListResponse
@@ -30,22 +31,15 @@ async def get_reports(
     """
     cache_key = f"reports:list:{year}:{limit}:{offset}"
     
-    # 캐시 확인
-    cached = await cache_service.get(cache_key)
-    if cached:
-        return cached
+    async def produce():
+        return await report_service.get_report_list(
+            limit=limit,
+            offset=offset,
+            year=year
+        )
     
-    # 리포트 목록 조회
-    reports = await report_service.get_report_list(
-        limit=limit,
-        offset=offset,
-        year=year
-    )
-    
-    # 캐시 저장 (12시간)
-    await cache_service.set(cache_key, reports, ttl=43200)
-    
-    return reports
+    # 캐시 확인 후 없으면 리포트 목록 조회 (동시 요청은 한 번만 조회, 12시간)
+    return await cache_service.get_or_compute(cache_key, produce, ttl=43200, tags=[report_tag()])
 
 @router.get("/{report_id}", response_model=ReportDetailResponse)
 async def get_report(
@@ -60,21 +54,16 @@ async def get_report(
     """
     cache_key = f"reports:detail:{report_id}:{include_raw}"
     
-    # 캐시 확인
-    cached = await cache_service.get(cache_key)
-    if cached:
-        return cached
+    async def produce():
+        return await report_service.get_report_detail(
+            report_id=report_id,
+            include_raw=include_raw
+        )
     
-    # 리포트 조회
-    report = await report_service.get_report_detail(
-        report_id=report_id,
-        include_raw=include_raw
-    )
+    # 캐시 확인 후 없으면 리포트 조회 (없는 리포트는 저장하지 않음, 24시간)
+    report = await cache_service.get_or_compute(cache_key, produce, ttl=86400, tags=[report_tag()])
     
     if not report:
         raise HTTPException(status_code=404, detail="리포트를 찾을 수 없습니다")
     
-    # 캐시 저장 (24시간)
-    await cache_service.set(cache_key, report, ttl=86400)
-    
     return report
\ No newline at end of file
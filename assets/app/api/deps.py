@@ -12,11 +12,13 @@ from app.services.cache_service import CacheService
 from app.services.report_service import ReportService
 from app.services.auth_service import AuthService
 from app.services.csv_service import CSVService
+from app.services.proxy_service import ProxyService
 
 # Redis 인스턴스
 redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-cache_service = CacheService(redis_client)
+cache_service = CacheService(settings.REDIS_URL)
 auth_service = AuthService(redis_client)
+proxy_service = ProxyService()
 
 # 인증 의존성
 async def get_current_session(
@@ -57,6 +59,10 @@ async def require_admin(
 def get_cache_service() -> CacheService:
     return cache_service
 
+def get_proxy_service() -> ProxyService:
+    """외부 API 프록시 서비스 의존성 (앱 수명 동안 공유)"""
+    return proxy_service
+
 def get_report_service() -> ReportService:
     """리포트 서비스 의존성"""
     return ReportService(cache_service)
@@ -3,19 +3,18 @@
 # backend/app/api/proxy/external.py
 from fastapi import APIRouter, Query, Depends, HTTPException
 from typing import Optional, Dict, Any
-import hashlib
 import logging
 
-from app.api.deps import get_cache_service, RateLimiter, require_admin
+from app.api.deps import get_cache_service, get_proxy_service, RateLimiter, require_admin
+from app.cache.keys import proxy_data_key, proxy_source_tag
 from app.services.cache_service import CacheService
-from app.services.proxy_service import ProxyService
 from app.schemas.proxy import ProxyResponse
 
 # 로깅 설정
 logger= logging.getLogger(__name__)
 
 router = APIRouter(prefix="/proxy", tags=["proxy"])
-proxy_service = ProxyService()
+proxy_service = get_proxy_service()
 rate_limiter = RateLimiter(calls=100, period=60)
 
 @router.get("/external-data", response_model=ProxyResponse)
@@ -30,49 +29,42 @@ async def get_external_data(
     """
     외부 API 데이터 프록시
     - 캐시 확인
-    - 외부 API 호출
+    - 외부 API 호출 (같은 키는 워커 전체에서 한 번만)
     - 결과 캐싱
     """
     # 캐시 키 생성
-    filter_str=filter or ""
-    cache_key_raw=f"{filter_str}:{limit}"
-    cache_key= f"proxy:{source}:{hashlib.md5(cache_key_raw.encode()).hexdigest()}"
+    cache_key = proxy_data_key(source, filter, limit)
+    # 이 요청에서 외부 API 를 직접 호출했는지 (cache_hit 표시용)
+    fetched = []
     
-    # 캐시 확인
-    if use_cache:
-        cached_data = await cache_service.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for {cache_key}")
-            return ProxyResponse(
-                success=True,
-                data=cached_data.get("data",[]),
-                metadata={
-                    **cached_data.get("metadata", {}),
-                    "cache_hit": True,
-                    "source": source,
-                }
-            )
-    
-    # 외부 API 호출
-    try:
+    async def fetch():
         logger.info(f"Fetching external data from source:{source}")
-        result = await proxy_service.fetch_external_data(
+        fetched.append(True)
+        return await proxy_service.fetch_external_data(
             source=source,
             filters=filter,
             limit=limit
         )
-        
-        # 캐시 저장 (5분)
+    
+    # 캐시 확인 후 없으면 외부 API 호출 (동시 요청은 한 번만 호출, 5분)
+    try:
         if use_cache:
-            logger.info(f"Caching result for {cache_key}")
-            await cache_service.set(cache_key, result, ttl=300)
+            result = await cache_service.get_or_compute(
+                cache_key, fetch, ttl=300, tags=[proxy_source_tag(source)]
+            )
+        else:
+            result = await fetch()
+        
+        cache_hit = not fetched
+        if cache_hit:
+            logger.info(f"Cache hit for {cache_key}")
         
         return ProxyResponse(
             success=True,
             data=result.get("data", []),
             metadata={
                 **result.get("metadata", {}),
-                "cache_hit": False,
+                "cache_hit": cache_hit,
                 "source": source
             }
         )
@@ -88,22 +80,22 @@ async def refresh_external_data(
 ):
     """외부 데이터 강제 갱신 (관리자 전용)"""
     try:
-        # 해당 소스의 모든 캐시 삭제
-        pattern = f"proxy:{source}:*"
-        deleted_count = await cache_service.delete_pattern(pattern)
+        # 해당 소스의 모든 캐시 삭제 (소스 태그에 등록된 키만)
+        deleted_count = await cache_service.invalidate_tags(proxy_source_tag(source))
         logger.info(f"Deleted {deleted_count} cache entries for source: {source}")
         
         # 백그라운드에서 데이터 새로고침 (선택적)
         try:
-            from app.tasks import refresh_external_data_task
-            task = refresh_external_data_task.delay(source)
-            logger.info(f"Background refresh task started: {task.id}")
+            from app.tasks.celery_app import dispatch
+            from app.tasks.data_tasks import refresh_external_data_task
+            task_id = dispatch(refresh_external_data_task, source)
+            logger.info(f"Background refresh task started: {task_id}")
             
             return {
                 "message": "데이터 갱신이 시작되었습니다",
                 "source": source,
                 "deleted_cache_entries": deleted_count,
-                "task_id": task.id
+                "task_id": task_id
             }
         except ImportError:
             # Celery가 없는 경우 동기적으로 처리
@@ -121,4 +113,11 @@ async def refresh_external_data(
             
     except Exception as e:
         logger.error(f"Refresh error for source {source}: {e}")
-        raise HTTPException(status_code=500, detail=f"갱신 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"갱신 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/pool-stats")
+async def get_pool_stats(
+    session: dict = Depends(require_admin)
+):
+    """외부 API 커넥션 풀 통계 (관리자 전용)"""
+    return proxy_service.get_pool_stats()
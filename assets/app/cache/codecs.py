@@ -0,0 +1,199 @@
+# backend/app/cache/codecs.py
+"""
+캐시 값 직렬화/압축
+
+저장 형식
+    MAGIC(1) | 코덱 바이트(1: 상위 4비트 직렬화 방식, 하위 4비트 압축 방식) | 본문
+    - MAGIC 으로 시작하지 않는 값은 이전 방식(json 문자열)으로 읽음
+    - 코덱 정보가 값마다 들어 있으므로 설정을 바꿔도 캐시를 비울 필요 없음
+
+직렬화: msgpack > orjson > json (설치된 것 중 선택)
+    - msgpack 은 datetime/date 를 그대로 복원, json 계열은 ISO 문자열로 복원
+압축: 본문이 CACHE_COMPRESS_MIN_BYTES 이상일 때 zstd > lz4 > zlib
+"""
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+MAGIC = 0xCA
+
+SERIALIZERS = {"json": 1, "orjson": 2, "msgpack": 3}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+
+# msgpack 확장 타입
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+
+
+class CodecError(ValueError):
+    """저장된 값을 읽을 수 없음 (지원하지 않거나 설치되지 않은 코덱)"""
+
+
+class CacheCodec:
+    """
+    캐시 값 인코더/디코더
+    - serializer/compression: 이름 또는 "auto" (설치된 것 중 가장 빠른 것)
+    """
+    def __init__(self, serializer: str = "auto", compression: str = "auto", compress_min_bytes: int = 4096):
+        self.serializer = _pick_serializer(serializer)
+        self.compression = _pick_compression(compression)
+        self.compress_min_bytes = compress_min_bytes
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if self.compression == "zstd" else None
+
+    def encode(self, value: Any) -> bytes:
+        return self.encode_sized(value)[0]
+
+    def decode(self, raw: Any) -> Any:
+        return self.decode_sized(raw)[0]
+
+    def encode_sized(self, value: Any) -> Tuple[bytes, int]:
+        """(저장할 바이트, 압축 전 본문 크기)"""
+        body = _SERIALIZE[self.serializer](value)
+        size = len(body)
+        compression = self.compression if len(body) >= self.compress_min_bytes else "none"
+        if compression == "zstd":
+            body = self._zstd_compressor.compress(body)
+        elif compression == "lz4":
+            body = lz4.frame.compress(body)
+        elif compression == "zlib":
+            body = zlib.compress(body, 6)
+        header = bytes((MAGIC, SERIALIZERS[self.serializer] << 4 | COMPRESSIONS[compression]))
+        return header + body, size
+
+    def decode_sized(self, raw: Any) -> Tuple[Any, int]:
+        """(값, 압축 해제한 본문 크기) - 메모리 캐시 용량 계산용"""
+        if isinstance(raw, str):
+            raw = raw.encode('utf-8')
+        if not raw or raw[0] != MAGIC:
+            # 이전 방식 (json 문자열)
+            return json.loads(raw), len(raw)
+        if len(raw) < 2:
+            raise CodecError("코덱 헤더가 잘렸습니다")
+
+        serializer, compression = _unpack_header(raw[1])
+        body = memoryview(raw)[2:]
+        if compression == "zstd":
+            body = zstandard.ZstdDecompressor().decompress(body)
+        elif compression == "lz4":
+            body = lz4.frame.decompress(body)
+        elif compression == "zlib":
+            body = zlib.decompress(body)
+        body = bytes(body)
+        return _DESERIALIZE[serializer](body), len(body)
+
+
+def _unpack_header(byte: int) -> Tuple[str, str]:
+    serializer_id, compression_id = byte >> 4, byte & 0x0F
+    serializer = next((name for name, value in SERIALIZERS.items() if value == serializer_id), None)
+    compression = next((name for name, value in COMPRESSIONS.items() if value == compression_id), None)
+    if serializer is None or compression is None:
+        raise CodecError(f"알 수 없는 코덱입니다: {byte:#04x}")
+    if not _available(serializer) or not _available(compression):
+        raise CodecError(f"설치되지 않은 코덱입니다: {serializer}/{compression}")
+    return serializer, compression
+
+
+def _available(name: str) -> bool:
+    return {
+        "msgpack": MSGPACK_AVAILABLE,
+        "orjson": ORJSON_AVAILABLE,
+        "zstd": ZSTD_AVAILABLE,
+        "lz4": LZ4_AVAILABLE
+    }.get(name, True)
+
+
+def _pick_serializer(name: str) -> str:
+    if name == "auto":
+        return "msgpack" if MSGPACK_AVAILABLE else "orjson" if ORJSON_AVAILABLE else "json"
+    if name not in SERIALIZERS:
+        raise ValueError(f"지원하지 않는 직렬화 방식입니다: {name} (사용 가능: {', '.join(SERIALIZERS)})")
+    if not _available(name):
+        raise ValueError(f"{name} 패키지가 설치되어 있지 않습니다")
+    return name
+
+
+def _pick_compression(name: str) -> str:
+    if name == "auto":
+        return "zstd" if ZSTD_AVAILABLE else "lz4" if LZ4_AVAILABLE else "zlib"
+    if name not in COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {name} (사용 가능: {', '.join(COMPRESSIONS)})")
+    if not _available(name):
+        raise ValueError(f"{name} 패키지가 설치되어 있지 않습니다")
+    return name
+
+
+def _to_builtin(value: Any) -> Any:
+    """기본 타입이 아닌 값 변환 (Pydantic 모델, numpy 값 등)"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "dict"):
+        return value.dict()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    return _to_builtin(value)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return _to_builtin(value)
+
+
+_SERIALIZE: Dict[str, Callable[[Any], bytes]] = {
+    "json": lambda value: json.dumps(value, default=_json_default, ensure_ascii=False).encode('utf-8'),
+}
+_DESERIALIZE: Dict[str, Callable[[bytes], Any]] = {
+    "json": json.loads,
+}
+if ORJSON_AVAILABLE:
+    _SERIALIZE["orjson"] = lambda value: orjson.dumps(
+        value, default=_to_builtin, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    _DESERIALIZE["orjson"] = orjson.loads
+if MSGPACK_AVAILABLE:
+    _SERIALIZE["msgpack"] = lambda value: msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+    _DESERIALIZE["msgpack"] = lambda body: msgpack.unpackb(body, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+
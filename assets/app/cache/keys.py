@@ -0,0 +1,72 @@
+"""
+캐시 키 생성 규칙
+"""
+# backend/app/cache/keys.py
+import hashlib
+from typing import List, Optional
+
+
+def proxy_data_key(source: str, filter: Optional[str] = None, limit: int = 1000) -> str:
+    """외부 데이터 프록시 결과 캐시 키"""
+    raw = f"{filter or ''}:{limit}"
+    return f"proxy:{source}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def proxy_source_tag(source: str) -> str:
+    """외부 데이터 소스별 캐시 태그"""
+    return f"proxy:{source}"
+
+
+def report_pattern() -> str:
+    """리포트 관련 캐시 전체 패턴"""
+    return "reports:*"
+
+
+def report_tag() -> str:
+    """리포트 관련 캐시 태그"""
+    return "reports"
+
+
+def csv_current_key(
+    version: str,
+    columns: Optional[List[str]],
+    filter: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str] = None,
+    with_total: bool = False
+) -> str:
+    """CSV 조회 캐시 키 (데이터셋 버전 포함 - 새 파일이 올라오면 이전 키는 더 이상 조회되지 않음)"""
+    raw = f"{columns}:{filter}:{limit}:{offset}:{cursor}:{with_total}"
+    return f"csv:{version}:current:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def csv_processed_key(
+    version: str,
+    group_by: Optional[str],
+    aggregate: Optional[str],
+    date_range: Optional[str]
+) -> str:
+    """CSV 집계 조회 캐시 키 (데이터셋 버전 포함)"""
+    raw = f"{group_by}:{aggregate}:{date_range}"
+    return f"csv:{version}:processed:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def csv_pattern(version: Optional[str] = None) -> str:
+    """CSV 캐시 패턴 (버전을 주면 해당 버전만)"""
+    return f"csv:{version}:*" if version else "csv:*"
+
+
+def tag_set_key(tag: str) -> str:
+    """태그에 속한 캐시 키 목록을 담는 Redis 집합 키"""
+    return f"tag:{tag}"
+
+
+def lease_key(key: str) -> str:
+    """캐시 값을 계산 중인 워커를 표시하는 임대(lease) 키"""
+    return f"lease:{key}"
+
+
+def compute_time_key(key: str) -> str:
+    """캐시 값을 계산하는 데 걸린 시간 (조기 갱신 확률 계산용)"""
+    return f"xfetch:{key}"
@@ -0,0 +1,198 @@
+# backend/app/cache/memory_cache.py
+import asyncio
+import fnmatch
+import heapq
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "tags")
+
+    def __init__(self, value: Any, expires_at: float, size: int, tags: Tuple[str, ...] = ()):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.tags = tags
+
+
+class MemoryCache:
+    """
+    바이트 예산 기반 LRU 메모리 캐시
+    - get/set O(1) (OrderedDict 순서 = 최근 사용 순)
+    - 용량은 항목 수가 아니라 값의 직렬화 크기 합으로 제한
+    - 만료 항목은 조회 시 확인하고, 만료 시각 힙으로 백그라운드에서 정리 (쓰기 시 정렬 없음)
+    """
+    def __init__(self, max_bytes: int, max_entry_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        # 한 항목이 예산 대부분을 차지하지 않도록 제한
+        self.max_entry_bytes = max_entry_bytes or max(max_bytes // 4, 1)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._sweeper: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.peek(key) is not None
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (최근 사용으로 표시)"""
+        value = self.peek(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: str) -> Optional[Any]:
+        """사용 순서/통계를 바꾸지 않고 조회 (만료 항목은 제거)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return entry.value
+
+    def ttl(self, key: str) -> Optional[float]:
+        """남은 유효 시간(초), 없으면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry.expires_at - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        size: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> bool:
+        """값 저장 (한 항목 상한을 넘으면 저장하지 않고 False)"""
+        size = estimate_size(value) if size is None else size
+        if size > self.max_entry_bytes:
+            self._remove(key)
+            return False
+
+        expires_at = time.monotonic() + ttl
+        self._remove(key)
+        self._entries[key] = _Entry(value, expires_at, size, tuple(tags))
+        self._bytes += size
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        self._compact_heap()
+
+        # 가장 오래 사용하지 않은 항목부터 제거
+        while self._bytes > self.max_bytes and self._entries:
+            old_key = next(iter(self._entries))
+            self._remove(old_key)
+            self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        return self._remove(key)
+
+    def delete_matching(self, pattern: str) -> int:
+        """glob 패턴에 맞는 키 삭제"""
+        keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def delete_tagged(self, tag: str) -> int:
+        """태그가 붙은 키 삭제"""
+        keys = [key for key, entry in self._entries.items() if tag in entry.tags]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+
+    def sweep(self) -> int:
+        """만료 시각이 지난 항목 정리 (힙 앞쪽만 확인)"""
+        now = time.monotonic()
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # 다시 저장된 키는 힙에 예전 만료 시각이 남아 있으므로 현재 값과 비교
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+        self.expirations += removed
+        self._compact_heap()
+        return removed
+
+    def start_sweeper(self, interval: float) -> None:
+        """백그라운드 만료 정리 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop(interval))
+
+    async def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / requests, 4) if requests else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep()
+
+    def _compact_heap(self) -> None:
+        """덮어쓰기/삭제로 힙에 남은 오래된 항목이 많으면 다시 구성 (sweep 이 돌지 않아도 힙 크기 유지)"""
+        if len(self._expiry_heap) > 2 * len(self._entries) + 1024:
+            self._expiry_heap = [(entry.expires_at, key) for key, entry in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+
+def estimate_size(value: Any) -> int:
+    """값의 대략적인 크기 (직렬화했을 때의 바이트 수)"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    return len(json.dumps(value, default=str, ensure_ascii=False).encode('utf-8'))
@@ -1,5 +1,5 @@
 # backend/app/core/config.py
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 from functools import lru_cache
@@ -49,10 +49,12 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "storage/uploads"
     REPORTS_DIR: str = "storage/reports"
     LOG_DIR: str = "storage/logs"
+    MATERIALIZED_VIEWS_PATH: str = "storage/materialized_views.json"  # 미리 계산할 집계 조합 정의
     
     # 파일 업로드 제한
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100MB
     ALLOWED_EXTENSIONS: List[str] = [".csv", ".pdf"]
+    CSV_UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 업로드 스트리밍 청크 (1MB)
     
     # 외부 API 설정
     OPENAI_API_KEY: str = Field(..., env="OPENAI_API_KEY")
@@ -65,6 +67,16 @@ class Settings(BaseSettings):
     TOURISM_API_BASE_URL: str = "https://api.visitkorea.or.kr"
     TOURISM_API_KEY: Optional[str] = None
     
+    # 외부 API 프록시 설정 (앱 수명 동안 공유하는 커넥션 풀)
+    PROXY_SOURCE_BASE_URLS: Dict[str, str] = Field(
+        default_factory=lambda: {"weather": "https://api.openweathermap.org/data/2.5"}
+    )
+    PROXY_TIMEOUT: float = 30.0
+    PROXY_MAX_CONNECTIONS: int = 100
+    PROXY_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    PROXY_KEEPALIVE_EXPIRY: float = 30.0
+    PROXY_WARMUP: bool = False  # 시작 시 소스별 연결 미리 열기
+    
     # 보안 설정
     USE_HTTPS: bool = True
     SESSION_EXPIRE_SECONDS: int = 1800  # 30분
@@ -80,9 +92,33 @@ class Settings(BaseSettings):
     # 캐시 TTL 설정 (초)
     CACHE_TTL_DEFAULT: int = 300  # 5분
     CACHE_TTL_REPORT: int = 43200  # 12시간
-    CACHE_TTL_CSV: int = 3600  # 1시간
+    CACHE_TTL_CSV: int = 86400  # 24시간 (키에 데이터셋 버전 포함)
     CACHE_TTL_EXTERNAL_API: int = 300  # 5분
     
+    # 메모리 캐시 설정 (Redis 미사용 시)
+    CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024  # 값 직렬화 크기 합 기준 64MB
+    CACHE_MEMORY_SWEEP_INTERVAL: float = 60.0  # 만료 항목 정리 주기 (초)
+    
+    # 워커별 L1 캐시 설정 (Redis 앞단)
+    CACHE_L1_MAX_BYTES: int = 32 * 1024 * 1024
+    CACHE_L1_TTL: int = 30  # 무효화 메시지를 놓쳐도 이 시간 뒤에는 Redis 값으로 갱신
+    CACHE_L1_PREFIXES: List[str] = ["csv:", "reports:", "proxy:"]
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+    
+    # 태그/패턴 무효화 설정
+    CACHE_TAG_TTL: int = 86400  # 태그 집합 최소 유지 시간 (가장 긴 캐시 TTL 이상)
+    CACHE_DELETE_BATCH_SIZE: int = 500  # SCAN/SSCAN 한 번에 가져와 삭제하는 키 수
+    
+    # 캐시 값 인코딩 설정 (auto: 설치된 것 중 msgpack > orjson > json, zstd > lz4 > zlib)
+    CACHE_SERIALIZER: str = "auto"
+    CACHE_COMPRESSION: str = "auto"
+    CACHE_COMPRESS_MIN_BYTES: int = 4096  # 이 크기 이상일 때만 압축
+    CACHE_CODEC_PREFIXES: List[str] = ["csv:", "reports:", "proxy:"]
+    
+    # 캐시 재계산 설정 (get_or_compute)
+    CACHE_LEASE_TIMEOUT: float = 30.0  # 다른 워커 계산을 기다리는 최대 시간 (임대 유지 시간)
+    CACHE_XFETCH_BETA: float = 1.0  # 클수록 만료 전에 일찍 다시 계산
+    
     # 로깅 설정
     LOG_LEVEL: str = "inf0"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -1,16 +1,31 @@
 # backend/app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.middleware.session import SessionMiddleware
 from app.api.api import api_router
+from app.api.deps import cache_service, proxy_service
 from app.core.config import settings
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 공유 리소스 관리"""
+    # 외부 API 커넥션 풀 생성 (옵션: 미리 연결 열기)
+    await proxy_service.start(warm_up=settings.PROXY_WARMUP)
+    # 캐시 연결 + L1 무효화 채널 구독
+    await cache_service.connect()
+    yield
+    await cache_service.close()
+    await proxy_service.close()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title=settings.APP_NAME,
         version=settings.VERSION,
-        openapi_url=f"{settings.API_V1_STR}/openapi.json" if settings.DEBUG else None
+        openapi_url=f"{settings.API_V1_STR}/openapi.json" if settings.DEBUG else None,
+        lifespan=lifespan
     )
     
     # CORS 설정
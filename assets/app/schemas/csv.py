@@ -43,4 +43,11 @@ class AdminCSVDataRequest(BaseModel):
     success: bool = True
     message: str
     filename: Optional[str] = None
-    region: GyeongNamRegion = Field(..., description="지역명 (경상남도 시/군)")
\ No newline at end of file
+    region: GyeongNamRegion = Field(..., description="지역명 (경상남도 시/군)")
+
+class MaterializedViewRequest(BaseModel):
+    """업로드 시 미리 계산할 집계 조합"""
+    name: str = Field(..., description="뷰 이름 (예: region_monthly_visitors)")
+    group_by: str = Field(..., description="그룹 컬럼 (예: region,month)")
+    aggregate: Optional[str] = Field(None, description="집계 조건 (예: visitors:sum)")
+    date_range: Optional[str] = Field(None, description="날짜 범위 (예: 2024-01-01:2024-12-31)")
@@ -1,9 +1,17 @@
 # backend/app/services/cache_service.py
 import json
 import asyncio
-from typing import Any, Dict, Optional, List
-from datetime import datetime, timedelta
+import math
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Set, Tuple
+from app.cache.codecs import CacheCodec
+from app.cache.keys import compute_time_key, lease_key, tag_set_key
+from app.cache.memory_cache import MemoryCache
+from app.core.config import settings
 from app.utils.logger import logger
+from app.utils.singleflight import SingleFlight
 
 try:
     import redis.asyncio as redis
@@ -14,12 +22,40 @@ except ImportError:
 
 
 class CacheService:
-    """Redis 기반 캐시 서비스"""
+    """
+    Redis 기반 캐시 서비스
+    - Redis 사용 시 워커별 L1(짧은 TTL 메모리 캐시)을 앞에 두고, 삭제/갱신은 pub/sub 로 다른 워커의 L1 에도 전파
+    - L1 은 디코딩된 객체를 그대로 돌려주므로 호출하는 쪽에서 반환값을 수정하면 안 됨
+    - get_or_compute: 만료 시 키마다 한 번만 계산 (워커 내 SingleFlight + 워커 간 Redis 임대)
+    """
+    # 임대를 가진 경우에만 삭제 (다른 워커가 다시 얻은 임대는 유지)
+    _RELEASE_LEASE_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
     def __init__(self, redis_url: Optional[str] = None):
         self.redis_url = redis_url or "redis://localhost:6379"
         self.redis_client: Optional[redis.Redis] = None
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        # Redis 를 쓸 수 없을 때 사용하는 메모리 캐시 (바이트 예산 LRU)
+        self.memory_cache = MemoryCache(settings.CACHE_MEMORY_MAX_BYTES)
+        # Redis 앞단의 워커별 L1
+        self.local_cache = MemoryCache(settings.CACHE_L1_MAX_BYTES)
         self._use_redis = REDIS_AVAILABLE and redis_url
+        # Redis 저장 값 인코딩 (헤더로 코덱 구분, 이전 json 값도 읽음)
+        self.codec = CacheCodec(
+            settings.CACHE_SERIALIZER,
+            settings.CACHE_COMPRESSION,
+            settings.CACHE_COMPRESS_MIN_BYTES
+        )
+        # 자신이 보낸 무효화 메시지를 구분하기 위한 ID
+        self._instance_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+        # 같은 워커에서 같은 키 계산을 하나로 합침
+        self._flight = SingleFlight()
+        self._refresh_tasks: Set[asyncio.Task] = set()
         
     async def connect(self):
         """캐시 연결 초기화"""
@@ -27,12 +63,15 @@ class CacheService:
             try:
                 self.redis_client = redis.from_url(
                     self.redis_url,
-                    decode_responses=True,
+                    # 값은 바이너리(코덱 헤더 + 본문)로 저장
+                    decode_responses=False,
                     retry_on_timeout=True
                 )
                 # 연결 테스트
                 await self.redis_client.ping()
                 logger.info("Connected to Redis cache")
+                self._listener = asyncio.create_task(self._listen_invalidations())
+                self.local_cache.start_sweeper(settings.CACHE_MEMORY_SWEEP_INTERVAL)
             except Exception as e:
                 logger.warning(f"Redis connection failed: {e}, using memory cache")
                 self._use_redis = False
@@ -40,49 +79,52 @@ class CacheService:
         
         if not self._use_redis:
             logger.info("Using in-memory cache")
+            self.memory_cache.start_sweeper(settings.CACHE_MEMORY_SWEEP_INTERVAL)
     
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 가져오기"""
         try:
             if self._use_redis and self.redis_client:
-                value = await self.redis_client.get(key)
-                if value:
-                    return json.loads(value)
+                if self._use_local(key):
+                    value = self.local_cache.get(key)
+                    if value is not None:
+                        return value
+                raw = await self.redis_client.get(key)
+                if raw:
+                    value, size = self.codec.decode_sized(raw)
+                    await self._set_local(key, value, size)
+                    return value
             else:
-                # 메모리 캐시 사용
-                if key in self.memory_cache:
-                    entry = self.memory_cache[key]
-                    # TTL 확인
-                    if entry["expires_at"] > datetime.utcnow():
-                        return entry["value"]
-                    else:
-                        # 만료된 항목 삭제
-                        del self.memory_cache[key]
+                # 메모리 캐시 사용 (만료 항목은 조회 시 제거)
+                return self.memory_cache.get(key)
                         
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
         
         return None
     
-    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
-        """캐시에 값 저장"""
+    async def set(self, key: str, value: Any, ttl: int = 3600, tags: Optional[List[str]] = None) -> bool:
+        """
+        캐시에 값 저장
+        - tags: 함께 무효화할 묶음 이름 (invalidate_tags 로 한 번에 삭제)
+        """
         try:
             if self._use_redis and self.redis_client:
-                await self.redis_client.setex(
-                    key, 
-                    ttl, 
-                    json.dumps(value, default=str)
-                )
+                raw, size = self._encode(key, value)
+                # 저장과 다른 워커 L1 무효화를 한 번의 왕복으로 전송
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.setex(key, ttl, raw)
+                for tag in tags or []:
+                    # 태그 집합은 구성원 중 가장 긴 TTL 이상 유지
+                    pipe.sadd(tag_set_key(tag), key)
+                    pipe.expire(tag_set_key(tag), max(ttl, settings.CACHE_TAG_TTL))
+                if self._use_local(key):
+                    pipe.publish(settings.CACHE_INVALIDATION_CHANNEL, self._invalidation_message(keys=[key]))
+                await pipe.execute()
+                await self._set_local(key, value, size, ttl)
             else:
-                # 메모리 캐시 사용
-                self.memory_cache[key] = {
-                    "value": value,
-                    "expires_at": datetime.now() + timedelta(seconds=ttl)
-                }
-                
-                # 메모리 캐시 크기 제한 (1000개)
-                if len(self.memory_cache) > 1000:
-                    await self._cleanup_memory_cache()
+                # 메모리 캐시 사용 (예산을 넘으면 오래 사용하지 않은 항목부터 제거)
+                return self.memory_cache.set(key, value, ttl, tags=tags or ())
                     
             return True
             
@@ -90,42 +132,105 @@ class CacheService:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    async def get_or_compute(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: int = 3600,
+        tags: Optional[List[str]] = None,
+        beta: Optional[float] = None
+    ) -> Any:
+        """
+        캐시 조회, 없으면 producer 결과를 저장해서 반환
+        - 만료된 키는 워커 전체에서 한 번만 계산하고, 나머지 요청은 그 결과를 기다림
+        - 만료가 가까워지면 XFetch 방식으로 확률적으로 미리 다시 계산 (계산이 오래 걸린 키일수록 일찍)
+          미리 계산하는 동안 요청에는 기존 값을 바로 반환
+        - producer 가 None 을 반환하면 저장하지 않음, 예외는 그대로 전달
+        """
+        value, remaining, compute_time = await self._lookup(key)
+        if value is not None:
+            if self._should_refresh_early(remaining, compute_time, beta):
+                self._schedule_refresh(key, producer, ttl, tags)
+            return value
+
+        return await self._flight.do(
+            ("compute", key),
+            lambda: self._compute(key, producer, ttl, tags, refresh=False)
+        )
+    
     async def delete(self, key: str) -> bool:
         """캐시에서 키 삭제"""
         try:
             if self._use_redis and self.redis_client:
+                self.local_cache.delete(key)
                 result = await self.redis_client.delete(key)
+                await self._publish_invalidation(keys=[key])
                 return result > 0
             else:
-                if key in self.memory_cache:
-                    del self.memory_cache[key]
-                    return True
+                return self.memory_cache.delete(key)
                     
         except Exception as e:
             logger.error(f"Cache delete error for key {key}: {e}")
             
         return False
     
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        태그가 붙은 키 모두 삭제 (태그에 등록된 키 수에 비례, 전체 키 탐색 없음)
+        - 태그 집합을 먼저 다른 이름으로 옮겨서, 삭제 중에 새로 등록되는 키는 다음 무효화 대상으로 남김
+        """
+        deleted_count = 0
+        
+        try:
+            if self._use_redis and self.redis_client:
+                for tag in tags:
+                    pending_key = f"{tag_set_key(tag)}:invalidating:{uuid.uuid4().hex}"
+                    try:
+                        await self.redis_client.rename(tag_set_key(tag), pending_key)
+                    except redis.ResponseError:
+                        # 등록된 키가 없음
+                        continue
+                    
+                    batch: List[str] = []
+                    async for key in self.redis_client.sscan_iter(pending_key, count=settings.CACHE_DELETE_BATCH_SIZE):
+                        batch.append(key.decode())
+                        if len(batch) >= settings.CACHE_DELETE_BATCH_SIZE:
+                            deleted_count += await self._delete_keys(batch)
+                            batch = []
+                    if batch:
+                        deleted_count += await self._delete_keys(batch)
+                    await self.redis_client.unlink(pending_key)
+            else:
+                for tag in tags:
+                    deleted_count += self.memory_cache.delete_tagged(tag)
+                    
+        except Exception as e:
+            logger.error(f"Cache invalidate tags error for {tags}: {e}")
+            
+        return deleted_count
+    
     async def delete_pattern(self, pattern: str) -> int:
-        """패턴에 매칭되는 모든 키 삭제"""
+        """
+        패턴에 매칭되는 모든 키 삭제
+        - KEYS 대신 SCAN 으로 나눠서 찾으므로 Redis 를 막지 않지만 전체 키를 훑음 (자주 쓰는 묶음은 태그 사용)
+        """
         deleted_count = 0
         
         try:
             if self._use_redis and self.redis_client:
-                keys = await self.redis_client.keys(pattern)
-                if keys:
-                    deleted_count = await self.redis_client.delete(*keys)
+                self.local_cache.delete_matching(pattern)
+                batch: List[str] = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=settings.CACHE_DELETE_BATCH_SIZE):
+                    batch.append(key.decode())
+                    if len(batch) >= settings.CACHE_DELETE_BATCH_SIZE:
+                        deleted_count += await self.redis_client.unlink(*batch)
+                        batch = []
+                if batch:
+                    deleted_count += await self.redis_client.unlink(*batch)
+                await self._publish_invalidation(pattern=pattern)
             else:
                 # 메모리 캐시에서 패턴 매칭 삭제
-                import fnmatch
-                keys_to_delete = [
-                    key for key in self.memory_cache.keys() 
-                    if fnmatch.fnmatch(key, pattern)
-                ]
-                
-                for key in keys_to_delete:
-                    del self.memory_cache[key]
-                    deleted_count += 1
+                deleted_count = self.memory_cache.delete_matching(pattern)
                     
         except Exception as e:
             logger.error(f"Cache delete pattern error for {pattern}: {e}")
@@ -141,46 +246,233 @@ class CacheService:
                     "type": "redis",
                     "total_keys": info.get("db0", {}).get("keys", 0),
                     "memory_usage": info.get("used_memory_human", "unknown"),
-                    "connected_clients": info.get("connected_clients", 0)
+                    "connected_clients": info.get("connected_clients", 0),
+                    "local": self.local_cache.stats()
                 }
             else:
                 # 만료된 항목 정리
-                await self._cleanup_memory_cache()
+                self.memory_cache.sweep()
+                stats = self.memory_cache.stats()
                 
                 return {
                     "type": "memory",
-                    "total_keys": len(self.memory_cache),
-                    "memory_usage": f"{len(str(self.memory_cache))} bytes (approximate)"
+                    "total_keys": stats["entries"],
+                    "memory_usage": f"{stats['bytes']} bytes (approximate)",
+                    **stats
                 }
                 
         except Exception as e:
             logger.error(f"Cache stats error: {e}")
             return {"error": str(e)}
     
-    async def _cleanup_memory_cache(self):
-        """메모리 캐시에서 만료된 항목 정리"""
-        now = datetime.utcnow()
-        expired_keys = [
-            key for key, entry in self.memory_cache.items()
-            if entry["expires_at"] <= now
-        ]
-        
-        for key in expired_keys:
-            del self.memory_cache[key]
-        
-        # 여전히 너무 많은 경우 가장 오래된 항목들 삭제
-        if len(self.memory_cache) > 800:
-            sorted_items = sorted(
-                self.memory_cache.items(),
-                key=lambda x: x[1]["expires_at"]
-            )
+    async def _delete_keys(self, keys: List[str]) -> int:
+        """키 목록 삭제 + 모든 워커 L1 에서 제거"""
+        for key in keys:
+            self.local_cache.delete(key)
+        deleted = await self.redis_client.unlink(*keys)
+        await self._publish_invalidation(keys=keys)
+        return deleted
+
+    def _encode(self, key: str, value: Any) -> Tuple[bytes, int]:
+        """
+        저장할 값 인코딩 (바이트, 압축 전 크기)
+        - 큰 응답(CACHE_CODEC_PREFIXES)만 바이너리 코덱 사용, 세션처럼 다른 클라이언트도 읽는 키는 json 유지
+        """
+        if key.startswith(tuple(settings.CACHE_CODEC_PREFIXES)):
+            return self.codec.encode_sized(value)
+        raw = json.dumps(value, default=str).encode('utf-8')
+        return raw, len(raw)
+
+    async def _lookup(self, key: str) -> Tuple[Optional[Any], Optional[float], Optional[float]]:
+        """(값, 남은 유효 시간(초), 이전 계산 시간(초))"""
+        try:
+            if self._use_redis and self.redis_client:
+                if self._use_local(key):
+                    value = self.local_cache.get(key)
+                    if value is not None:
+                        # L1 값은 짧게 유지되므로 조기 갱신 판단은 Redis 에서 읽을 때만
+                        return value, None, None
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.pttl(key)
+                pipe.get(compute_time_key(key))
+                raw, pttl, compute_time = await pipe.execute()
+                if not raw:
+                    return None, None, None
+                value, size = self.codec.decode_sized(raw)
+                remaining = pttl / 1000 if pttl and pttl > 0 else None
+                # L1 이 Redis 보다 오래 남지 않도록
+                await self._set_local(key, value, size, math.ceil(remaining) if remaining else None)
+                return value, remaining, float(compute_time) if compute_time else None
+            else:
+                value = self.memory_cache.get(key)
+                return value, self.memory_cache.ttl(key), self.memory_cache.peek(compute_time_key(key))
+                
+        except Exception as e:
+            logger.error(f"Cache lookup error for key {key}: {e}")
             
-            # 가장 오래된 200개 삭제
-            for key, _ in sorted_items[:200]:
-                del self.memory_cache[key]
-    
+        return None, None, None
+
+    @staticmethod
+    def _should_refresh_early(remaining: Optional[float], compute_time: Optional[float], beta: Optional[float]) -> bool:
+        """XFetch: 계산 시간 * beta * -ln(U) 가 남은 시간보다 크면 미리 갱신"""
+        if remaining is None or not compute_time:
+            return False
+        beta = settings.CACHE_XFETCH_BETA if beta is None else beta
+        return compute_time * beta * -math.log(1.0 - random.random()) >= remaining
+
+    def _schedule_refresh(self, key: str, producer: Callable[[], Awaitable[Any]], ttl: int, tags: Optional[List[str]]):
+        task = asyncio.ensure_future(self._flight.do(
+            ("refresh", key),
+            lambda: self._compute(key, producer, ttl, tags, refresh=True)
+        ))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task):
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Cache early refresh failed: {task.exception()}")
+
+    async def _compute(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: Optional[List[str]],
+        refresh: bool
+    ) -> Any:
+        """
+        임대를 얻은 경우에만 계산
+        - 다른 워커가 계산 중이면 값이 저장될 때까지 기다리고, 임대 시간이 지나도 없으면 직접 계산
+        - 조기 갱신(refresh)은 다른 워커가 이미 계산 중이면 바로 포기
+        """
+        token = await self._acquire_lease(key)
+        if token is None:
+            if refresh:
+                return None
+            deadline = time.monotonic() + settings.CACHE_LEASE_TIMEOUT
+            delay = 0.05
+            while token is None and time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                value, _, _ = await self._lookup(key)
+                if value is not None:
+                    return value
+                # 계산하던 워커가 실패해 임대가 풀렸으면 이어서 계산
+                token = await self._acquire_lease(key)
+            if token is None:
+                logger.warning(f"Cache lease wait timed out for {key}, computing without lease")
+
+        try:
+            started = time.monotonic()
+            value = await producer()
+            compute_time = time.monotonic() - started
+            if value is not None:
+                await self.set(key, value, ttl, tags)
+                await self._set_compute_time(key, compute_time, ttl)
+            return value
+        finally:
+            if token is not None:
+                await self._release_lease(key, token)
+
+    async def _acquire_lease(self, key: str) -> Optional[str]:
+        """워커 간 계산 임대 (Redis SET NX), 얻지 못하면 None"""
+        token = uuid.uuid4().hex
+        if not (self._use_redis and self.redis_client):
+            # 메모리 캐시는 워커 안에서만 쓰이므로 SingleFlight 로 충분
+            return token
+        try:
+            acquired = await self.redis_client.set(
+                lease_key(key), token, nx=True, px=int(settings.CACHE_LEASE_TIMEOUT * 1000)
+            )
+            return token if acquired else None
+        except Exception as e:
+            logger.warning(f"Cache lease error for {key}: {e}")
+            return token
+
+    async def _release_lease(self, key: str, token: str):
+        if not (self._use_redis and self.redis_client):
+            return
+        try:
+            await self.redis_client.eval(self._RELEASE_LEASE_SCRIPT, 1, lease_key(key), token)
+        except Exception as e:
+            logger.warning(f"Cache lease release error for {key}: {e}")
+
+    async def _set_compute_time(self, key: str, compute_time: float, ttl: int):
+        try:
+            if self._use_redis and self.redis_client:
+                await self.redis_client.set(compute_time_key(key), f"{compute_time:.6f}", ex=ttl)
+            else:
+                self.memory_cache.set(compute_time_key(key), compute_time, ttl)
+        except Exception as e:
+            logger.warning(f"Cache compute time error for {key}: {e}")
+
+    def _use_local(self, key: str) -> bool:
+        """L1 에 둘 키인지 (세션처럼 즉시 반영되어야 하는 키는 제외)"""
+        return key.startswith(tuple(settings.CACHE_L1_PREFIXES))
+
+    async def _set_local(self, key: str, value: Any, size: int, ttl: Optional[int] = None):
+        if self._use_local(key):
+            local_ttl = settings.CACHE_L1_TTL if ttl is None else min(ttl, settings.CACHE_L1_TTL)
+            self.local_cache.set(key, value, local_ttl, size=size)
+
+    def _invalidation_message(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> str:
+        return json.dumps({"origin": self._instance_id, "keys": keys or [], "pattern": pattern})
+
+    async def _publish_invalidation(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None):
+        try:
+            await self.redis_client.publish(
+                settings.CACHE_INVALIDATION_CHANNEL,
+                self._invalidation_message(keys, pattern)
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    def _apply_invalidation(self, message: Dict[str, Any]):
+        """다른 워커가 보낸 무효화 메시지를 L1 에 반영"""
+        if message.get("origin") == self._instance_id:
+            return
+        for key in message.get("keys") or []:
+            self.local_cache.delete(key)
+        if message.get("pattern"):
+            self.local_cache.delete_matching(message["pattern"])
+
+    async def _listen_invalidations(self):
+        """
+        무효화 채널 구독
+        - 연결이 끊기면 그 사이의 메시지를 놓쳤을 수 있으므로 L1 을 비우고 다시 구독
+        """
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_invalidation(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}, resubscribing")
+                self.local_cache.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
+
     async def close(self):
         """캐시 연결 종료"""
+        await self.memory_cache.stop_sweeper()
+        await self.local_cache.stop_sweeper()
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.local_cache.clear()
         if self.redis_client:
             await self.redis_client.close()
 
@@ -0,0 +1,216 @@
+# backend/app/services/csv_aggregate.py
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.services.csv_dataset import CSVDataset, CategoryColumn, NumericColumn
+
+# 지원하는 집계 함수
+AGGREGATE_FUNCTIONS = ("sum", "avg", "min", "max", "count", "median", "p95", "stddev", "distinct")
+UNKNOWN_GROUP = 'Unknown'
+
+
+def parse_group_by(group_by: str) -> List[str]:
+    """'region,date' -> ['region', 'date']"""
+    return [column.strip() for column in group_by.split(',') if column.strip()]
+
+
+def parse_aggregate(aggregate: str) -> List[Tuple[str, List[str]]]:
+    """
+    집계 조건 파싱
+    - 'column:function' 또는 'column:f1,f2' 형식, 여러 컬럼은 ';'로 구분
+      예: "visitors:sum,avg,p95;revenue:max"
+    """
+    specs = []
+    for part in aggregate.split(';'):
+        if not part.strip():
+            continue
+        if ':' not in part:
+            raise ValueError(f"집계 형식이 올바르지 않습니다: {part}")
+        column, functions = part.split(':', 1)
+        names = [name.strip().lower() for name in functions.split(',') if name.strip()]
+        unknown = [name for name in names if name not in AGGREGATE_FUNCTIONS]
+        if unknown or not names:
+            raise ValueError(
+                f"지원하지 않는 집계 함수입니다: {', '.join(unknown) or functions} "
+                f"(사용 가능: {', '.join(AGGREGATE_FUNCTIONS)})"
+            )
+        specs.append((column.strip(), names))
+    if not specs:
+        raise ValueError("집계 조건이 비어 있습니다")
+    return specs
+
+
+def group_rows(
+    dataset: CSVDataset, row_ids: np.ndarray, group_columns: Sequence[str]
+) -> Tuple[np.ndarray, List[Tuple[Any, ...]]]:
+    """
+    행마다 그룹 번호 부여
+    - 그룹 번호는 처음 등장한 순서대로 0부터 시작
+    - 반환: (행별 그룹 번호, 그룹별 키 값 튜플 목록)
+    """
+    combined = np.zeros(len(row_ids), dtype=np.int64)
+    key_columns = []
+    for name in group_columns:
+        codes, values = _factorize(dataset, name, row_ids)
+        combined = combined * len(values) + codes
+        # 여러 컬럼을 곱해 나가며 값이 커지지 않도록 매번 다시 압축
+        _, combined = np.unique(combined, return_inverse=True)
+        combined = combined.reshape(-1)
+        key_columns.append((codes, values))
+
+    if len(row_ids) == 0:
+        return combined, []
+
+    # 처음 등장한 순서로 그룹 번호 재배치
+    _, first_index, inverse = np.unique(combined, return_index=True, return_inverse=True)
+    order = np.argsort(first_index, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    group_ids = rank[inverse.reshape(-1)]
+
+    first_rows = first_index[order]
+    keys = [
+        tuple(values[codes[i]] for codes, values in key_columns)
+        for i in first_rows
+    ]
+    return group_ids, keys
+
+
+def aggregate(
+    dataset: CSVDataset,
+    row_ids: np.ndarray,
+    group_columns: Sequence[str],
+    specs: Sequence[Tuple[str, Sequence[str]]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    그룹별 집계
+    - 값 컬럼마다 한 번 정렬하여 요청된 모든 집계를 함께 계산
+    - 반환: (집계 결과 행 목록, 컬럼별 숫자가 아닌 값으로 제외된 행 수)
+    """
+    group_ids, keys = group_rows(dataset, row_ids, group_columns)
+    group_count = len(keys)
+    rows_per_group = np.bincount(group_ids, minlength=group_count)
+
+    results: Dict[str, np.ndarray] = {}
+    has_values = np.zeros(group_count, dtype=bool)
+    rejected: Dict[str, int] = {}
+
+    for column, functions in specs:
+        values, rejected[column] = _numeric_values(dataset, column, row_ids)
+        valid = ~np.isnan(values)
+        stats = _group_stats(group_ids[valid], values[valid], group_count, functions)
+        has_values |= stats["count"] > 0
+        for name in functions:
+            results[f"{column}_{name}"] = stats[name]
+
+    output = []
+    for group in np.flatnonzero(has_values):
+        row: Dict[str, Any] = dict(zip(group_columns, keys[group]))
+        row['count'] = int(rows_per_group[group])
+        for name, column_values in results.items():
+            value = column_values[group]
+            if name.endswith(('_count', '_distinct')):
+                row[name] = int(value)
+            else:
+                row[name] = None if np.isnan(value) else float(value)
+        output.append(row)
+
+    return output, rejected
+
+
+def _group_stats(
+    group_ids: np.ndarray, values: np.ndarray, group_count: int, functions: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    """(그룹, 값) 순으로 한 번 정렬한 뒤 필요한 통계 계산"""
+    counts = np.bincount(group_ids, minlength=group_count)
+    stats: Dict[str, np.ndarray] = {"count": counts}
+    empty = counts == 0
+    safe_counts = np.where(empty, 1, counts)
+
+    sums = np.bincount(group_ids, weights=values, minlength=group_count)
+    means = sums / safe_counts
+    stats["sum"] = sums
+    stats["avg"] = np.where(empty, np.nan, means)
+
+    if "stddev" in functions:
+        deviations = values - means[group_ids]
+        variance = np.bincount(group_ids, weights=deviations * deviations, minlength=group_count) / safe_counts
+        stats["stddev"] = np.where(empty, np.nan, np.sqrt(variance))
+
+    if any(name in functions for name in ("min", "max", "median", "p95", "distinct")):
+        order = np.lexsort((values, group_ids))
+        sorted_groups = group_ids[order]
+        sorted_values = values[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if group_count else counts
+        ends = starts + counts - 1
+
+        def pick(positions: np.ndarray) -> np.ndarray:
+            if len(sorted_values) == 0:
+                return np.full(group_count, np.nan)
+            return np.where(empty, np.nan, sorted_values[np.clip(positions, 0, len(sorted_values) - 1)])
+
+        stats["min"] = pick(starts)
+        stats["max"] = pick(ends)
+        for name, q in (("median", 0.5), ("p95", 0.95)):
+            if name in functions:
+                # numpy percentile 기본(linear) 보간과 동일
+                position = starts + (counts - 1) * q
+                lower = np.floor(position).astype(np.int64)
+                upper = np.ceil(position).astype(np.int64)
+                stats[name] = pick(lower) + (pick(upper) - pick(lower)) * (position - lower)
+        if "distinct" in functions:
+            new_value = np.ones(len(sorted_values), dtype=bool)
+            new_value[1:] = (sorted_groups[1:] != sorted_groups[:-1]) | (sorted_values[1:] != sorted_values[:-1])
+            stats["distinct"] = np.bincount(sorted_groups[new_value], minlength=group_count)
+
+    return stats
+
+
+def _factorize(dataset: CSVDataset, name: str, row_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """그룹 컬럼 값을 (코드, 고유값)으로 변환, 없는 컬럼은 모두 Unknown"""
+    column = dataset.column(name)
+    if column is None:
+        values = np.empty(1, dtype=object)
+        values[0] = UNKNOWN_GROUP
+        return np.zeros(len(row_ids), dtype=np.int64), values
+
+    if isinstance(column, CategoryColumn):
+        return column.codes[row_ids].astype(np.int64), column.categories
+
+    values = np.asarray(column.take(row_ids), dtype=object)
+    uniques, codes = np.unique(values.astype(str), return_inverse=True)
+    # 원래 값(숫자는 숫자 그대로) 유지
+    originals = np.empty(len(uniques), dtype=object)
+    originals[codes.reshape(-1)] = values
+    return codes.reshape(-1).astype(np.int64), originals
+
+
+def _numeric_values(dataset: CSVDataset, name: str, row_ids: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    값 컬럼을 float 배열로 변환 (빈 값/숫자가 아닌 값은 NaN)
+    - 반환: (값 배열, 숫자가 아닌 값이 있어 제외된 행 수)
+    """
+    column = dataset.column(name)
+    if column is None:
+        return np.full(len(row_ids), np.nan), 0
+    if isinstance(column, NumericColumn):
+        return column.values[row_ids], 0
+
+    if isinstance(column, CategoryColumn):
+        uniques, codes = column.categories, column.codes[row_ids]
+    else:
+        uniques, codes = np.unique(column.values[row_ids], return_inverse=True)
+        codes = codes.reshape(-1)
+
+    parsed = np.full(len(uniques), np.nan)
+    non_numeric = np.zeros(len(uniques), dtype=bool)
+    for i, value in enumerate(uniques):
+        text = str(value).strip()
+        if not text:
+            continue
+        try:
+            parsed[i] = float(text)
+        except ValueError:
+            non_numeric[i] = True
+    return parsed[codes], int(non_numeric[codes].sum())
@@ -0,0 +1,300 @@
+# backend/app/services/csv_dataset.py
+import csv
+import hashlib
+import os
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 사전 인코딩 (예: 지역명)
+CATEGORY_MAX_RATIO = 0.5
+# 프로세스에 유지할 데이터셋 개수
+MAX_LOADED_DATASETS = 4
+
+# 행 선택 (None: 전체, slice: 연속 구간, 배열: 행 번호)
+RowSelector = Optional[Union[slice, np.ndarray]]
+
+
+class Column(ABC):
+    """컬럼 공통 인터페이스 (구현하지 않은 메서드가 있으면 생성 시점에 TypeError)"""
+    kind = "text"
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def take(self, row_ids: np.ndarray) -> List[Any]:
+        """지정한 행의 값을 파이썬 값 목록으로 반환"""
+
+    @abstractmethod
+    def string_values(self) -> np.ndarray:
+        """문자열(object) 배열로 변환한 전체 값"""
+
+    def string_mask(self, predicate: Callable[[np.ndarray], np.ndarray], rows: RowSelector = None) -> np.ndarray:
+        """문자열 기준 조건식을 적용한 bool 마스크 (rows 를 주면 해당 행만)"""
+        values = self.string_values()
+        return np.asarray(predicate(values if rows is None else values[rows]), dtype=bool)
+
+    def equals_mask(self, value: str) -> np.ndarray:
+        return self.string_mask(lambda values: values == value)
+
+
+class NumericColumn(Column):
+    """숫자 컬럼 (float64, 빈 값은 NaN)"""
+    kind = "numeric"
+
+    def __init__(self, values: np.ndarray, is_integer: bool):
+        self.values = values
+        self.is_integer = is_integer
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def take(self, row_ids: np.ndarray) -> List[Any]:
+        values = self.values[row_ids]
+        if self.is_integer:
+            return [None if np.isnan(v) else int(v) for v in values]
+        return [None if np.isnan(v) else float(v) for v in values]
+
+    def string_values(self) -> np.ndarray:
+        return np.array(self.take(np.arange(len(self.values))), dtype=object).astype(str)
+
+    def string_mask(self, predicate: Callable[[np.ndarray], np.ndarray], rows: RowSelector = None) -> np.ndarray:
+        row_ids = np.arange(len(self.values))
+        strings = np.array(self.take(row_ids if rows is None else row_ids[rows]), dtype=object).astype(str)
+        return np.asarray(predicate(strings), dtype=bool)
+
+    def equals_mask(self, value: str) -> np.ndarray:
+        try:
+            return self.values == float(value)
+        except ValueError:
+            return np.zeros(len(self.values), dtype=bool)
+
+
+class CategoryColumn(Column):
+    """사전 인코딩 문자열 컬럼 (codes -> categories)"""
+    kind = "category"
+
+    def __init__(self, codes: np.ndarray, categories: np.ndarray):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def take(self, row_ids: np.ndarray) -> List[Any]:
+        return self.categories[self.codes[row_ids]].tolist()
+
+    def string_values(self) -> np.ndarray:
+        return self.categories[self.codes]
+
+    def string_mask(self, predicate: Callable[[np.ndarray], np.ndarray], rows: RowSelector = None) -> np.ndarray:
+        # 고유값에만 조건식을 적용한 뒤 코드로 펼침
+        category_mask = np.asarray(predicate(self.categories), dtype=bool)
+        return category_mask[self.codes if rows is None else self.codes[rows]]
+
+
+class TextColumn(Column):
+    """고유값이 많은 문자열 컬럼"""
+    kind = "text"
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def take(self, row_ids: np.ndarray) -> List[Any]:
+        return self.values[row_ids].tolist()
+
+    def string_values(self) -> np.ndarray:
+        return self.values
+
+
+class CSVDataset:
+    """
+    컬럼 단위로 저장한 CSV 데이터셋
+    - 읽기 전용으로 여러 요청이 공유
+    """
+    def __init__(self, columns: "OrderedDict[str, Column]", row_count: int, source_path: str):
+        self.columns = columns
+        self.row_count = row_count
+        self.source_path = source_path
+        # 원본 파일 버전 (file_version, load_dataset 에서 설정)
+        self.version: Optional[str] = None
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns.keys())
+
+    def column(self, name: str) -> Optional[Column]:
+        return self.columns.get(name)
+
+    def all_rows(self) -> np.ndarray:
+        return np.arange(self.row_count)
+
+    def equals_mask(self, column: str, value: str) -> np.ndarray:
+        """column == value 마스크 (없는 컬럼은 모두 False)"""
+        col = self.columns.get(column)
+        if col is None:
+            return np.zeros(self.row_count, dtype=bool)
+        return col.equals_mask(value)
+
+    def records(
+        self,
+        row_ids: Optional[np.ndarray] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """지정한 행만 dict 목록으로 변환 (응답 직전에만 사용)"""
+        if row_ids is None:
+            row_ids = self.all_rows()
+        names = [c for c in (columns or self.column_names) if c in self.columns]
+        values = [self.columns[name].take(row_ids) for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)] if names else [{} for _ in row_ids]
+
+    @classmethod
+    def from_csv(cls, file_path: str) -> "CSVDataset":
+        """
+        CSV 파일을 한 번 읽어 컬럼 배열로 변환
+        - 읽는 동안 모든 컬럼을 사전 인코딩하고, 끝난 뒤 고유값 기준으로 타입 결정
+        """
+        with open(file_path, mode='r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return cls(OrderedDict(), 0, file_path)
+
+            width = len(header)
+            lookups: List[Dict[str, int]] = [{} for _ in range(width)]
+            codes = [array('i') for _ in range(width)]
+            row_count = 0
+
+            for row in reader:
+                if not row:
+                    continue
+                # 부족한 필드는 빈 값, 넘치는 필드가 있는 레코드는 제외 (업로드 시 rejected_rows 로 집계)
+                if len(row) > width:
+                    continue
+                if len(row) < width:
+                    row = row + [''] * (width - len(row))
+                for i in range(width):
+                    value = row[i]
+                    lookup = lookups[i]
+                    code = lookup.get(value)
+                    if code is None:
+                        code = lookup[value] = len(lookup)
+                    codes[i].append(code)
+                row_count += 1
+
+        columns: "OrderedDict[str, Column]" = OrderedDict()
+        for name, lookup, column_codes in zip(header, lookups, codes):
+            uniques = np.empty(len(lookup), dtype=object)
+            uniques[:] = list(lookup.keys())
+            columns[name] = _build_column(
+                np.frombuffer(column_codes, dtype=np.int32) if row_count else np.zeros(0, dtype=np.int32),
+                uniques,
+                row_count
+            )
+
+        return cls(columns, row_count, file_path)
+
+
+def _build_column(codes: np.ndarray, uniques: np.ndarray, row_count: int) -> Column:
+    """고유값을 보고 숫자/범주/텍스트 컬럼 중 하나로 결정"""
+    numeric = _parse_numeric(uniques)
+    if numeric is not None:
+        values = numeric[codes]
+        finite = values[~np.isnan(values)]
+        is_integer = bool(np.all(finite == np.floor(finite))) if len(finite) else True
+        return NumericColumn(values, is_integer)
+
+    if row_count == 0 or len(uniques) <= row_count * CATEGORY_MAX_RATIO:
+        return CategoryColumn(codes, uniques)
+    return TextColumn(uniques[codes])
+
+
+def _parse_numeric(uniques: np.ndarray) -> Optional[np.ndarray]:
+    """모든 값이 숫자(또는 빈 값)이면 float 배열, 아니면 None"""
+    parsed = np.empty(len(uniques), dtype=np.float64)
+    has_value = False
+    for i, value in enumerate(uniques):
+        text = value.strip()
+        if text == '':
+            parsed[i] = np.nan
+            continue
+        # 앞자리 0이 의미 있는 코드값(우편번호 등)은 문자열로 유지
+        if len(text) > 1 and text[0] == '0' and text[1] != '.':
+            return None
+        try:
+            parsed[i] = float(text)
+        except ValueError:
+            return None
+        if np.isnan(parsed[i]) or np.isinf(parsed[i]):
+            return None
+        has_value = True
+    return parsed if has_value else None
+
+
+# 파일별 데이터셋 캐시 (프로세스 전역, 요청 간 공유)
+_datasets: "OrderedDict[str, Tuple[Tuple[int, int], CSVDataset]]" = OrderedDict()
+_datasets_lock = threading.Lock()
+
+
+def file_version(file_path: str, signature: Optional[Tuple[int, int]] = None) -> str:
+    """
+    데이터셋 버전 (경로 + mtime + size 해시)
+    - 파일을 다시 올리면 모든 워커에서 별도 통지 없이 바뀜
+    """
+    path = os.path.abspath(file_path)
+    if signature is None:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    raw = f"{path}:{signature[0]}:{signature[1]}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def load_dataset(file_path: str) -> CSVDataset:
+    """
+    데이터셋 반환
+    - 파일별로 한 번만 읽고, 파일의 (mtime, size)가 바뀌면 다시 읽음
+    - CSV 는 처음 한 번만 파싱해 스냅샷(<파일명>.snap)으로 저장하고 이후에는 mmap 으로 열기
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _datasets_lock:
+        cached = _datasets.get(path)
+        if cached and cached[0] == signature:
+            _datasets.move_to_end(path)
+            return cached[1]
+
+        dataset = _open_or_build_snapshot(path, signature)
+        dataset.version = file_version(path, signature)
+        _datasets[path] = (signature, dataset)
+        _datasets.move_to_end(path)
+        while len(_datasets) > MAX_LOADED_DATASETS:
+            _datasets.popitem(last=False)
+        return dataset
+
+
+def _open_or_build_snapshot(path: str, signature: Tuple[int, int]) -> CSVDataset:
+    """스냅샷이 최신이면 mmap 으로 열고, 아니면 CSV 를 파싱해 스냅샷을 만든 뒤 열기"""
+    from app.services import csv_snapshot
+
+    dataset = csv_snapshot.open_snapshot(path, signature)
+    if dataset is not None:
+        return dataset
+
+    parsed = CSVDataset.from_csv(path)
+    try:
+        csv_snapshot.write_snapshot(parsed, signature)
+    except OSError:
+        # 업로드 폴더에 쓸 수 없으면 파싱 결과를 그대로 사용
+        return parsed
+    return csv_snapshot.open_snapshot(path, signature) or parsed
@@ -0,0 +1,126 @@
+# backend/app/services/csv_export.py
+import csv
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.csv_dataset import CSVDataset
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# 형식별 Content-Type
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "json": "application/json"
+}
+# 한 번에 변환하는 행 수
+EXPORT_BATCH_SIZE = 5000
+# 압축 스트림에서 한 번에 내보낼 최소 바이트
+COMPRESS_FLUSH_BYTES = 64 * 1024
+
+
+def iter_dataset_rows(
+    dataset: CSVDataset,
+    row_ids: np.ndarray,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """행 번호를 배치 단위로 dict 목록으로 변환"""
+    for start in range(0, len(row_ids), batch_size):
+        yield dataset.records(row_ids[start:start + batch_size], columns)
+
+
+def serialize(batches: Iterable[List[Dict[str, Any]]], fmt: str, columns: Sequence[str]) -> Iterator[bytes]:
+    """
+    배치 단위 직렬화 (Pydantic 검증 없이 바로 바이트로 변환)
+    - ndjson: 한 줄에 한 행
+    - csv: 헤더 + 행
+    - json: 배열을 나눠서 전송
+    """
+    if fmt == "ndjson":
+        for rows in batches:
+            if rows:
+                yield "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows).encode('utf-8')
+    elif fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for rows in batches:
+            writer.writerows([["" if row.get(c) is None else row.get(c) for c in columns] for row in rows])
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+    elif fmt == "json":
+        yield b"["
+        first = True
+        for rows in batches:
+            if not rows:
+                continue
+            body = ",".join(json.dumps(row, ensure_ascii=False, default=str) for row in rows)
+            yield (body if first else "," + body).encode('utf-8')
+            first = False
+        yield b"]"
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (사용 가능: {', '.join(EXPORT_FORMATS)})")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding 에서 사용할 압축 방식 선택 (zstd > gzip, 없으면 None)"""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.lower()] = quality
+
+    if ZSTD_AVAILABLE and accepted.get("zstd", 0) > 0:
+        return "zstd"
+    if accepted.get("gzip", accepted.get("*", 0)) > 0:
+        return "gzip"
+    return None
+
+
+def compress(chunks: Iterable[bytes], encoding: Optional[str]) -> Iterator[bytes]:
+    """
+    청크 스트림 압축
+    - 첫 청크는 바로 flush 하여 첫 바이트가 지연되지 않게 하고, 이후는 COMPRESS_FLUSH_BYTES 단위로 모아서 전송
+    """
+    if encoding is None:
+        yield from chunks
+        return
+
+    if encoding == "zstd":
+        compressor = zstandard.ZstdCompressor().compressobj()
+        sync_flush = lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+    else:
+        # wbits=31: gzip 헤더 포함
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        sync_flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    pending: List[bytes] = []
+    pending_size = 0
+    first = True
+    for chunk in chunks:
+        data = compressor.compress(chunk) + (sync_flush() if first else b"")
+        pending.append(data)
+        pending_size += len(data)
+        if first or pending_size >= COMPRESS_FLUSH_BYTES:
+            yield b"".join(pending)
+            pending, pending_size, first = [], 0, False
+    pending.append(compressor.flush())
+    yield b"".join(pending)
@@ -0,0 +1,361 @@
+# backend/app/services/csv_filter.py
+"""
+CSV 필터 표현식
+
+예)
+    region = '창원시' and visitors >= 100
+    region in ('창원시', '김해시') or date between '2024-01-01' and '2024-03-31'
+    name startswith '해'
+    region=창원시                       (기존 column=value 형식)
+"""
+import re
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.csv_dataset import CSVDataset, NumericColumn, RowSelector
+
+COMPARE_OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+# 값이 모두 숫자면 문자열 컬럼에서도 숫자로 비교하는 연산자
+ORDERING_OPERATORS = ("<", "<=", ">", ">=", "between")
+KEYWORDS = ("and", "or", "in", "between", "startswith")
+# 커서 페이지네이션에서 한 번에 검사하는 행 수
+SCAN_CHUNK_SIZE = 65536
+
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+      | (?P<op><=|>=|!=|=|<|>|\(|\)|,)
+      | (?P<word>[^\s=!<>(),'"]+)
+    )
+""", re.VERBOSE)
+# 파싱에 실패한 기존 형식 (값에 공백 등이 있는 "column=value")
+_LEGACY_PATTERN = re.compile(r"^\s*([^=<>!]+?)\s*=\s*([^=]*?)\s*$")
+
+
+class FilterError(ValueError):
+    """필터 표현식 오류 (API 에서 400 으로 응답)"""
+
+
+class Condition:
+    """
+    컬럼 하나에 대한 조건 (column op values)
+    - 숫자가 아닌 값이 섞여 문자열로 읽힌 컬럼도 크기 비교 값이 숫자면 숫자로 비교
+      (숫자로 읽을 수 없는 값은 조건에 맞지 않음, 집계에서 제외되는 값과 동일)
+    """
+    def __init__(self, column: str, op: str, values: Tuple[str, ...]):
+        self.column = column
+        self.op = op
+        self.values = values
+        self.numbers = _numeric_operands(op, values)
+
+    def mask(self, dataset: CSVDataset, rows: RowSelector = None) -> np.ndarray:
+        column = dataset.column(self.column)
+        if isinstance(column, NumericColumn) and self.op != "startswith":
+            values = column.values if rows is None else column.values[rows]
+            return _numeric_mask(values, self.op, [_to_number(self.column, v) for v in self.values])
+        if self.numbers is not None:
+            return column.string_mask(lambda values: _numeric_mask(_parse_numbers(values), self.op, self.numbers), rows)
+        return column.string_mask(lambda values: _compare(values, self.op, list(self.values)), rows)
+
+    def indexed_rows(self, dataset: CSVDataset, indexes) -> Optional[np.ndarray]:
+        """인덱스로 바로 찾을 수 있는 조건이면 행 번호, 아니면 None"""
+        if self.op == "=":
+            return indexes.equals(self.column, self.values[0])
+        if self.op == "between" and self.numbers is None and not isinstance(dataset.column(self.column), NumericColumn):
+            return indexes.between(self.column, self.values[0], self.values[1])
+        return None
+
+    def validate(self, dataset: CSVDataset) -> None:
+        column = dataset.column(self.column)
+        if column is None:
+            raise FilterError(f"존재하지 않는 컬럼입니다: {self.column}")
+        if isinstance(column, NumericColumn) and self.op != "startswith":
+            for value in self.values:
+                _to_number(self.column, value)
+
+
+class BoolOp:
+    """and / or 결합"""
+    def __init__(self, op: str, children: List[Any]):
+        self.op = op
+        self.children = children
+
+    def mask(self, dataset: CSVDataset, rows: RowSelector = None) -> np.ndarray:
+        combine = np.logical_and if self.op == "and" else np.logical_or
+        result = self.children[0].mask(dataset, rows)
+        for child in self.children[1:]:
+            result = combine(result, child.mask(dataset, rows))
+        return result
+
+    def validate(self, dataset: CSVDataset) -> None:
+        for child in self.children:
+            child.validate(dataset)
+
+
+class CompiledFilter:
+    """파싱이 끝난 필터 (표현식 문자열별로 캐시되어 요청 간 재사용)"""
+    def __init__(self, expression: str, root):
+        self.expression = expression
+        self.root = root
+
+    def row_ids(self, dataset: CSVDataset, indexes=None) -> np.ndarray:
+        """
+        조건에 맞는 행 번호 (오름차순)
+        - 인덱스가 있는 조건(=, between)은 인덱스로 후보를 좁힌 뒤 나머지 조건만 마스크로 확인
+        """
+        self.root.validate(dataset)
+        candidates, remaining = self._plan(dataset, indexes)
+        if candidates is None:
+            return np.flatnonzero(self.root.mask(dataset))
+        for condition in remaining:
+            if len(candidates) == 0:
+                break
+            candidates = candidates[condition.mask(dataset, candidates)]
+        return candidates
+
+    def scan(self, dataset: CSVDataset, indexes, start: int, limit: int) -> Tuple[np.ndarray, bool]:
+        """
+        start 행부터 조건에 맞는 행을 limit 개까지 찾기 (커서 페이지네이션용)
+        - 구간 단위로 검사하다 limit + 1 개를 찾으면 중단
+        - 반환: (행 번호, 뒤에 더 있는지)
+        """
+        self.root.validate(dataset)
+        candidates, remaining = self._plan(dataset, indexes)
+        if candidates is not None:
+            candidates = candidates[np.searchsorted(candidates, start):]
+            total = len(candidates)
+
+            def check(begin: int, end: int) -> np.ndarray:
+                rows = candidates[begin:end]
+                return rows[_all_match(dataset, remaining, rows)]
+        else:
+            total = max(dataset.row_count - start, 0)
+
+            def check(begin: int, end: int) -> np.ndarray:
+                mask = self.root.mask(dataset, slice(start + begin, start + end))
+                return start + begin + np.flatnonzero(mask)
+
+        found: List[np.ndarray] = []
+        count = 0
+        position = 0
+        while position < total and count <= limit:
+            matched = check(position, position + SCAN_CHUNK_SIZE)
+            found.append(matched)
+            count += len(matched)
+            position += SCAN_CHUNK_SIZE
+        row_ids = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+        return row_ids[:limit], len(row_ids) > limit
+
+    def _plan(self, dataset: CSVDataset, indexes) -> Tuple[Optional[np.ndarray], List[Any]]:
+        """(인덱스로 찾은 후보 행, 후보에 추가로 확인할 조건) - 인덱스를 못 쓰면 후보는 None"""
+        if indexes is None:
+            return None, [self.root]
+        conditions = self.root.children if isinstance(self.root, BoolOp) and self.root.op == "and" else [self.root]
+        candidates = None
+        remaining = []
+        for condition in conditions:
+            found = condition.indexed_rows(dataset, indexes) if isinstance(condition, Condition) else None
+            if found is None:
+                remaining.append(condition)
+            elif candidates is None:
+                candidates = found
+            else:
+                candidates = np.intersect1d(candidates, found, assume_unique=True)
+        return candidates, remaining
+
+
+def _all_match(dataset: CSVDataset, conditions: List[Any], rows: np.ndarray) -> np.ndarray:
+    mask = np.ones(len(rows), dtype=bool)
+    for condition in conditions:
+        mask &= condition.mask(dataset, rows)
+    return mask
+
+
+@lru_cache(maxsize=256)
+def compile_filter(expression: str) -> CompiledFilter:
+    """필터 표현식 파싱 (실패 시 FilterError)"""
+    try:
+        return CompiledFilter(expression, _Parser(_tokenize(expression)).parse())
+    except FilterError:
+        legacy = _LEGACY_PATTERN.match(expression)
+        if legacy:
+            return CompiledFilter(expression, Condition(legacy.group(1), "=", (legacy.group(2),)))
+        raise
+
+
+class _Parser:
+    """
+    문법
+        expr       := and_expr ('or' and_expr)*
+        and_expr   := term ('and' term)*
+        term       := '(' expr ')' | column condition
+        condition  := op value | 'in' '(' value (',' value)* ')'
+                    | 'between' value 'and' value | 'startswith' value
+    """
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def parse(self):
+        if not self.tokens:
+            raise FilterError("필터 표현식이 비어 있습니다")
+        node = self._expr()
+        if self.position < len(self.tokens):
+            raise FilterError(f"해석할 수 없는 위치: {self.tokens[self.position][1]}")
+        return node
+
+    def _expr(self):
+        children = [self._and_expr()]
+        while self._accept_keyword("or"):
+            children.append(self._and_expr())
+        return children[0] if len(children) == 1 else BoolOp("or", children)
+
+    def _and_expr(self):
+        children = [self._term()]
+        while self._accept_keyword("and"):
+            children.append(self._term())
+        return children[0] if len(children) == 1 else BoolOp("and", children)
+
+    def _term(self):
+        if self._accept_op("("):
+            node = self._expr()
+            self._expect_op(")")
+            return node
+
+        column = self._value("컬럼")
+        if self._accept_keyword("in"):
+            self._expect_op("(")
+            values = [self._value("값")]
+            while self._accept_op(","):
+                values.append(self._value("값"))
+            self._expect_op(")")
+            return Condition(column, "in", tuple(values))
+        if self._accept_keyword("between"):
+            low = self._value("값")
+            if not self._accept_keyword("and"):
+                raise FilterError("between 은 'between 값 and 값' 형식이어야 합니다")
+            return Condition(column, "between", (low, self._value("값")))
+        if self._accept_keyword("startswith"):
+            return Condition(column, "startswith", (self._value("값"),))
+
+        kind, text = self._next("연산자")
+        if kind != "op" or text not in COMPARE_OPERATORS:
+            raise FilterError(f"연산자가 필요합니다: {text}")
+        return Condition(column, text, (self._value("값"),))
+
+    def _next(self, expected: str) -> Tuple[str, str]:
+        if self.position >= len(self.tokens):
+            raise FilterError(f"{expected}가 필요합니다")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _value(self, expected: str) -> str:
+        kind, text = self._next(expected)
+        if kind == "string":
+            return text
+        if kind == "word" and text.lower() not in KEYWORDS:
+            return text
+        raise FilterError(f"{expected}가 필요합니다: {text}")
+
+    def _accept_keyword(self, keyword: str) -> bool:
+        if self.position < len(self.tokens):
+            kind, text = self.tokens[self.position]
+            if kind == "word" and text.lower() == keyword:
+                self.position += 1
+                return True
+        return False
+
+    def _accept_op(self, op: str) -> bool:
+        if self.position < len(self.tokens) and self.tokens[self.position] == ("op", op):
+            self.position += 1
+            return True
+        return False
+
+    def _expect_op(self, op: str) -> None:
+        if not self._accept_op(op):
+            raise FilterError(f"'{op}'가 필요합니다")
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if not match:
+            raise FilterError(f"해석할 수 없는 문자: {expression[position:position + 10]}")
+        position = match.end()
+        if match.group("string") is not None:
+            raw = match.group("string")
+            tokens.append(("string", raw[1:-1].replace(raw[0] * 2, raw[0])))
+        elif match.group("op") is not None:
+            tokens.append(("op", match.group("op")))
+        else:
+            tokens.append(("word", match.group("word")))
+    return tokens
+
+
+def _to_number(column: str, value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise FilterError(f"숫자 컬럼 {column} 에는 숫자를 비교해야 합니다: {value}")
+
+
+def _numeric_operands(op: str, values: Tuple[str, ...]) -> Optional[List[float]]:
+    """크기 비교 조건의 값이 모두 숫자면 float 목록, 아니면 None (문자열 비교)"""
+    if op not in ORDERING_OPERATORS:
+        return None
+    try:
+        return [float(value) for value in values]
+    except ValueError:
+        return None
+
+
+def _parse_numbers(values: np.ndarray) -> np.ndarray:
+    """문자열 배열을 float 로 변환 (빈 값/숫자가 아닌 값은 NaN, csv_aggregate 와 같은 규칙)"""
+    uniques, inverse = np.unique(values.astype(str), return_inverse=True)
+    parsed = np.full(len(uniques), np.nan)
+    for i, value in enumerate(uniques):
+        text = value.strip()
+        if not text:
+            continue
+        try:
+            parsed[i] = float(text)
+        except ValueError:
+            pass
+    return parsed[inverse.reshape(-1)]
+
+
+def _numeric_mask(values: np.ndarray, op: str, operands: List[float]) -> np.ndarray:
+    if op == "in":
+        return np.isin(values, operands)
+    if op == "between":
+        return (values >= operands[0]) & (values <= operands[1])
+    return _compare(values, op, operands)
+
+
+def _compare(values: np.ndarray, op: str, operands: List[Any]) -> np.ndarray:
+    """고유값/컬럼 배열에 조건 적용"""
+    if op == "=":
+        return values == operands[0]
+    if op == "!=":
+        return values != operands[0]
+    if op == "<":
+        return values < operands[0]
+    if op == "<=":
+        return values <= operands[0]
+    if op == ">":
+        return values > operands[0]
+    if op == ">=":
+        return values >= operands[0]
+    if op == "in":
+        return np.isin(values, np.array(operands, dtype=object))
+    if op == "between":
+        return (values >= operands[0]) & (values <= operands[1])
+    if op == "startswith":
+        return np.array([str(value).startswith(operands[0]) for value in values], dtype=bool)
+    raise FilterError(f"지원하지 않는 연산자입니다: {op}")
@@ -0,0 +1,194 @@
+# backend/app/services/csv_index.py
+import os
+import tempfile
+import threading
+import weakref
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.services.csv_dataset import CSVDataset, CategoryColumn, NumericColumn, TextColumn
+
+INDEX_VERSION = 1
+
+
+class HashIndex:
+    """
+    범주 컬럼 해시 인덱스
+    - 값별 행 번호 목록(posting)을 코드 순으로 이어 붙인 배열 + 구간 오프셋
+    """
+    def __init__(self, column: CategoryColumn, order: np.ndarray, offsets: np.ndarray):
+        self.order = order
+        self.offsets = offsets
+        self.categories = column.categories
+        self._codes = {value: code for code, value in enumerate(column.categories)}
+
+    @classmethod
+    def build(cls, column: CategoryColumn) -> "HashIndex":
+        order = np.argsort(column.codes, kind='stable').astype(np.int32)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(column.codes, minlength=len(column.categories)))))
+        return cls(column, order, offsets.astype(np.int64))
+
+    def lookup(self, value: str) -> np.ndarray:
+        """value 와 같은 행 번호 (오름차순)"""
+        code = self._codes.get(value)
+        if code is None:
+            return np.zeros(0, dtype=np.int32)
+        return self.order[self.offsets[code]:self.offsets[code + 1]]
+
+    def range(self, low: str, high: str) -> np.ndarray:
+        """low <= 값 <= high 인 행 번호 (오름차순)"""
+        codes = np.flatnonzero((self.categories >= low) & (self.categories <= high))
+        if len(codes) == 1:
+            return self.lookup(self.categories[codes[0]])
+        postings = [self.order[self.offsets[c]:self.offsets[c + 1]] for c in codes]
+        return np.sort(np.concatenate(postings)) if postings else np.zeros(0, dtype=np.int32)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {"order": self.order, "offsets": self.offsets}
+
+
+class SortedIndex:
+    """
+    정렬 인덱스 (날짜 문자열, 숫자 컬럼)
+    - 값 기준 정렬 순서만 저장하고 구간은 이진 탐색으로 찾음
+    """
+    def __init__(self, column, order: np.ndarray):
+        self.order = order
+        if isinstance(column, NumericColumn):
+            self.sorted_values = column.values[order]
+        else:
+            self.sorted_values = column.string_values()[order]
+
+    @classmethod
+    def build(cls, column) -> "SortedIndex":
+        values = column.values if isinstance(column, NumericColumn) else column.string_values()
+        return cls(column, np.argsort(values, kind='stable').astype(np.int32))
+
+    def range(self, low, high) -> np.ndarray:
+        start = np.searchsorted(self.sorted_values, low, side='left')
+        end = np.searchsorted(self.sorted_values, high, side='right')
+        return np.sort(self.order[start:end])
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {"order": self.order}
+
+
+class DatasetIndexes:
+    """
+    데이터셋 보조 인덱스 모음
+    - 컬럼별로 처음 사용할 때 만들고 CSV 옆 <파일명>.idx.npz 에 저장
+    - 파일의 (mtime, size)가 바뀌면 저장된 인덱스는 무시
+    """
+    def __init__(self, dataset: CSVDataset):
+        # 데이터셋 캐시에서 빠질 때 해제되도록 약한 참조로 보관
+        self._dataset = weakref.ref(dataset)
+        self.path = index_path(dataset.source_path)
+        self._indexes: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def dataset(self) -> CSVDataset:
+        return self._dataset()
+
+    def equals(self, column: str, value: str) -> Optional[np.ndarray]:
+        """column == value 인 행 번호, 인덱스를 쓸 수 없는 컬럼은 None"""
+        col = self.dataset.column(column)
+        if col is None:
+            return np.zeros(0, dtype=np.int32)
+        if isinstance(col, CategoryColumn):
+            return self._get(column, HashIndex).lookup(value)
+        if isinstance(col, NumericColumn):
+            try:
+                number = float(value)
+            except ValueError:
+                return np.zeros(0, dtype=np.int32)
+            return self._get(column, SortedIndex).range(number, number)
+        return None
+
+    def between(self, column: str, low: str, high: str) -> Optional[np.ndarray]:
+        """low <= column <= high (문자열 비교) 인 행 번호, 인덱스를 쓸 수 없으면 None"""
+        col = self.dataset.column(column)
+        if isinstance(col, CategoryColumn):
+            return self._get(column, HashIndex).range(low, high)
+        if isinstance(col, TextColumn):
+            return self._get(column, SortedIndex).range(low, high)
+        return None
+
+    def _get(self, column: str, index_type):
+        index = self._indexes.get(column)
+        if isinstance(index, index_type):
+            return index
+        with self._lock:
+            index = self._indexes.get(column)
+            if not isinstance(index, index_type):
+                index = index_type.build(self.dataset.column(column))
+                self._indexes[column] = index
+                self._save()
+            return index
+
+    def _signature(self) -> np.ndarray:
+        stat = os.stat(self.dataset.source_path)
+        return np.array([INDEX_VERSION, stat.st_mtime_ns, stat.st_size, self.dataset.row_count], dtype=np.int64)
+
+    def _load(self) -> None:
+        """저장된 인덱스 중 현재 파일과 일치하는 것만 불러오기"""
+        try:
+            with np.load(self.path, allow_pickle=False) as stored:
+                if not np.array_equal(stored["signature"], self._signature()):
+                    return
+                arrays = {name: stored[name] for name in stored.files if name != "signature"}
+        except Exception:
+            # 잘리거나 깨진 파일은 없는 것으로 보고 다음 _save 에서 덮어씀
+            return
+
+        for name, order in arrays.items():
+            kind, _, column = name.partition(":")
+            col = self.dataset.column(column)
+            if kind == "hash.order" and isinstance(col, CategoryColumn):
+                offsets = arrays.get(f"hash.offsets:{column}")
+                if offsets is not None:
+                    self._indexes[column] = HashIndex(col, order, offsets)
+            elif kind == "sorted.order" and col is not None:
+                self._indexes[column] = SortedIndex(col, order)
+
+    def _save(self) -> None:
+        """
+        만든 인덱스 전체를 임시 파일에 쓴 뒤 교체 (실패해도 메모리 인덱스는 유지)
+        - 여러 워커가 동시에 저장해도 서로의 임시 파일을 건드리지 않도록 고유 이름 사용
+        """
+        arrays = {"signature": self._signature()}
+        for column, index in self._indexes.items():
+            prefix = "hash" if isinstance(index, HashIndex) else "sorted"
+            for name, array in index.arrays().items():
+                arrays[f"{prefix}.{name}:{column}"] = array
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".idx-", suffix=".npz", dir=os.path.dirname(self.path) or ".")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def index_path(csv_path: str) -> str:
+    return f"{csv_path}.idx.npz"
+
+
+# 데이터셋별 인덱스 (데이터셋이 캐시에서 빠지면 함께 해제)
+_indexes: "weakref.WeakKeyDictionary[CSVDataset, DatasetIndexes]" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_indexes(dataset: CSVDataset) -> DatasetIndexes:
+    with _indexes_lock:
+        indexes = _indexes.get(dataset)
+        if indexes is None:
+            indexes = _indexes[dataset] = DatasetIndexes(dataset)
+        return indexes
@@ -0,0 +1,310 @@
+# backend/app/services/csv_ingest.py
+import codecs
+import csv
+import hashlib
+import io
+import json
+import math
+import os
+import re
+from typing import Any, Dict, List, Optional, Set
+
+# UTF-8 로 읽을 수 없을 때 시도하는 인코딩 (엑셀 등에서 저장한 한글 CSV)
+FALLBACK_ENCODING = 'cp949'
+# 메타데이터에 남기는 거부된 레코드 번호 개수
+REJECTED_SAMPLE_SIZE = 10
+# 인코딩 판별에 쓰는 최대 바이트 (처음 나온 비 ASCII 바이트부터)
+ENCODING_PROBE_BYTES = 64 * 1024
+_UTF8_BOM = codecs.BOM_UTF8
+_NON_ASCII = re.compile(rb'[\x80-\xff]')
+
+# 컬럼별 고유값을 정확히 세는 최대 개수 (넘으면 KMV 추정으로 전환)
+EXACT_DISTINCT_LIMIT = 4096
+# KMV 스케치 크기 (상대 오차 약 1/sqrt(k))
+KMV_SIZE = 1024
+_HASH_SPACE = float(1 << 64)
+
+
+class DistinctCounter:
+    """
+    고유값 개수 추정
+    - 적을 때는 집합으로 정확히 세고, 많아지면 가장 작은 해시 k개(KMV)만 유지
+    """
+    def __init__(self):
+        self._exact: Optional[Set[str]] = set()
+        self._hashes: List[int] = []
+
+    def update(self, values: Set[str]) -> None:
+        if self._exact is not None:
+            self._exact |= values
+            if len(self._exact) <= EXACT_DISTINCT_LIMIT:
+                return
+            values, self._exact = self._exact, None
+        hashes = set(self._hashes)
+        hashes.update(_hash64(value) for value in values)
+        self._hashes = sorted(hashes)[:KMV_SIZE]
+
+    @property
+    def estimate(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        if len(self._hashes) < KMV_SIZE:
+            return len(self._hashes)
+        return int((KMV_SIZE - 1) * _HASH_SPACE / (self._hashes[-1] + 1))
+
+    @property
+    def exact(self) -> bool:
+        return self._exact is not None
+
+
+class ColumnStats:
+    """컬럼 하나의 누적 통계 (타입 추론, 빈 값, 최소/최대, 고유값)"""
+    def __init__(self, name: str):
+        self.name = name
+        self.null_count = 0
+        self.numeric = True
+        self.integer = True
+        self.min_number: Optional[float] = None
+        self.max_number: Optional[float] = None
+        self.min_text: Optional[str] = None
+        self.max_text: Optional[str] = None
+        self.distinct = DistinctCounter()
+
+    def update(self, values: tuple) -> None:
+        """한 배치의 값을 반영 (타입/최소/최대는 배치 내 고유값에 대해서만 계산)"""
+        uniques = set(values)
+        if '' in uniques:
+            self.null_count += values.count('')
+            uniques.discard('')
+        if not uniques:
+            return
+
+        self.distinct.update(uniques)
+        low, high = min(uniques), max(uniques)
+        self.min_text = low if self.min_text is None else min(self.min_text, low)
+        self.max_text = high if self.max_text is None else max(self.max_text, high)
+
+        if self.numeric:
+            numbers = _parse_numbers(uniques)
+            if numbers is None:
+                self.numeric = False
+                return
+            self.integer = self.integer and all(n == math.floor(n) for n in numbers)
+            low, high = min(numbers), max(numbers)
+            self.min_number = low if self.min_number is None else min(self.min_number, low)
+            self.max_number = high if self.max_number is None else max(self.max_number, high)
+
+    def to_dict(self) -> Dict[str, Any]:
+        has_values = self.min_text is not None
+        if not has_values:
+            inferred, low, high = "empty", None, None
+        elif self.numeric:
+            inferred = "integer" if self.integer else "float"
+            low, high = self.min_number, self.max_number
+            if self.integer:
+                low, high = int(low), int(high)
+        else:
+            inferred, low, high = "string", self.min_text, self.max_text
+        return {
+            "name": self.name,
+            "type": inferred,
+            "null_count": self.null_count,
+            "min": low,
+            "max": high,
+            "distinct_count": self.distinct.estimate,
+            "distinct_exact": self.distinct.exact
+        }
+
+
+class CSVIngestor:
+    """
+    업로드 바이트를 청크 단위로 받아 파싱하며 메타데이터 계산
+    - 인코딩 판별: ASCII 는 바로 처리, 처음 나온 비 ASCII 바이트부터 ENCODING_PROBE_BYTES 만큼 모아
+      UTF-8 로 읽히면 UTF-8, 아니면 CP949 (UTF-8 BOM 은 제거)
+    - 따옴표 안 줄바꿈은 다음 청크까지 보류
+    - 헤더보다 필드가 많은 레코드는 거부 (rejected_rows), 부족한 필드는 빈 값
+    - 메모리 사용량은 청크 크기 + 판별용 버퍼 + 보류 중인 마지막 레코드로 제한
+    """
+    def __init__(self):
+        self.encoding: Optional[str] = None
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._probe = b''
+        self._sha256 = hashlib.sha256()
+        self._pending = ''
+        self._header: Optional[List[str]] = None
+        self._stats: List[ColumnStats] = []
+        self.byte_count = 0
+        self.row_count = 0
+        self.record_count = 0
+        self.rejected_rows = 0
+        self.rejected_samples: List[int] = []
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        청크 반영 후 디스크에 쓸 바이트 반환
+        - 디코딩한 문자열을 UTF-8 로 다시 인코딩 (저장된 파일은 항상 BOM 없는 UTF-8)
+        - 인코딩을 판별하는 동안에는 빈 바이트를 반환하고 이후 청크에서 한꺼번에 반환
+        """
+        self._sha256.update(chunk)
+        self.byte_count += len(chunk)
+        if self.encoding is None:
+            chunk = self._detect(chunk, final=False)
+        return self._consume(chunk, final=False)
+
+    def finish(self) -> bytes:
+        """
+        남은 데이터 처리
+        - 판별 중이던 바이트를 디스크에 쓸 바이트로 반환, 메타데이터는 metadata()
+        """
+        chunk = self._detect(b'', final=True) if self.encoding is None else b''
+        return self._consume(chunk, final=True)
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "column_names": list(self._header or []),
+            "columns": [stats.to_dict() for stats in self._stats],
+            "rejected_rows": self.rejected_rows,
+            "rejected_samples": self.rejected_samples,
+            "encoding": self.encoding,
+            "file_size": self.byte_count,
+            "sha256": self._sha256.hexdigest()
+        }
+
+    def _detect(self, chunk: bytes, final: bool) -> bytes:
+        """
+        판별이 끝난 만큼의 바이트 반환
+        - 비 ASCII 바이트 앞부분은 어느 인코딩이든 같으므로 바로 반환
+        """
+        probe = self._probe + chunk
+        if not final and self.byte_count <= len(_UTF8_BOM) and _UTF8_BOM.startswith(probe):
+            # BOM 이 청크 경계에 걸린 경우
+            self._probe = probe
+            return b''
+        if probe.startswith(_UTF8_BOM) and self.byte_count == len(probe):
+            self.encoding = 'utf-8'
+            self._probe = b''
+            return probe[len(_UTF8_BOM):]
+
+        match = _NON_ASCII.search(probe)
+        if match is None:
+            self._probe = b''
+            if final:
+                self.encoding = 'utf-8'
+            return probe
+        if not final and len(probe) - match.start() < ENCODING_PROBE_BYTES:
+            self._probe = probe[match.start():]
+            return probe[:match.start()]
+
+        self._probe = b''
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(probe[match.start():], final=final)
+            self.encoding = 'utf-8'
+        except UnicodeDecodeError:
+            self.encoding = FALLBACK_ENCODING
+            # 지금까지는 ASCII 만 디코딩했으므로 디코더 상태 없이 교체
+            self._decoder = codecs.getincrementaldecoder(FALLBACK_ENCODING)()
+        return probe
+
+    def _consume(self, chunk: bytes, final: bool) -> bytes:
+        try:
+            decoded = self._decoder.decode(chunk, final=final)
+        except UnicodeDecodeError:
+            raise ValueError("UTF-8 또는 CP949 로 인코딩된 CSV만 업로드할 수 있습니다")
+
+        text = self._pending + decoded
+        complete = len(text) if final else _complete_records_end(text)
+        self._pending = text[complete:]
+        if complete:
+            self._parse(text[:complete])
+        return decoded.encode('utf-8')
+
+    def _parse(self, text: str) -> None:
+        rows = [row for row in csv.reader(io.StringIO(text, newline='')) if row]
+        if self._header is None:
+            if not rows:
+                return
+            self._header = rows.pop(0)
+            self._stats = [ColumnStats(name) for name in self._header]
+        if not rows:
+            return
+
+        # 넘치는 필드는 거부, 부족한 필드는 빈 값 (CSVDataset 과 동일)
+        width = len(self._header)
+        accepted = []
+        for row in rows:
+            self.record_count += 1
+            if len(row) > width:
+                self.rejected_rows += 1
+                if len(self.rejected_samples) < REJECTED_SAMPLE_SIZE:
+                    self.rejected_samples.append(self.record_count)
+                continue
+            accepted.append(row if len(row) == width else row + [''] * (width - len(row)))
+        if not accepted:
+            return
+        self.row_count += len(accepted)
+        for stats, values in zip(self._stats, zip(*accepted)):
+            stats.update(values)
+
+
+def write_metadata(csv_path: str, metadata: Dict[str, Any]) -> str:
+    """CSV 옆에 메타데이터 파일(<파일명>.meta.json) 저장"""
+    meta_path = metadata_path(csv_path)
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, meta_path)
+    return meta_path
+
+
+def read_metadata(csv_path: str) -> Optional[Dict[str, Any]]:
+    """업로드 시 저장한 메타데이터 (없으면 None)"""
+    try:
+        with open(metadata_path(csv_path), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def metadata_path(csv_path: str) -> str:
+    return f"{csv_path}.meta.json"
+
+
+def _complete_records_end(text: str) -> int:
+    """
+    완성된 레코드가 끝나는 위치
+    - 줄 단위로 따옴표 개수의 홀짝을 따라가며, 따옴표 밖의 마지막 줄바꿈 다음 위치를 반환
+    """
+    end = 0
+    in_quotes = False
+    position = 0
+    while True:
+        newline = text.find('\n', position)
+        if newline < 0:
+            return end
+        if text.count('"', position, newline) % 2:
+            in_quotes = not in_quotes
+        position = newline + 1
+        if not in_quotes:
+            end = position
+
+
+def _parse_numbers(values: Set[str]) -> Optional[List[float]]:
+    """모든 값이 숫자이면 float 목록, 아니면 None (앞자리 0 코드값은 문자열 취급)"""
+    numbers = []
+    for value in values:
+        text = value.strip()
+        if len(text) > 1 and text[0] == '0' and text[1] != '.':
+            return None
+        try:
+            number = float(text)
+        except ValueError:
+            return None
+        if math.isnan(number) or math.isinf(number):
+            return None
+        numbers.append(number)
+    return numbers
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
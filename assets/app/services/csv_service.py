@@ -1,10 +1,20 @@
+import asyncio
+import base64
 import csv
+import hashlib
+import json
+import os
+import shutil
 import aiofiles
+import numpy as np
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from fastapi import UploadFile
-from collections import defaultdict
 from app.schemas.csv import GyeongNamRegion
+from app.core.config import settings
+from app.services import csv_aggregate, csv_export, csv_filter, csv_index, csv_ingest, csv_views
+from app.services.csv_dataset import CSVDataset, file_version, load_dataset
+from app.utils.logger import logger
 
 class CSVService:
     """CSV 파일 처리 서비스"""
@@ -24,33 +34,21 @@ class CSVService:
                     "region": region.value
                 }
             
-            file_path = f"{self.upload_dir}/{file.filename}"
+            file_path = f"{self.upload_dir}/{os.path.basename(file.filename)}"
+            os.makedirs(self.upload_dir, exist_ok=True)
             
-            async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
-                
-            # 파일 메타데이터 저장
-            file_size=len(content)
-            uploaded_at=datetime.now()
-            
-            # CSV 메타데이터 저장
-            try:
-                data=await self.read_csv(file_path)
-                row_count = len(data)
-                column_names = list(data[0].keys()) if data else []
-            except Exception as e:
-                row_count = 0
-                column_names = []
+            # 청크 단위로 저장하면서 같은 패스에서 행 수/컬럼 통계/해시 계산
+            metadata = await self._stream_to_disk(file, file_path)
             
-            # 파일 정보 캐싱
-            file_info= {
+            # 파일 정보 캐싱 (다시 읽지 않도록 메타데이터 파일로 남김)
+            file_info = {
                 "filename": file.filename,
-                "uploaded_at": uploaded_at,
-                "file_size": file_size,
-                "row_count": row_count,
-                "column_names": column_names
+                "uploaded_at": datetime.now(),
+                "region": region.value,
+                **metadata
             }
+            await asyncio.to_thread(csv_ingest.write_metadata, file_path, file_info)
+            await self._prepare_dataset(file_path)
             
             return file_info
             
@@ -61,6 +59,87 @@ class CSVService:
                 "filename": file.filename
             }
     
+    async def upload_and_process(
+        self,
+        file: UploadFile,
+        description: str = "",
+        backup_current: bool = True,
+        uploaded_by: str = "admin"
+    ) -> Dict[str, Any]:
+        """
+        관리자 CSV 업로드
+        - 같은 이름의 기존 파일은 백업(옵션) 후 교체
+        - 업로드가 끝날 때까지 기존 파일은 그대로 서비스 (백업은 하드 링크 또는 복사본)
+        - 크기 초과 등 잘못된 업로드는 ValueError
+        """
+        file_path = f"{self.upload_dir}/{os.path.basename(file.filename)}"
+        os.makedirs(self.upload_dir, exist_ok=True)
+        
+        backup_path = None
+        if backup_current and os.path.exists(file_path):
+            backup_path = f"{file_path}.{datetime.now().strftime('%Y%m%d%H%M%S')}.bak"
+            await asyncio.to_thread(_backup_file, file_path, backup_path)
+        
+        try:
+            metadata = await self._stream_to_disk(file, file_path)
+        except Exception:
+            # 업로드 실패 시 기존 파일은 그대로이므로 백업만 정리
+            if backup_path and os.path.exists(backup_path):
+                os.remove(backup_path)
+            raise
+        file_info = {
+            "filename": file.filename,
+            "uploaded_at": datetime.now(),
+            "uploaded_by": uploaded_by,
+            "description": description,
+            "backup_path": backup_path,
+            "dataset_version": file_version(file_path),
+            **metadata
+        }
+        await asyncio.to_thread(csv_ingest.write_metadata, file_path, file_info)
+        await self._prepare_dataset(file_path)
+        
+        return {
+            'success': True,
+            'data': [],
+            'metadata': file_info
+        }
+    
+    async def _stream_to_disk(self, file: UploadFile, file_path: str) -> Dict[str, Any]:
+        """
+        업로드 파일을 임시 파일에 청크 단위로 기록한 뒤 교체
+        - MAX_UPLOAD_SIZE 를 넘으면 중단하고 임시 파일 삭제
+        - CP949 파일은 UTF-8 로 변환해 저장, 인코딩을 알 수 없으면 ValueError
+        """
+        ingestor = csv_ingest.CSVIngestor()
+        tmp_path = f"{file_path}.uploading"
+        try:
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                while True:
+                    chunk = await file.read(settings.CSV_UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if ingestor.byte_count + len(chunk) > settings.MAX_UPLOAD_SIZE:
+                        raise ValueError(
+                            f"파일 크기는 {settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB를 초과할 수 없습니다"
+                        )
+                    # 파서가 돌려준 바이트(항상 UTF-8)를 기록
+                    await f.write(await asyncio.to_thread(ingestor.feed, chunk))
+                await f.write(await asyncio.to_thread(ingestor.finish))
+            metadata = ingestor.metadata()
+            os.replace(tmp_path, file_path)
+            return metadata
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    async def _prepare_dataset(self, file_path: str) -> None:
+        """업로드 직후 컬럼 스냅샷 생성 (실패해도 첫 조회 때 다시 시도)"""
+        try:
+            await asyncio.to_thread(load_dataset, file_path)
+        except Exception as e:
+            logger.warning(f"CSV snapshot build failed for {file_path}: {e}")
+    
     async def read_csv(self, file_path: str) -> List[Dict[str, Any]]: 
         """CSV 파일을 비동기적으로 읽어 딕셔너리 리스트로 변환"""
             
@@ -73,34 +152,88 @@ class CSVService:
 
         return data
     
+    async def get_dataset(self, file_path: str = None) -> Optional[CSVDataset]:
+        """
+        컬럼 단위 데이터셋 반환
+        - 파일별로 한 번만 파싱하여 요청 간 공유
+        """
+        path = self._resolve_path(file_path)
+        if path is None:
+            return None
+        return await asyncio.to_thread(load_dataset, path)
+    
+    def get_version(self, file_path: str = None) -> str:
+        """
+        조회 대상 데이터셋 버전 (파일을 읽지 않고 stat 만 사용)
+        - 캐시 키에 포함하여 새 파일이 올라오면 이전 캐시가 조회되지 않게 함
+        """
+        path = self._resolve_path(file_path)
+        if path is None or not os.path.exists(path):
+            return "empty"
+        return file_version(path)
+    
+    def _resolve_path(self, file_path: Optional[str]) -> Optional[str]:
+        """조회 대상 CSV 경로 (지정하지 않으면 업로드 폴더의 최신 파일)"""
+        if file_path:
+            return file_path
+        if not os.path.isdir(self.upload_dir):
+            return None
+        candidates = [
+            os.path.join(self.upload_dir, name)
+            for name in os.listdir(self.upload_dir)
+            if name.lower().endswith('.csv')
+        ]
+        return max(candidates, key=os.path.getmtime) if candidates else None
+    
     async def get_current_data(
         self,
         file_path:str=None,
         columns: List[str] = None,
         filter: str = None,
         limit: int = 1000,
-        offset: int = 0
+        offset: int = 0,
+        cursor: str = None,
+        with_total: bool = False
     ) -> Dict[str, Any]:
-        """현재 CSV 데이터 조회"""
-        original_data= await self.read_csv(file_path)
+        """
+        현재 CSV 데이터 조회
+        - offset 방식: 필터 결과 전체에서 offset 위치의 페이지 (total_count 항상 계산)
+        - cursor 방식: 응답의 next_cursor 를 넘기면 마지막 행 다음부터 이어서 검사
+          (total_count 는 with_total=True 일 때만 계산)
+        - 데이터 파일이 바뀌었거나 다른 필터의 cursor 는 ValueError
+        """
+        dataset = await self.get_dataset(file_path)
         
-        available_columns=list(original_data[0].keys()) if original_data else []
+        available_columns = dataset.column_names if dataset else []
         
-        # 필터링 및 컬럼 선택
-        filtered_data = original_data
-        if filter:
-            filtered_data=self._apply_filter(filtered_data, filter)
+        total_count = None
+        if dataset and cursor:
+            start = _decode_cursor(cursor, dataset, filter) + 1
+            page_ids, has_more = await asyncio.to_thread(self._scan_page, dataset, filter, start, limit)
+            if with_total:
+                total_count = dataset.row_count if not filter else len(
+                    await asyncio.to_thread(self._apply_filter, dataset, None, filter)
+                )
+        # 필터링 (인덱스로 행 번호를 바로 찾고 실제 값은 페이지 범위만 변환)
+        elif filter and dataset:
+            row_ids = await asyncio.to_thread(self._apply_filter, dataset, None, filter)
+            total_count = len(row_ids)
+            page_ids = row_ids[offset:offset + limit]
+            has_more = offset + limit < total_count
+        else:
+            total_count = dataset.row_count if dataset else 0
+            page_ids = np.arange(min(offset, total_count), min(offset + limit, total_count))
+            has_more = offset + limit < total_count
             
         if columns:
-            filtered_data=self._select_columns(filtered_data, columns)
             selected_columns = columns
         else:
             selected_columns = available_columns
             
         # 페이징 적용
-        total_count = len(filtered_data)
-        paginated_data = filtered_data[offset:offset + limit]
+        paginated_data = dataset.records(page_ids, selected_columns) if dataset else []
         returned_count = len(paginated_data)
+        next_cursor = _encode_cursor(int(page_ids[-1]), dataset, filter) if has_more and len(page_ids) else None
             
         return {
             'success': True,
@@ -111,13 +244,65 @@ class CSVService:
                 'columns': selected_columns,
                 'offset': offset,
                 'limit': limit,
-                'has_more': offset + limit < total_count,
-                'file_path': file_path,
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+                'file_path': dataset.source_path if dataset else file_path,
                 'filter_applied': filter is not None,
                 'columns_selected': columns is not None
             }
         }
     
+    async def export_data(
+        self,
+        fmt: str,
+        file_path: str = None,
+        columns: List[str] = None,
+        filter: str = None,
+        group_by: str = None,
+        aggregate: str = None,
+        date_range: str = None
+    ) -> Iterator[bytes]:
+        """
+        내보내기용 바이트 스트림 (ndjson / csv / json)
+        - 행 선택(필터/날짜)은 바로 수행하고, 값 변환과 직렬화는 배치 단위로 스트리밍
+        - group_by 가 있으면 집계 결과를 내보냄
+        - 잘못된 형식/필터/집계 조건은 스트리밍 시작 전에 ValueError
+        """
+        if fmt not in csv_export.EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {fmt} (사용 가능: {', '.join(csv_export.EXPORT_FORMATS)})")
+        
+        if group_by:
+            processed = await self.get_processed_data(
+                file_path=file_path, group_by=group_by, aggregate=aggregate, date_range=date_range
+            )
+            return csv_export.serialize([processed['data']], fmt, processed['metadata']['columns'])
+        
+        dataset = await self.get_dataset(file_path)
+        if not dataset:
+            return csv_export.serialize([], fmt, columns or [])
+        
+        row_ids = None
+        if filter:
+            row_ids = await asyncio.to_thread(self._apply_filter, dataset, None, filter)
+        if date_range:
+            row_ids = await asyncio.to_thread(
+                self._apply_date_filter, dataset, dataset.all_rows() if row_ids is None else row_ids, date_range
+            )
+        if row_ids is None:
+            row_ids = dataset.all_rows()
+        
+        selected_columns = columns or dataset.column_names
+        batches = csv_export.iter_dataset_rows(dataset, row_ids, selected_columns)
+        return csv_export.serialize(batches, fmt, selected_columns)
+    
+    def _scan_page(self, dataset: CSVDataset, filter_condition: Optional[str], start: int, limit: int):
+        """start 행부터 limit 개 (필터가 있으면 조건에 맞는 행만) - 반환: (행 번호, 뒤에 더 있는지)"""
+        if not filter_condition:
+            end = min(start + limit, dataset.row_count)
+            return np.arange(min(start, end), end), end < dataset.row_count
+        compiled = csv_filter.compile_filter(filter_condition)
+        return compiled.scan(dataset, csv_index.get_indexes(dataset), start, limit)
+    
     async def get_processed_data(
         self,
         file_path:str=None,
@@ -125,10 +310,13 @@ class CSVService:
         aggregate: str = None,
         date_range: str = None
     ) -> Dict[str, Any]:
-        """전처리된 CSV 데이터 조회"""
-        data=await self.read_csv(file_path)
+        """
+        전처리된 CSV 데이터 조회
+        - 관리자가 등록한 조합(materialized view)이고 데이터셋 버전이 같으면 미리 계산한 결과 반환
+        """
+        dataset = await self.get_dataset(file_path)
         
-        if not data:
+        if not dataset or dataset.row_count == 0:
                 return {
                     'success': True,
                     'data': [],
@@ -143,18 +331,76 @@ class CSVService:
                         }
                     }
                 }
-                
+        
+        if group_by:
+            key = csv_views.view_key(group_by, aggregate, date_range)
+            view = await asyncio.to_thread(csv_views.find_view, dataset.source_path, dataset.version, key)
+            if view:
+                result = dict(view['result'])
+                result['metadata'] = {
+                    **result['metadata'],
+                    'processing_applied': {
+                        'group_by': group_by,
+                        'aggregate': aggregate,
+                        'date_range': date_range
+                    },
+                    'materialized_view': view['name']
+                }
+                return result
+        
+        return await self._compute_processed(dataset, group_by, aggregate, date_range)
+    
+    async def refresh_materialized_views(self, file_path: str = None) -> Dict[str, Any]:
+        """
+        등록된 조합을 모두 다시 계산해 데이터셋 옆에 저장 (업로드 후 백그라운드 작업에서 호출)
+        - 계산에 실패한 조합은 건너뛰고 조회 시 실시간 계산
+        """
+        dataset = await self.get_dataset(file_path)
+        if not dataset:
+            return {'file_path': file_path, 'views': []}
+        
+        views = {}
+        for definition in csv_views.load_definitions():
+            try:
+                key = csv_views.view_key(definition['group_by'], definition.get('aggregate'), definition.get('date_range'))
+                result = await self._compute_processed(
+                    dataset, definition['group_by'], definition.get('aggregate'), definition.get('date_range')
+                )
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Materialized view {definition.get('name')} skipped: {e}")
+                continue
+            views[key] = {'name': definition['name'], 'result': result}
+        
+        await asyncio.to_thread(csv_views.write_views, dataset.source_path, dataset.version, views)
+        return {
+            'file_path': dataset.source_path,
+            'version': dataset.version,
+            'views': [view['name'] for view in views.values()]
+        }
+    
+    async def _compute_processed(
+        self,
+        dataset: CSVDataset,
+        group_by: Optional[str],
+        aggregate: Optional[str],
+        date_range: Optional[str]
+    ) -> Dict[str, Any]:
+        """날짜 필터 + 그룹화/집계 실시간 계산"""
         # 날짜 범위 필터링
+        row_ids = dataset.all_rows()
         if date_range:
-            data=self._apply_date_filter(data, date_range)
+            row_ids = await asyncio.to_thread(self._apply_date_filter, dataset, row_ids, date_range)
         
-        # 그룹화 및 집계
-        if group_by and aggregate:
-            processed_data=self._apply_aggregation(data, group_by, aggregate)
+        # 그룹화 및 집계 (행 번호 배열 위에서 컬럼 단위로 계산, 이벤트 루프 밖에서 실행)
+        rejected_rows = None
+        if group_by and aggregate and ':' in aggregate:
+            processed_data, rejected_rows = await asyncio.to_thread(
+                self._apply_aggregation, dataset, row_ids, group_by, aggregate
+            )
         elif group_by:
-            processed_data=self._apply_grouping(data, group_by)
+            processed_data = await asyncio.to_thread(self._apply_grouping, dataset, row_ids, group_by)
         else:
-            processed_data=data
+            processed_data = await asyncio.to_thread(dataset.records, row_ids)
             
         return {
             'success': True,
@@ -168,36 +414,23 @@ class CSVService:
                     'aggregate': aggregate,
                     'date_range': date_range
                 },
-                'original_count': len(data) if not group_by else None
+                'original_count': len(row_ids) if not group_by else None,
+                'rejected_rows': rejected_rows
             }
         }
     
-    def _apply_filter(self, data: List[Dict[str, Any]], filter_condition: str) -> List[Dict[str, Any]]:
-        """데이터 필터링 적용"""
-        try:
-            # 간단한 필터 형식: "column_name=value"
-            if '=' in filter_condition:
-                column, value = filter_condition.split('=', 1)
-                return [
-                    row for row in data 
-                    if row.get(column.strip()) == value.strip()
-                ]
-            return data
-        except Exception:
-            return data
-    
-    def _select_columns(self, data: List[Dict[str, Any]], columns: List[str]) -> List[Dict[str, Any]]:
-        """지정된 컬럼만 선택"""
-        try:
-            return [
-                {col: row.get(col) for col in columns if col in row}
-                for row in data
-            ]
-        except Exception:
-            return data
+    def _apply_filter(self, dataset: CSVDataset, row_ids: Optional[np.ndarray], filter_condition: str) -> np.ndarray:
+        """
+        데이터 필터링 적용 (조건에 맞는 행 번호 반환, row_ids 가 None 이면 전체 행 대상)
+        - 표현식 형식은 app.services.csv_filter 참고 (기존 "column_name=value" 형식 포함)
+        - 잘못된 표현식/없는 컬럼은 FilterError
+        """
+        compiled = csv_filter.compile_filter(filter_condition)
+        matched = compiled.row_ids(dataset, csv_index.get_indexes(dataset))
+        return _restrict(dataset, row_ids, matched)
     
-    def _apply_date_filter(self, data: List[Dict[str, Any]], date_range: str) -> List[Dict[str, Any]]:
-        """날짜 범위 필터링"""
+    def _apply_date_filter(self, dataset: CSVDataset, row_ids: np.ndarray, date_range: str) -> np.ndarray:
+        """날짜 범위 필터링 (조건에 맞는 행 번호 반환)"""
         try:
             # 예: "2024-01-01:2024-12-31" 형식
             if ':' in date_range:
@@ -207,89 +440,99 @@ class CSVService:
                 date_columns = ['date', 'created_at', 'timestamp', 'updated_at']
                 date_column = None
                 
-                if data:
-                    for col in date_columns:
-                        if col in data[0]:
-                            date_column = col
-                            break
+                for col in date_columns:
+                    if dataset.column(col) is not None:
+                        date_column = col
+                        break
                 
-                if date_column:
-                    filtered_data = []
-                    for row in data:
-                        try:
-                            row_date = row.get(date_column, '')
-                            if start_date <= row_date <= end_date:
-                                filtered_data.append(row)
-                        except:
-                            continue
-                    return filtered_data
+                if date_column is not None:
+                    matched = csv_index.get_indexes(dataset).between(date_column, start_date, end_date)
+                    if matched is None:
+                        mask = dataset.column(date_column).string_mask(
+                            lambda values: (values >= start_date) & (values <= end_date)
+                        )
+                        return row_ids[mask[row_ids]]
+                    return _restrict(dataset, row_ids, matched)
             
-            return data
+            return row_ids
         except Exception:
-            return data
+            return row_ids
     
-    def _apply_grouping(self, data: List[Dict[str, Any]], group_by: str) -> List[Dict[str, Any]]:
-        """그룹화 처리"""
-        try:
-            grouped = defaultdict(list)
-            
-            for row in data:
-                key = row.get(group_by, 'Unknown')
-                grouped[key].append(row)
-            
-            result = []
-            for group_key, group_data in grouped.items():
-                result.append({
-                    group_by: group_key,
-                    'count': len(group_data),
-                    'items': group_data
-                })
-            
-            return result
-        except Exception:
-            return data
+    def _apply_grouping(self, dataset: CSVDataset, row_ids: np.ndarray, group_by: str) -> List[Dict[str, Any]]:
+        """그룹화 처리 (그룹 키는 'region,date'처럼 여러 컬럼 지정 가능)"""
+        group_columns = csv_aggregate.parse_group_by(group_by)
+        group_ids, keys = csv_aggregate.group_rows(dataset, row_ids, group_columns)
+        
+        # 그룹 번호 순으로 한 번 정렬한 뒤 구간별로 잘라 변환
+        order = np.argsort(group_ids, kind='stable')
+        bounds = np.cumsum(np.bincount(group_ids, minlength=len(keys)))[:-1]
+        
+        result = []
+        for key, group_row_ids in zip(keys, np.split(row_ids[order], bounds)):
+            group = dict(zip(group_columns, key))
+            group['count'] = len(group_row_ids)
+            group['items'] = dataset.records(group_row_ids)
+            result.append(group)
+        return result
     
-    def _apply_aggregation(self, data: List[Dict[str, Any]], group_by: str, aggregate: str) -> List[Dict[str, Any]]:
-        """집계 처리"""
-        try:
-            # aggregate 형식: "column:function" (예: "amount:sum", "price:avg")
-            if ':' not in aggregate:
-                return self._apply_grouping(data, group_by)
-            
-            agg_column, agg_function = aggregate.split(':', 1)
-            grouped = defaultdict(list)
-            
-            for row in data:
-                key = row.get(group_by, 'Unknown')
-                try:
-                    value = float(row.get(agg_column, 0))
-                    grouped[key].append(value)
-                except (ValueError, TypeError):
-                    continue
-            
-            result = []
-            for group_key, values in grouped.items():
-                if not values:
-                    continue
-                
-                agg_result = {
-                    group_by: group_key,
-                    'count': len(values)
-                }
-                
-                if agg_function == 'sum':
-                    agg_result[f'{agg_column}_sum'] = sum(values)
-                elif agg_function == 'avg':
-                    agg_result[f'{agg_column}_avg'] = sum(values) / len(values)
-                elif agg_function == 'min':
-                    agg_result[f'{agg_column}_min'] = min(values)
-                elif agg_function == 'max':
-                    agg_result[f'{agg_column}_max'] = max(values)
-                else:
-                    agg_result[f'{agg_column}_sum'] = sum(values)
-                
-                result.append(agg_result)
-            
-            return result
-        except Exception:
-            return self._apply_grouping(data, group_by)
\ No newline at end of file
+    def _apply_aggregation(
+        self,
+        dataset: CSVDataset,
+        row_ids: np.ndarray,
+        group_by: str,
+        aggregate: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        집계 처리
+        - aggregate 형식: "column:function" (예: "amount:sum", "price:avg,p95;visitors:sum")
+        - 사용 가능 함수: sum, avg, min, max, count, median, p95, stddev, distinct
+        - 잘못된 집계 조건은 ValueError
+        - 반환: (집계 결과, 컬럼별 숫자가 아니어서 제외된 행 수)
+        """
+        specs = csv_aggregate.parse_aggregate(aggregate)
+        return csv_aggregate.aggregate(
+            dataset, row_ids, csv_aggregate.parse_group_by(group_by), specs
+        )
+
+
+def _restrict(dataset: CSVDataset, row_ids: Optional[np.ndarray], matched: np.ndarray) -> np.ndarray:
+    """찾은 행 번호를 현재 대상 행으로 제한 (전체 행이면 그대로)"""
+    if row_ids is None or len(row_ids) == dataset.row_count:
+        return matched
+    return np.intersect1d(row_ids, matched, assume_unique=True)
+
+
+def _filter_hash(filter_condition: Optional[str]) -> str:
+    return hashlib.sha1((filter_condition or '').encode('utf-8')).hexdigest()[:16]
+
+
+def _encode_cursor(last_row_id: int, dataset: CSVDataset, filter_condition: Optional[str]) -> str:
+    """다음 페이지 커서 (마지막 행 번호 + 데이터 버전 + 필터 해시를 담은 불투명 문자열)"""
+    payload = {"r": last_row_id, "v": dataset.version, "f": _filter_hash(filter_condition)}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str, dataset: CSVDataset, filter_condition: Optional[str]) -> int:
+    """커서에서 마지막 행 번호 추출 (데이터/필터가 바뀌었으면 ValueError)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        last_row_id = int(payload["r"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("잘못된 cursor 입니다")
+    if payload.get("v") != dataset.version:
+        raise ValueError("데이터가 변경되어 cursor 를 사용할 수 없습니다. 처음부터 다시 조회하세요")
+    if payload.get("f") != _filter_hash(filter_condition):
+        raise ValueError("cursor 를 만든 필터와 현재 필터가 다릅니다")
+    return last_row_id
+
+
+def _backup_file(file_path: str, backup_path: str) -> None:
+    """
+    기존 파일 백업 (원본은 그대로 둠)
+    - 하드 링크는 복사 없이 만들어지고, 업로드 후 os.replace 로 원본 이름이 새 파일을 가리켜도 이전 내용을 유지
+    - 하드 링크를 지원하지 않는 파일 시스템이면 복사
+    """
+    try:
+        os.link(file_path, backup_path)
+    except OSError:
+        shutil.copy2(file_path, backup_path)
@@ -0,0 +1,184 @@
+# backend/app/services/csv_snapshot.py
+"""
+CSV 데이터셋 컬럼 스냅샷 (<파일명>.snap)
+
+레이아웃
+    magic(8) | 포맷 버전(u32) | 헤더 길이(u32) | 헤더 JSON | 패딩 | 컬럼 버퍼...
+    - 헤더: 원본 (mtime, size), 행 수, 컬럼별 종류와 버퍼 위치(데이터 영역 기준 offset, 바이트 수, dtype)
+    - 숫자: float64 values
+    - 범주: int32 codes + 고유값 문자열(offsets int64 + UTF-8 blob)
+    - 텍스트: 행별 문자열(offsets int64 + UTF-8 blob)
+    - 모든 버퍼는 64바이트 정렬
+
+워커들은 같은 파일을 읽기 전용으로 mmap 하므로 페이지 캐시 한 벌을 공유함
+"""
+import json
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.csv_dataset import CSVDataset, CategoryColumn, Column, NumericColumn, TextColumn
+
+MAGIC = b"CSVSNAP\x00"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sII")
+
+
+class MappedTextColumn(TextColumn):
+    """
+    스냅샷의 텍스트 컬럼
+    - 페이지 조회는 해당 행만 디코딩하고, 전체 값은 처음 필요할 때 한 번만 디코딩
+    """
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray):
+        self.offsets = offsets
+        self.blob = blob
+        self._values: Optional[np.ndarray] = None
+
+    @property
+    def values(self) -> np.ndarray:
+        if self._values is None:
+            self._values = _decode_strings(self.offsets, self.blob)
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def take(self, row_ids: np.ndarray) -> List[Any]:
+        if self._values is not None:
+            return self._values[row_ids].tolist()
+        offsets, blob = self.offsets, self.blob
+        return [bytes(blob[offsets[i]:offsets[i + 1]]).decode('utf-8') for i in row_ids]
+
+
+def snapshot_path(csv_path: str) -> str:
+    return f"{csv_path}.snap"
+
+
+def write_snapshot(dataset: CSVDataset, signature: Tuple[int, int]) -> str:
+    """
+    데이터셋을 스냅샷 파일로 저장
+    - 같은 폴더의 임시 파일에 쓴 뒤 os.replace 로 교체 (읽는 중인 워커는 기존 파일을 계속 사용)
+    """
+    buffers: List[np.ndarray] = []
+    columns = []
+
+    def add(array: np.ndarray) -> List[Any]:
+        offset = sum(_aligned(b.nbytes) for b in buffers)
+        buffers.append(np.ascontiguousarray(array))
+        return [offset, array.nbytes, array.dtype.str]
+
+    for name, column in dataset.columns.items():
+        if isinstance(column, NumericColumn):
+            spec = {"kind": "numeric", "is_integer": column.is_integer, "values": add(column.values)}
+        elif isinstance(column, CategoryColumn):
+            offsets, blob = _encode_strings(column.categories)
+            spec = {
+                "kind": "category",
+                "codes": add(column.codes.astype(np.int32, copy=False)),
+                "offsets": add(offsets),
+                "blob": add(blob)
+            }
+        else:
+            offsets, blob = _encode_strings(column.values)
+            spec = {"kind": "text", "offsets": add(offsets), "blob": add(blob)}
+        spec["name"] = name
+        columns.append(spec)
+
+    header = json.dumps({
+        "source": list(signature),
+        "row_count": dataset.row_count,
+        "columns": columns
+    }, ensure_ascii=False).encode('utf-8')
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    path = snapshot_path(dataset.source_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=".snap-", dir=os.path.dirname(path) or ".")
+    try:
+        os.chmod(tmp_path, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            f.write(header)
+            f.write(b"\x00" * (data_start - _PREAMBLE.size - len(header)))
+            for buffer in buffers:
+                f.write(buffer.tobytes())
+                f.write(b"\x00" * (_aligned(buffer.nbytes) - buffer.nbytes))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def open_snapshot(csv_path: str, signature: Tuple[int, int]) -> Optional[CSVDataset]:
+    """
+    스냅샷을 mmap 으로 열어 데이터셋 구성
+    - 없거나, 포맷 버전/원본 (mtime, size)가 다르면 None
+    """
+    path = snapshot_path(csv_path)
+    try:
+        mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    except (OSError, ValueError):
+        return None
+    if len(mapped) < _PREAMBLE.size:
+        return None
+
+    magic, version, header_length = _PREAMBLE.unpack(bytes(mapped[:_PREAMBLE.size]))
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    try:
+        header = json.loads(bytes(mapped[_PREAMBLE.size:_PREAMBLE.size + header_length]).decode('utf-8'))
+    except ValueError:
+        return None
+    if tuple(header.get("source", ())) != tuple(signature):
+        return None
+
+    data = mapped[_aligned(_PREAMBLE.size + header_length):]
+
+    def view(spec: List[Any]) -> np.ndarray:
+        offset, nbytes, dtype = spec
+        # 잘린 파일은 짧은 배열로 조용히 읽히지 않도록 크기 확인
+        if offset + nbytes > len(data):
+            raise ValueError("snapshot is truncated")
+        return data[offset:offset + nbytes].view(np.dtype(dtype))
+
+    try:
+        columns: "OrderedDict[str, Column]" = OrderedDict()
+        for spec in header["columns"]:
+            if spec["kind"] == "numeric":
+                column: Column = NumericColumn(view(spec["values"]), spec["is_integer"])
+            elif spec["kind"] == "category":
+                column = CategoryColumn(view(spec["codes"]), _decode_strings(view(spec["offsets"]), view(spec["blob"])))
+            else:
+                column = MappedTextColumn(view(spec["offsets"]), view(spec["blob"]))
+            if len(column) != header["row_count"]:
+                raise ValueError("snapshot column length mismatch")
+            columns[spec["name"]] = column
+    except (KeyError, TypeError, ValueError, UnicodeDecodeError):
+        # 손상된 스냅샷은 없는 것으로 취급 (호출한 쪽에서 다시 생성)
+        return None
+
+    return CSVDataset(columns, header["row_count"], csv_path)
+
+
+def _encode_strings(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [str(value).encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _decode_strings(offsets: np.ndarray, blob: np.ndarray) -> np.ndarray:
+    raw = blob.tobytes()
+    decoded = np.empty(len(offsets) - 1, dtype=object)
+    decoded[:] = [raw[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+    return decoded
+
+
+def _aligned(size: int) -> int:
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
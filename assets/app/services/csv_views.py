@@ -0,0 +1,89 @@
+# backend/app/services/csv_views.py
+"""
+집계 결과 미리 계산 (materialized view)
+
+- 관리자가 자주 쓰는 group_by/aggregate/date_range 조합을 정의 파일(MATERIALIZED_VIEWS_PATH)에 등록
+- 업로드 시 백그라운드 작업이 조합별 결과를 계산해 CSV 옆 <파일명>.views.json 에 데이터셋 버전과 함께 저장
+- /data/csv/processed 는 같은 조합 + 같은 버전이면 저장된 결과를 바로 반환
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services import csv_aggregate
+
+
+def load_definitions() -> List[Dict[str, Any]]:
+    """등록된 뷰 정의 목록"""
+    try:
+        with open(settings.MATERIALIZED_VIEWS_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_definitions(definitions: List[Dict[str, Any]]) -> None:
+    _write_json(settings.MATERIALIZED_VIEWS_PATH, definitions)
+
+
+def view_key(group_by: Optional[str], aggregate: Optional[str], date_range: Optional[str]) -> str:
+    """
+    조합 키 (공백/대소문자 차이는 같은 조합으로 취급)
+    - 잘못된 aggregate 는 ValueError
+    """
+    group = ",".join(csv_aggregate.parse_group_by(group_by or ""))
+    if aggregate and ':' in aggregate:
+        aggregate = ";".join(
+            f"{column}:{','.join(functions)}"
+            for column, functions in csv_aggregate.parse_aggregate(aggregate)
+        )
+    return "|".join((group, (aggregate or "").strip(), (date_range or "").strip()))
+
+
+def views_path(csv_path: str) -> str:
+    return f"{csv_path}.views.json"
+
+
+def write_views(csv_path: str, version: str, views: Dict[str, Dict[str, Any]]) -> None:
+    """계산한 결과 저장 (데이터셋 버전과 함께)"""
+    _write_json(views_path(csv_path), {"version": version, "views": views})
+
+
+# 파일별로 읽어 둔 결과 {csv_path: ((mtime_ns, size), 저장 내용)}
+_loaded: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_loaded_lock = threading.Lock()
+
+
+def find_view(csv_path: str, version: Optional[str], key: str) -> Optional[Dict[str, Any]]:
+    """저장된 결과 조회 (없거나 데이터셋 버전이 다르면 None)"""
+    path = views_path(csv_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _loaded_lock:
+        cached = _loaded.get(csv_path)
+        if not cached or cached[0] != signature:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    cached = _loaded[csv_path] = (signature, json.load(f))
+            except (OSError, ValueError):
+                return None
+    stored = cached[1]
+    if stored.get("version") != version:
+        return None
+    return stored.get("views", {}).get(key)
+
+
+def _write_json(path: str, data: Any) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
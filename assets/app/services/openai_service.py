@@ -1,9 +1,45 @@
 # backend/app/services/openai_service.py
+import json
+from typing import Any, Dict, Optional
+
 from app.core.config import settings
 import openai
 
 class OpenAIService:
+    """OpenAI 요약 서비스"""
+    SUMMARY_PROMPT = (
+        "다음은 경상남도 관광 동향 월간 자료에서 추출한 본문입니다. "
+        "반드시 본문에 나타난 정보만 사용하여 아래 키를 가진 JSON 객체로 답하세요.\n"
+        "- summary: 전체 요약 (문자열)\n"
+        "- key_points: 핵심 내용 목록 (문자열 배열)\n"
+        "- metrics: 본문에 나온 주요 수치 (키-값 객체)\n"
+        "- recommendations: 시사점 및 제언 (문자열 배열)"
+    )
+    
     def __init__(self):
         openai.api_key = settings.OPENAI_API_KEY
         self.model = settings.OPENAI_MODEL
-        self.max_tokens = settings.OPENAI_MAX_TOKENS
\ No newline at end of file
+        self.max_tokens = settings.OPENAI_MAX_TOKENS
+        self.temperature = settings.OPENAI_TEMPERATURE
+        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+    
+    def summarize(self, text: str, prompt: Optional[str] = None) -> Dict[str, Any]:
+        """본문 텍스트를 요약하여 분석 결과(dict) 반환"""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": prompt or self.SUMMARY_PROMPT},
+                {"role": "user", "content": text}
+            ]
+        )
+        result = json.loads(response.choices[0].message.content or "{}")
+        
+        return {
+            "summary": str(result.get("summary", "")),
+            "key_points": list(result.get("key_points", [])),
+            "metrics": dict(result.get("metrics", {})),
+            "recommendations": list(result.get("recommendations", []))
+        }
@@ -1,21 +1,177 @@
 # backend/app/services/proxy_service.py
+import asyncio
+import time
 import httpx
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from urllib.parse import urlsplit
+from app.core.config import settings
 from app.utils.logger import logger
+from app.utils.singleflight import SingleFlight
+
+class _CountingStream(httpx.AsyncByteStream):
+    """응답 본문 스트림 (닫힐 때 요청 완료로 기록)"""
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+    
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+    
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+        await self._stream.aclose()
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """
+    요청 수를 세는 전송 계층 래퍼
+    - 요청 시작부터 응답 본문이 닫힐 때까지를 진행 중으로 계산 (HTTP/1.1 에서는 사용 중인 연결 수와 같음)
+    - httpx/httpcore 내부 풀 구조에 의존하지 않음
+    """
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.in_flight = 0
+        self.requests_total = 0
+        self.errors_total = 0
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.requests_total += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.in_flight -= 1
+            self.errors_total += 1
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, self._request_done),
+            extensions=response.extensions
+        )
+    
+    async def aclose(self):
+        await self._transport.aclose()
+    
+    def _request_done(self):
+        self.in_flight -= 1
+
 
 class ProxyService:
     """외부 API 프록시 서비스"""
-    def __init__(self):
-        self.timeout = httpx.Timeout(30.0)  # 30초 타임아웃
-        self.limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
-        
-        # 외부 API 엔드포인트 설정
-        self.external_apis = {
-            "weather": "https://api.openweathermap.org/data/2.5",
-            # 더 많은 API 추가 가능
+    def __init__(self, external_apis: Optional[Dict[str, str]] = None):
+        self.timeout = httpx.Timeout(settings.PROXY_TIMEOUT)
+        self.limits = httpx.Limits(
+            max_keepalive_connections=settings.PROXY_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=settings.PROXY_MAX_CONNECTIONS,
+            keepalive_expiry=settings.PROXY_KEEPALIVE_EXPIRY
+        )
+        
+        # 외부 API 엔드포인트 설정 (소스별 base URL)
+        self.external_apis = dict(external_apis or settings.PROXY_SOURCE_BASE_URLS)
+        
+        # 앱 수명 동안 공유하는 클라이언트 (커넥션 풀 재사용)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[_CountingTransport] = None
+        
+        # 동일한 (source, filters, limit) 동시 요청은 외부 호출 1회로 합침
+        self._single_flight = SingleFlight()
+        
+        # 풀 사용 통계
+        self._in_flight = 0
+        self._requests_total = 0
+        self._acquire_count = 0
+        self._acquire_total = 0.0
+        self._acquire_max = 0.0
+    
+    async def start(self, warm_up: bool = False):
+        """공유 클라이언트 생성 (앱 시작 시)"""
+        self._get_client()
+        if warm_up:
+            await self.warm_up()
+    
+    async def close(self):
+        """공유 클라이언트 종료 (앱 종료 시)"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    async def warm_up(self, sources: Optional[List[str]] = None):
+        """설정된 소스에 미리 연결을 열어 첫 요청의 DNS/TCP/TLS 비용 제거"""
+        client = self._get_client()
+        targets = sources or list(self.external_apis.keys())
+        
+        async def open_connection(source: str):
+            parts = urlsplit(self.external_apis[source])
+            try:
+                await client.head(f"{parts.scheme}://{parts.netloc}/")
+                logger.info(f"Warmed up connection to {source}")
+            except httpx.HTTPError as e:
+                logger.warning(f"Warm-up failed for {source}: {e}")
+        
+        await asyncio.gather(*[
+            open_connection(source) for source in targets
+            if source in self.external_apis
+        ])
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        커넥션 풀 통계
+        - http_*: 전송 계층에서 센 실제 HTTP 요청 (재시도/리다이렉트 포함)
+        - *_requests: 외부 데이터 조회 단위 (동일 요청 합치기 이후)
+        - acquire 시간: 요청 시작부터 헤더 전송까지 (풀 대기 + 신규 연결 수립)
+        """
+        transport = self._transport
+        return {
+            "client_open": self._client is not None,
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry
+            },
+            "http_in_flight": transport.in_flight if transport else 0,
+            "http_requests_total": transport.requests_total if transport else 0,
+            "http_errors_total": transport.errors_total if transport else 0,
+            "in_flight_requests": self._in_flight,
+            "requests_total": self._requests_total,
+            "avg_acquire_ms": round(self._acquire_total / self._acquire_count * 1000, 2) if self._acquire_count else 0.0,
+            "max_acquire_ms": round(self._acquire_max * 1000, 2)
         }
     
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # 전송 계층을 직접 만들 때는 limits 를 전송 계층에 전달
+            self._transport = _CountingTransport(httpx.AsyncHTTPTransport(limits=self.limits))
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=self._transport,
+                event_hooks={"request": [self._on_request]}
+            )
+        return self._client
+    
+    async def _on_request(self, request: httpx.Request):
+        """요청마다 httpcore trace를 연결하여 커넥션 획득 시간 측정"""
+        started = time.perf_counter()
+        acquired = False
+        
+        async def trace(event_name: str, info: Dict[str, Any]):
+            nonlocal acquired
+            if not acquired and event_name.endswith("send_request_headers.started"):
+                acquired = True
+                self._record_acquire(time.perf_counter() - started)
+        
+        request.extensions["trace"] = trace
+    
+    def _record_acquire(self, elapsed: float):
+        self._acquire_count += 1
+        self._acquire_total += elapsed
+        self._acquire_max = max(self._acquire_max, elapsed)
+    
     async def fetch_external_data(
         self, 
         source: str, 
@@ -23,44 +179,59 @@ class ProxyService:
         limit: int = 1000
     ) -> Dict[str, Any]:
         """외부 API에서 데이터 가져오기"""
-        
+        return await self._single_flight.do(
+            (source, filters, limit),
+            lambda: self._fetch_external_data(source, filters, limit)
+        )
+    
+    async def _fetch_external_data(
+        self, 
+        source: str, 
+        filters: Optional[str], 
+        limit: int
+    ) -> Dict[str, Any]:
+        """외부 API 호출 (동일 요청 합치기 이후 실제 실행)"""
         if source not in self.external_apis:
             raise ValueError(f"Unsupported source: {source}")
         
         base_url = self.external_apis[source]
+        client = self._get_client()
         
-        async with httpx.AsyncClient(timeout=self.timeout, limits=self.limits) as client:
-            try:
-                # 소스별 데이터 가져오기 로직
-                if source == "jsonplaceholder":
-                    data = await self._fetch_jsonplaceholder(client, base_url, filters, limit)
-                elif source == "github":
-                    data = await self._fetch_github(client, base_url, filters, limit)
-                elif source == "weather":
-                    data = await self._fetch_weather(client, base_url, filters, limit)
-                elif source == "news":
-                    data = await self._fetch_news(client, base_url, filters, limit)
-                else:
-                    raise ValueError(f"No handler for source: {source}")
-                
-                return {
-                    "data": data,
-                    "metadata": {
-                        "source": source,
-                        "filters": filters,
-                        "limit": limit,
-                        "total_count": len(data),
-                        "fetched_at": datetime.utcnow().isoformat()
-                    }
+        self._in_flight += 1
+        self._requests_total += 1
+        try:
+            # 소스별 데이터 가져오기 로직
+            if source == "jsonplaceholder":
+                data = await self._fetch_jsonplaceholder(client, base_url, filters, limit)
+            elif source == "github":
+                data = await self._fetch_github(client, base_url, filters, limit)
+            elif source == "weather":
+                data = await self._fetch_weather(client, base_url, filters, limit)
+            elif source == "news":
+                data = await self._fetch_news(client, base_url, filters, limit)
+            else:
+                raise ValueError(f"No handler for source: {source}")
+            
+            return {
+                "data": data,
+                "metadata": {
+                    "source": source,
+                    "filters": filters,
+                    "limit": limit,
+                    "total_count": len(data),
+                    "fetched_at": datetime.utcnow().isoformat()
                 }
-                
-            except httpx.TimeoutException:
-                raise TimeoutError(f"Timeout when fetching from {source}")
-            except httpx.ConnectError:
-                raise ConnectionError(f"Connection error when fetching from {source}")
-            except Exception as e:
-                logger.error(f"Error fetching from {source}: {e}")
-                raise
+            }
+            
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Timeout when fetching from {source}")
+        except httpx.ConnectError:
+            raise ConnectionError(f"Connection error when fetching from {source}")
+        except Exception as e:
+            logger.error(f"Error fetching from {source}: {e}")
+            raise
+        finally:
+            self._in_flight -= 1
     
     async def _fetch_jsonplaceholder(
         self, 
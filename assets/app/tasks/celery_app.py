@@ -1,3 +1,132 @@
 # Celery Settings
+# backend/app/tasks/celery_app.py
 from celery import Celery
-import os
\ No newline at end of file
+from celery.schedules import crontab
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable
+import asyncio
+import os
+import threading
+import uuid
+
+from app.core.config import settings
+from app.utils.logger import logger
+
+# 로컬 파일시스템 브로커 사용 시 메시지/결과 저장 위치
+CELERY_LOCAL_DIR = os.path.join(os.path.dirname(settings.UPLOAD_DIR), "celery")
+
+
+def _broker_settings() -> dict:
+    """
+    브로커/결과 백엔드 설정
+    - CELERY_TASK_ALWAYS_EAGER: 외부 브로커 없이 요청 프로세스 안에서 즉시 실행
+    - filesystem:// 브로커: Redis 없이 로컬 워커 프로세스로 실행
+    - 그 외: 설정된 브로커(Redis 등) 사용
+    """
+    if settings.CELERY_TASK_ALWAYS_EAGER:
+        return {
+            "broker_url": "memory://",
+            "result_backend": "cache+memory://",
+        }
+    
+    if settings.CELERY_BROKER_URL.startswith("filesystem://"):
+        queue_dir = os.path.join(CELERY_LOCAL_DIR, "queue")
+        processed_dir = os.path.join(CELERY_LOCAL_DIR, "processed")
+        results_dir = os.path.join(CELERY_LOCAL_DIR, "results")
+        for path in (queue_dir, processed_dir, results_dir):
+            os.makedirs(path, exist_ok=True)
+        return {
+            "broker_url": settings.CELERY_BROKER_URL,
+            "broker_transport_options": {
+                "data_folder_in": queue_dir,
+                "data_folder_out": queue_dir,
+                "data_folder_processed": processed_dir,
+            },
+            "result_backend": f"file://{os.path.abspath(results_dir)}",
+        }
+    
+    return {
+        "broker_url": settings.CELERY_BROKER_URL,
+        "result_backend": settings.CELERY_RESULT_BACKEND,
+    }
+
+
+celery_app = Celery(
+    "tourism_analytics",
+    include=["app.tasks.report_tasks", "app.tasks.data_tasks"]
+)
+
+celery_app.conf.update(
+    **_broker_settings(),
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    task_eager_propagates=True,
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_track_started=True,  # STARTED 상태 기록 (진행 상황 조회용)
+    task_store_eager_result=True,  # eager 모드에서도 /tasks/{task_id} 로 결과 조회
+    result_expires=86400,
+    timezone="Asia/Seoul",
+    enable_utc=False,
+    beat_schedule={
+        # 매월 MONTHLY_REPORT_DAY일 MONTHLY_REPORT_HOUR시 월간 리포트 생성
+        "generate-monthly-report": {
+            "task": "app.tasks.report_tasks.generate_monthly_report",
+            "schedule": crontab(
+                minute=0,
+                hour=settings.MONTHLY_REPORT_HOUR,
+                day_of_month=settings.MONTHLY_REPORT_DAY
+            ),
+        },
+    },
+)
+
+
+# eager 모드에서 작업을 이벤트 루프 밖에서 실행하기 위한 스레드
+_eager_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="celery-eager")
+
+
+def dispatch(task, *args: Any) -> str:
+    """
+    작업 등록 후 task_id 반환
+    - eager 모드의 .delay() 는 호출한 스레드에서 체인 전체를 바로 실행하므로,
+      async 라우트에서 부를 때는 별도 스레드에서 실행하고 task_id 만 먼저 반환
+    """
+    if not settings.CELERY_TASK_ALWAYS_EAGER:
+        return task.delay(*args).id
+    
+    task_id = uuid.uuid4().hex
+    
+    def log_failure(done):
+        if done.exception():
+            logger.error(f"Eager task {task.name}[{task_id}] failed: {done.exception()}")
+    
+    _eager_executor.submit(task.apply_async, args, task_id=task_id).add_done_callback(log_failure)
+    return task_id
+
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """
+    작업 안에서 코루틴 실행
+    - 워커 프로세스에서는 asyncio.run
+    - 이미 이벤트 루프가 도는 스레드(eager 모드로 라우트에서 직접 실행된 경우)면 별도 스레드의 새 루프에서 실행
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    result = {}
+    
+    def target():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
+    
+    thread = threading.Thread(target=target, name="celery-async")
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
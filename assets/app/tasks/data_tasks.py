@@ -0,0 +1,51 @@
+# backend/app/tasks/data_tasks.py
+from typing import Any, Dict, Optional
+
+from app.cache.keys import proxy_data_key, proxy_source_tag
+from app.core.config import settings
+from app.services.cache_service import CacheService
+from app.services.csv_service import CSVService
+from app.services.proxy_service import ProxyService
+from app.tasks.celery_app import celery_app, run_async
+from app.utils.logger import logger
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=3
+)
+def refresh_external_data_task(self, source: str, limit: int = 1000) -> Dict[str, Any]:
+    """외부 데이터 다시 가져와 기본 조회(필터 없음) 캐시 채우기"""
+    
+    async def refresh() -> int:
+        proxy_service = ProxyService()
+        cache_service = CacheService(settings.REDIS_URL)
+        await cache_service.connect()
+        try:
+            result = await proxy_service.fetch_external_data(source=source, limit=limit)
+            await cache_service.set(
+                proxy_data_key(source, None, limit),
+                result,
+                ttl=settings.CACHE_TTL_EXTERNAL_API,
+                tags=[proxy_source_tag(source)]
+            )
+            return len(result.get("data", []))
+        finally:
+            await proxy_service.close()
+            await cache_service.close()
+    
+    count = run_async(refresh())
+    logger.info(f"Refreshed external data for {source}: {count} items")
+    return {"source": source, "count": count}
+
+
+@celery_app.task(bind=True, max_retries=2, default_retry_delay=30)
+def refresh_materialized_views_task(self, file_path: Optional[str] = None) -> Dict[str, Any]:
+    """업로드된 CSV 에 대해 등록된 집계 조합(materialized view) 다시 계산"""
+    result = run_async(CSVService(settings.UPLOAD_DIR).refresh_materialized_views(file_path))
+    logger.info(f"Materialized views refreshed for {result['file_path']}: {result['views']}")
+    return result
@@ -1,20 +1,163 @@
 # backend/app/tasks/report_tasks.py
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-# @celery_app.task
-# def generate_monthly_report():
-#     """월간 리포트 자동 생성"""
-#     # 1. 최신 PDF 다운로드
-#     pdf_path = download_latest_pdf()
+import fitz
+import openai
+from celery import chain
+
+from app.cache.keys import report_tag
+from app.core.config import settings
+from app.services.cache_service import CacheService
+from app.services.openai_service import OpenAIService
+from app.tasks.celery_app import celery_app, run_async
+from app.utils.logger import logger
+
+# 재시도 대상 (일시적인 외부 오류)
+RETRYABLE_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.RateLimitError,
+    openai.InternalServerError
+)
+RETRY_OPTIONS = {
+    "bind": True,
+    "autoretry_for": RETRYABLE_ERRORS,
+    "retry_backoff": True,
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+    "max_retries": 3
+}
+
+# 요약 시 모델에 전달하는 본문 최대 길이
+MAX_SUMMARY_CHARS = 100_000
+
+
+@celery_app.task
+def generate_monthly_report(pdf_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    월간 리포트 자동 생성
+    - PDF 텍스트 추출 -> OpenAI 요약 -> 리포트 저장 순서로 체인 실행
+    - pdf_path가 없으면 업로드 폴더의 최신 PDF 사용
+    """
+    pdf_path = pdf_path or _latest_pdf()
+    if not pdf_path:
+        logger.warning("No source PDF found for monthly report")
+        return {"status": "skipped", "reason": "no source pdf"}
+    
+    report_id = datetime.now().strftime("%Y%m") + "_" + uuid.uuid4().hex[:8]
+    workflow = chain(
+        extract_pdf_text.s(pdf_path, report_id),
+        summarize_report.s(report_id),
+        save_report.s(report_id, os.path.basename(pdf_path))
+    ).apply_async()
+    
+    return {"status": "queued", "report_id": report_id, "task_id": workflow.id}
+
+
+@celery_app.task(**RETRY_OPTIONS)
+def extract_pdf_text(self, pdf_path: str, report_id: str) -> str:
+    """PDF 페이지 텍스트 추출 후 작업 파일 경로 반환"""
+    work_dir = os.path.join(settings.REPORTS_DIR, "work")
+    os.makedirs(work_dir, exist_ok=True)
+    
+    pages: List[str] = []
+    with fitz.open(pdf_path) as pdf:
+        total = len(pdf)
+        for page_num, page in enumerate(pdf):
+            pages.append(page.get_text())
+            # 20페이지마다 진행 상황 기록
+            if page_num % 20 == 0:
+                self.update_state(
+                    state="PROGRESS",
+                    meta={"step": "extract", "current": page_num + 1, "total": total}
+                )
+    
+    text_path = os.path.join(work_dir, f"{report_id}.json")
+    with open(text_path, "w", encoding="utf-8") as f:
+        json.dump({"pdf_path": pdf_path, "pages": pages}, f, ensure_ascii=False)
+    
+    return text_path
+
+
+@celery_app.task(**RETRY_OPTIONS)
+def summarize_report(self, text_path: str, report_id: str) -> Dict[str, Any]:
+    """추출된 본문을 OpenAI로 요약"""
+    self.update_state(state="PROGRESS", meta={"step": "summarize"})
+    
+    with open(text_path, "r", encoding="utf-8") as f:
+        pages = json.load(f)["pages"]
+    text = "\n".join(pages)[:MAX_SUMMARY_CHARS]
+    
+    analysis = OpenAIService().summarize(text)
+    
+    # 요약이 끝나면 작업 파일 정리
+    try:
+        os.remove(text_path)
+    except OSError:
+        pass
+    
+    return analysis
+
+
+@celery_app.task(**RETRY_OPTIONS)
+def save_report(self, analysis: Dict[str, Any], report_id: str, filename: str) -> Dict[str, Any]:
+    """요약 결과를 리포트로 저장하고 리포트 캐시 무효화"""
+    self.update_state(state="PROGRESS", meta={"step": "save"})
     
-#     # 2. PDF 내용 추출
-#     content = extract_pdf_content(pdf_path)
+    now = datetime.now()
+    report = {
+        "report_id": report_id,
+        "filename": filename,
+        "created_at": now.isoformat(),
+        "completed_at": now.isoformat(),
+        "result": {
+            "summary": {
+                "report_id": report_id,
+                "year": now.year,
+                "month": now.month,
+                "summary": analysis.get("summary", "")
+            },
+            "key_points": analysis.get("key_points", []),
+            "metrics": analysis.get("metrics", {}),
+            "recommendations": analysis.get("recommendations", [])
+        }
+    }
     
-#     # 3. OpenAI 분석
-#     analysis = openai_client.analyze_pdf(content)
+    os.makedirs(settings.REPORTS_DIR, exist_ok=True)
+    report_path = os.path.join(settings.REPORTS_DIR, f"{report_id}.json")
+    temp_path = report_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, report_path)
     
-#     # 4. 리포트 생성 및 저장
-#     report = create_report(analysis)
-#     save_report(report)
+    run_async(_invalidate_report_cache())
     
-#     # 5. 캐시 업데이트
-#     update_cache(report)
\ No newline at end of file
+    return {"status": "completed", "report_id": report_id, "path": report_path}
+
+
+def _latest_pdf() -> Optional[str]:
+    """업로드 폴더에서 가장 최근 PDF 경로"""
+    if not os.path.isdir(settings.UPLOAD_DIR):
+        return None
+    pdfs = [
+        os.path.join(settings.UPLOAD_DIR, name)
+        for name in os.listdir(settings.UPLOAD_DIR)
+        if name.lower().endswith(".pdf")
+    ]
+    return max(pdfs, key=os.path.getmtime) if pdfs else None
+
+
+async def _invalidate_report_cache():
+    cache_service = CacheService(settings.REDIS_URL)
+    await cache_service.connect()
+    try:
+        deleted = await cache_service.invalidate_tags(report_tag())
+        logger.info(f"Invalidated {deleted} report cache entries")
+    finally:
+        await cache_service.close()
@@ -0,0 +1,30 @@
+# backend/app/utils/singleflight.py
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나의 실행으로 합침
+    - 먼저 들어온 호출이 실제 작업을 시작하고, 나머지는 그 결과를 함께 기다림
+    - 작업은 별도 태스크로 실행되므로 먼저 호출한 요청이 취소되어도 나머지에는 영향 없음
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리는 쪽이 모두 취소된 경우에도 예외가 경고로 남지 않도록 소비
+        if not task.cancelled():
+            task.exception()
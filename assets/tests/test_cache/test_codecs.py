@@ -0,0 +1,49 @@
+# backend/tests/test_cache/test_codecs.py
+
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+
+from app.cache.codecs import MAGIC, CacheCodec, CodecError
+
+class Item(BaseModel):
+    name: str
+    created: datetime
+
+def test_roundtrip_small_value_is_not_compressed():
+    codec = CacheCodec("json", "zlib", compress_min_bytes=1024)
+    raw = codec.encode({"data": [1, 2, 3]})
+
+    assert raw[0] == MAGIC
+    assert raw[1] & 0x0F == 0
+    assert codec.decode(raw) == {"data": [1, 2, 3]}
+
+def test_large_value_is_compressed():
+    codec = CacheCodec("json", "zlib", compress_min_bytes=1024)
+    value = {"rows": [{"region": "창원시", "visitors": i} for i in range(1000)]}
+    raw, size = codec.encode_sized(value)
+
+    assert len(raw) < size
+    assert codec.decode_sized(raw) == (value, size)
+
+def test_reads_legacy_json_and_other_codecs():
+    # 이전 방식으로 저장된 값과 다른 설정으로 저장된 값 모두 읽을 수 있어야 함
+    assert CacheCodec().decode('{"a": 1}') == {"a": 1}
+    raw = CacheCodec("json", "zlib", compress_min_bytes=0).encode([1, 2])
+    assert CacheCodec().decode(raw) == [1, 2]
+
+def test_converts_datetime_and_pydantic_values():
+    codec = CacheCodec("json", "none")
+    value = {"item": Item(name="리포트", created=datetime(2024, 5, 1, 9, 30)), "at": datetime(2024, 1, 1)}
+
+    assert codec.decode(codec.encode(value)) == {
+        "item": {"name": "리포트", "created": "2024-05-01T09:30:00"},
+        "at": "2024-01-01T00:00:00"
+    }
+
+def test_unknown_codec_raises():
+    with pytest.raises(CodecError):
+        CacheCodec().decode(bytes((MAGIC, 0xF0)) + b"{}")
+    with pytest.raises(ValueError):
+        CacheCodec("pickle")
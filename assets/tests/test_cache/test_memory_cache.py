@@ -0,0 +1,70 @@
+# backend/tests/test_cache/test_memory_cache.py
+
+import time
+
+from app.cache.memory_cache import MemoryCache
+
+def test_evicts_least_recently_used_by_bytes():
+    cache = MemoryCache(max_bytes=30, max_entry_bytes=30)
+    cache.set("a", "x" * 10, ttl=60)
+    cache.set("b", "y" * 10, ttl=60)
+    cache.set("c", "z" * 10, ttl=60)
+
+    # a 를 최근 사용으로 만들면 다음 저장 시 b 가 제거됨
+    assert cache.get("a") == "x" * 10
+    cache.set("d", "w" * 10, ttl=60)
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") == "x" * 10
+    assert cache.total_bytes == 30
+    assert cache.stats()["evictions"] == 1
+
+def test_rejects_oversized_entry():
+    cache = MemoryCache(max_bytes=100, max_entry_bytes=10)
+    cache.set("big", "old", ttl=60)
+
+    assert cache.set("big", "x" * 50, ttl=60) is False
+    assert cache.peek("big") is None
+    assert cache.total_bytes == 0
+
+def test_expired_entries_are_swept():
+    cache = MemoryCache(max_bytes=1000)
+    cache.set("short", "a", ttl=0.01)
+    cache.set("long", "b", ttl=60)
+    # 다시 저장된 키는 이전 만료 시각으로 지워지면 안 됨
+    cache.set("renewed", "c", ttl=0.01)
+    cache.set("renewed", "c", ttl=60)
+    time.sleep(0.02)
+
+    assert cache.sweep() == 1
+    assert len(cache) == 2
+    assert cache.get("short") is None
+    assert cache.get("renewed") == "c"
+
+def test_delete_matching_uses_glob():
+    cache = MemoryCache(max_bytes=1000)
+    cache.set("csv:v1:current:1", [1], ttl=60)
+    cache.set("csv:v1:processed:2", [2], ttl=60)
+    cache.set("weather:seoul", {"t": 1}, ttl=60)
+
+    assert cache.delete_matching("csv:*") == 2
+    assert len(cache) == 1
+    assert "weather:seoul" in cache
+
+def test_delete_tagged_removes_only_tagged_keys():
+    cache = MemoryCache(max_bytes=1000)
+    cache.set("proxy:a:1", [1], ttl=60, tags=["proxy:a"])
+    cache.set("proxy:a:2", [2], ttl=60, tags=["proxy:a"])
+    cache.set("proxy:b:1", [3], ttl=60, tags=["proxy:b"])
+
+    assert cache.delete_tagged("proxy:a") == 2
+    assert "proxy:b:1" in cache
+    assert len(cache) == 1
+
+def test_expiry_heap_stays_bounded_without_sweep():
+    cache = MemoryCache(max_bytes=10_000)
+    for i in range(200_000):
+        cache.set(f"key:{i % 10}", i, ttl=60)
+
+    assert len(cache) == 10
+    assert len(cache._expiry_heap) <= 2 * len(cache) + 1024 + 1
@@ -0,0 +1,246 @@
+# backend/tests/test_services/test_cache_service.py
+
+import asyncio
+import json
+import pytest
+
+from app.services.cache_service import CacheService
+
+def test_get_or_compute_runs_producer_once_for_concurrent_misses():
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"reports": [1, 2]}
+
+    async def run():
+        cache = CacheService()
+        await cache.connect()
+        results = await asyncio.gather(*[cache.get_or_compute("reports:list", produce, ttl=60) for _ in range(10)])
+        # 저장된 값은 다시 계산하지 않음
+        results.append(await cache.get_or_compute("reports:list", produce, ttl=60))
+        await cache.close()
+        return results
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result == {"reports": [1, 2]} for result in results)
+
+def test_get_or_compute_does_not_store_none_or_errors():
+    async def missing():
+        return None
+
+    async def broken():
+        raise ValueError("잘못된 필터")
+
+    async def run():
+        cache = CacheService()
+        await cache.connect()
+        assert await cache.get_or_compute("reports:detail:x", missing, ttl=60) is None
+        assert await cache.get("reports:detail:x") is None
+        with pytest.raises(ValueError):
+            await cache.get_or_compute("csv:v1:current:x", broken, ttl=60)
+        assert await cache.get("csv:v1:current:x") is None
+        await cache.close()
+
+    asyncio.run(run())
+
+def test_should_refresh_early_depends_on_compute_time():
+    # 남은 시간보다 계산 시간이 훨씬 길면 항상, 계산 시간 정보가 없으면 갱신하지 않음
+    assert CacheService._should_refresh_early(remaining=1.0, compute_time=1e9, beta=1.0)
+    assert not CacheService._should_refresh_early(remaining=1.0, compute_time=None, beta=1.0)
+    assert not CacheService._should_refresh_early(remaining=None, compute_time=1.0, beta=1.0)
+
+
+class FakeRedis:
+    """Redis 대신 쓰는 최소 구현 (워커 여러 개가 같은 저장소와 채널을 공유)"""
+    def __init__(self, store: dict, subscribers: list):
+        self.store = store
+        self.subscribers = subscribers
+        self.published = []
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def unlink(self, *keys):
+        return await self.delete(*(key.decode() if isinstance(key, bytes) else key for key in keys))
+
+    async def scan_iter(self, match, count=None):
+        import fnmatch
+        for key in [key for key in self.store if fnmatch.fnmatchcase(key, match)]:
+            yield key.encode()
+
+    async def publish(self, channel, message):
+        self.published.append(json.loads(message))
+        for subscriber in list(self.subscribers):
+            subscriber.queue.put_nowait({"type": "message", "data": message.encode()})
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self.subscribers)
+
+    async def close(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.calls.append(getattr(self.client, name)(*args, **kwargs))
+        return command
+
+    async def execute(self):
+        return [await call for call in self.calls]
+
+
+class FakePubSub:
+    def __init__(self, subscribers):
+        self.subscribers = subscribers
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.subscribers.append(self)
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def close(self):
+        if self in self.subscribers:
+            self.subscribers.remove(self)
+
+
+def make_workers(count):
+    """같은 FakeRedis 를 공유하는 CacheService 여러 개 (구독까지 시작)"""
+    store, subscribers = {}, []
+    workers = []
+    for _ in range(count):
+        cache = CacheService("redis://test")
+        cache.redis_client = FakeRedis(store, subscribers)
+        cache._use_redis = True
+        cache._listener = asyncio.create_task(cache._listen_invalidations())
+        workers.append(cache)
+    return workers
+
+
+async def settle():
+    # 구독 태스크가 메시지를 처리할 시간
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_l1_is_filled_from_redis_and_serves_repeat_reads():
+    async def run():
+        writer, reader = make_workers(2)
+        await settle()
+        await writer.set("reports:list:x", {"reports": [1]}, ttl=60)
+        await settle()
+
+        assert await reader.get("reports:list:x") == {"reports": [1]}
+        assert await reader.get("reports:list:x") == {"reports": [1]}
+        calls = reader.redis_client.get_calls
+        # 세션 키는 L1 에 두지 않음
+        await writer.set("session:abc", {"admin": True}, ttl=60)
+        await reader.get("session:abc")
+        await reader.get("session:abc")
+        sessions = reader.redis_client.get_calls - calls
+        for worker in (writer, reader):
+            await worker.close()
+        return calls, sessions
+
+    calls, sessions = asyncio.run(run())
+    assert calls == 1
+    assert sessions == 2
+
+def test_set_and_delete_publish_invalidation_to_other_workers():
+    async def run():
+        writer, reader = make_workers(2)
+        await settle()
+        await writer.set("reports:list:x", {"v": 1}, ttl=60)
+        await settle()
+        await reader.get("reports:list:x")
+
+        # 다른 워커가 값을 바꾸면 L1 사본 제거
+        await writer.set("reports:list:x", {"v": 2}, ttl=60)
+        await settle()
+        assert reader.local_cache.peek("reports:list:x") is None
+        assert await reader.get("reports:list:x") == {"v": 2}
+
+        await writer.delete("reports:list:x")
+        await settle()
+        assert await reader.get("reports:list:x") is None
+        published = writer.redis_client.published
+        for worker in (writer, reader):
+            await worker.close()
+        return published
+
+    published = asyncio.run(run())
+    assert [message["keys"] for message in published] == [["reports:list:x"]] * 3
+
+def test_delete_pattern_drops_matching_l1_copies_everywhere():
+    async def run():
+        writer, reader = make_workers(2)
+        await settle()
+        for key in ("proxy:a:1", "proxy:a:2", "proxy:b:1"):
+            await writer.set(key, {"key": key}, ttl=60)
+            await settle()
+            await reader.get(key)
+
+        deleted = await writer.delete_pattern("proxy:a:*")
+        await settle()
+        remaining = [key for key in ("proxy:a:1", "proxy:a:2", "proxy:b:1") if key in reader.local_cache]
+        for worker in (writer, reader):
+            await worker.close()
+        return deleted, remaining
+
+    deleted, remaining = asyncio.run(run())
+    assert deleted == 2
+    assert remaining == ["proxy:b:1"]
+
+def test_own_invalidation_messages_are_ignored():
+    cache = CacheService("redis://test")
+    cache.local_cache.set("csv:v1:current:x", [1], ttl=60)
+
+    cache._apply_invalidation({"origin": cache._instance_id, "keys": ["csv:v1:current:x"], "pattern": None})
+    assert "csv:v1:current:x" in cache.local_cache
+
+    cache._apply_invalidation({"origin": "other", "keys": [], "pattern": "csv:*"})
+    assert "csv:v1:current:x" not in cache.local_cache
+
+def test_listener_error_clears_l1_and_resubscribes(monkeypatch):
+    async def run():
+        (cache,) = make_workers(1)
+        await settle()
+        cache.local_cache.set("reports:list:x", [1], ttl=60)
+        subscribers = cache.redis_client.subscribers
+
+        # 재구독 대기 시간 없이 진행
+        real_sleep = asyncio.sleep
+        monkeypatch.setattr(asyncio, "sleep", lambda delay: real_sleep(0))
+        subscribers[0].queue.put_nowait(ConnectionError("connection lost"))
+        await settle()
+        cleared = "reports:list:x" not in cache.local_cache
+        resubscribed = len(subscribers) == 1
+        monkeypatch.setattr(asyncio, "sleep", real_sleep)
+        await cache.close()
+        return cleared, resubscribed
+
+    assert asyncio.run(run()) == (True, True)
@@ -0,0 +1,80 @@
+# backend/tests/test_services/test_csv_aggregate.py
+
+import numpy as np
+import pytest
+
+from app.services.csv_aggregate import aggregate, parse_aggregate
+from app.services.csv_dataset import CSVDataset
+
+ROWS = [
+    ("창원시", "A", "10"),
+    ("진주시", "A", "20"),
+    ("창원시", "B", "30"),
+    ("창원시", "A", "n/a"),
+    ("진주시", "A", "40"),
+    ("김해시", "A", ""),
+    ("창원시", "A", "50"),
+    ("창원시", "B", "35"),
+]
+# 숫자로 읽을 수 있는 값만 (n/a, 빈 값 제외)
+VALUES = {
+    "창원시": [10.0, 30.0, 50.0, 35.0],
+    "진주시": [20.0, 40.0],
+}
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "visitors.csv"
+    lines = ["region,kind,visitors"] + [",".join(row) for row in ROWS]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return CSVDataset.from_csv(str(path))
+
+def run(dataset, group_by, spec):
+    return aggregate(dataset, dataset.all_rows(), group_by, parse_aggregate(spec))
+
+def test_statistics_match_numpy(dataset):
+    output, rejected = run(dataset, ["region"], "visitors:sum,avg,min,max,count,median,p95,stddev,distinct")
+
+    # 숫자가 하나도 없는 그룹(김해시)은 결과에서 제외
+    assert [row["region"] for row in output] == ["창원시", "진주시"]
+    assert rejected == {"visitors": 1}
+    for row in output:
+        values = np.array(VALUES[row["region"]])
+        assert row["visitors_sum"] == pytest.approx(values.sum())
+        assert row["visitors_avg"] == pytest.approx(values.mean())
+        assert row["visitors_min"] == values.min()
+        assert row["visitors_max"] == values.max()
+        assert row["visitors_count"] == len(values)
+        assert row["visitors_median"] == pytest.approx(np.percentile(values, 50))
+        assert row["visitors_p95"] == pytest.approx(np.percentile(values, 95))
+        # 모집단 표준편차 (ddof=0)
+        assert row["visitors_stddev"] == pytest.approx(np.std(values))
+        assert row["visitors_distinct"] == len(set(values))
+
+def test_group_count_includes_rejected_rows(dataset):
+    output, _ = run(dataset, ["region"], "visitors:count")
+    counts = {row["region"]: (row["count"], row["visitors_count"]) for row in output}
+    assert counts == {"창원시": (5, 4), "진주시": (2, 2)}
+
+def test_multi_column_keys_in_first_appearance_order(dataset):
+    output, _ = run(dataset, ["region", "kind"], "visitors:sum")
+    assert [(row["region"], row["kind"], row["visitors_sum"]) for row in output] == [
+        ("창원시", "A", 60.0),
+        ("진주시", "A", 60.0),
+        ("창원시", "B", 65.0),
+    ]
+
+def test_subset_of_rows(dataset):
+    output, rejected = aggregate(dataset, np.array([0, 3, 5]), ["region"], parse_aggregate("visitors:avg"))
+    assert output == [{"region": "창원시", "count": 2, "visitors_avg": 10.0}]
+    assert rejected == {"visitors": 1}
+
+def test_missing_value_column_has_no_groups(dataset):
+    output, rejected = run(dataset, ["region"], "unknown:sum")
+    assert output == []
+    assert rejected == {"unknown": 0}
+
+@pytest.mark.parametrize("spec", ["visitors", "visitors:mode", ";", "visitors:"])
+def test_invalid_aggregate_raises(spec):
+    with pytest.raises(ValueError):
+        parse_aggregate(spec)
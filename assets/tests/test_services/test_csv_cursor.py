@@ -0,0 +1,91 @@
+# backend/tests/test_services/test_csv_cursor.py
+
+import asyncio
+import os
+
+import pytest
+
+from app.services import csv_dataset, csv_filter
+from app.services.csv_dataset import load_dataset
+from app.services.csv_filter import compile_filter
+from app.services.csv_index import get_indexes
+from app.services.csv_service import CSVService
+
+REGIONS = ("창원시", "진주시", "김해시")
+ROW_COUNT = 60
+
+@pytest.fixture
+def csv_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(csv_dataset, "_datasets", type(csv_dataset._datasets)())
+    # 구간 경계를 여러 번 넘도록 작은 검사 단위 사용
+    monkeypatch.setattr(csv_filter, "SCAN_CHUNK_SIZE", 7)
+    path = tmp_path / "visitors.csv"
+    lines = ["id,region,visitors"] + [
+        f"{i},{REGIONS[i % 3]},{'' if i % 11 == 0 else i * 10}" for i in range(ROW_COUNT)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+def fetch(service, path, **kwargs):
+    return asyncio.run(service.get_current_data(file_path=path, **kwargs))
+
+def page_by_cursor(service, path, filter, limit):
+    """첫 페이지는 offset 방식, 이후 next_cursor 로 끝까지"""
+    result = fetch(service, path, filter=filter, limit=limit)
+    ids = [row["id"] for row in result["data"]]
+    pages = 1
+    while result["metadata"]["next_cursor"]:
+        assert result["metadata"]["has_more"]
+        result = fetch(service, path, filter=filter, limit=limit, cursor=result["metadata"]["next_cursor"])
+        ids += [row["id"] for row in result["data"]]
+        pages += 1
+    assert not result["metadata"]["has_more"]
+    return ids, pages
+
+@pytest.mark.parametrize("filter", [
+    None,
+    "visitors >= 200",
+    "region = 진주시",
+    "region = 창원시 and visitors < 400",
+    "region in ('김해시', '진주시') or visitors > 550",
+])
+@pytest.mark.parametrize("limit", [1, 4, 7, 100])
+def test_cursor_pages_match_offset_result(csv_path, filter, limit):
+    service = CSVService(os.path.dirname(csv_path))
+    expected = [row["id"] for row in fetch(service, csv_path, filter=filter, limit=ROW_COUNT)["data"]]
+    ids, pages = page_by_cursor(service, csv_path, filter, limit)
+
+    assert ids == expected
+    assert pages == max(1, -(-len(expected) // limit))
+
+def test_scan_has_more_at_exact_boundary(csv_path):
+    dataset = load_dataset(csv_path)
+    compiled = compile_filter("region = 진주시")
+    matches = compiled.row_ids(dataset).tolist()
+    for indexes in (None, get_indexes(dataset)):
+        row_ids, has_more = compiled.scan(dataset, indexes, 0, len(matches))
+        assert row_ids.tolist() == matches and not has_more
+        row_ids, has_more = compiled.scan(dataset, indexes, 0, len(matches) - 1)
+        assert row_ids.tolist() == matches[:-1] and has_more
+        row_ids, has_more = compiled.scan(dataset, indexes, matches[-1] + 1, 5)
+        assert row_ids.tolist() == [] and not has_more
+
+def test_cursor_from_other_filter_is_rejected(csv_path):
+    service = CSVService(os.path.dirname(csv_path))
+    cursor = fetch(service, csv_path, filter="visitors >= 200", limit=5)["metadata"]["next_cursor"]
+    with pytest.raises(ValueError, match="필터"):
+        fetch(service, csv_path, filter="visitors >= 300", limit=5, cursor=cursor)
+
+def test_cursor_after_file_change_is_rejected(csv_path):
+    service = CSVService(os.path.dirname(csv_path))
+    cursor = fetch(service, csv_path, limit=5)["metadata"]["next_cursor"]
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write(f"{ROW_COUNT},창원시,1\n")
+    with pytest.raises(ValueError, match="데이터가 변경"):
+        fetch(service, csv_path, limit=5, cursor=cursor)
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30=", "eyJyIjoieCJ9"])
+def test_malformed_cursor_is_rejected(csv_path, cursor):
+    service = CSVService(os.path.dirname(csv_path))
+    with pytest.raises(ValueError, match="잘못된 cursor"):
+        fetch(service, csv_path, limit=5, cursor=cursor)
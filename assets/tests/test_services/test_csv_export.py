@@ -0,0 +1,106 @@
+# backend/tests/test_services/test_csv_export.py
+
+import csv
+import gzip
+import io
+import json
+import zlib
+
+import pytest
+
+from app.services import csv_export
+from app.services.csv_export import compress, negotiate_encoding, serialize
+
+COLUMNS = ["region", "visitors", "memo"]
+BATCHES = [
+    [
+        {"region": "창원시", "visitors": 100, "memo": "쉼표, 포함"},
+        {"region": "진주시", "visitors": None, "memo": "줄\n바꿈"},
+    ],
+    [],
+    [{"region": "김해시", "visitors": 50.5, "memo": '"따옴표"'}],
+]
+ROWS = [row for rows in BATCHES for row in rows]
+
+def joined(fmt, batches=BATCHES):
+    return b"".join(serialize(iter(batches), fmt, COLUMNS))
+
+def test_json_is_one_array():
+    assert json.loads(joined("json")) == ROWS
+
+@pytest.mark.parametrize("batches", [[], [[]], [[], []]])
+def test_json_empty_input(batches):
+    assert joined("json", batches) == b"[]"
+
+def test_ndjson_one_row_per_line():
+    lines = joined("ndjson").decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == ROWS
+
+def test_csv_header_and_rows():
+    rows = list(csv.reader(io.StringIO(joined("csv").decode("utf-8"), newline="")))
+    assert rows[0] == COLUMNS
+    assert rows[1:] == [
+        ["창원시", "100", "쉼표, 포함"],
+        ["진주시", "", "줄\n바꿈"],
+        ["김해시", "50.5", '"따옴표"'],
+    ]
+
+@pytest.mark.parametrize("batches", [[], [[]]])
+def test_csv_empty_input_has_header_only(batches):
+    assert joined("csv", batches).decode("utf-8").splitlines() == [",".join(COLUMNS)]
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError):
+        joined("xml")
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("", None),
+    ("gzip", "gzip"),
+    ("deflate, gzip;q=0.5", "gzip"),
+    ("gzip;q=0", None),
+    ("gzip;q=0, *", None),
+    ("*", "gzip"),
+    ("*;q=0", None),
+    ("br, *;q=0.1", "gzip"),
+    ("identity", None),
+    ("gzip;q=abc", None),
+])
+def test_negotiate_encoding(header, expected, monkeypatch):
+    monkeypatch.setattr(csv_export, "ZSTD_AVAILABLE", False)
+    assert negotiate_encoding(header) == expected
+
+def test_negotiate_prefers_zstd_when_available(monkeypatch):
+    monkeypatch.setattr(csv_export, "ZSTD_AVAILABLE", True)
+    assert negotiate_encoding("gzip, zstd") == "zstd"
+    assert negotiate_encoding("gzip, zstd;q=0") == "gzip"
+    # * 는 gzip 에만 적용
+    assert negotiate_encoding("*") == "gzip"
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson", "csv"])
+def test_gzip_stream_decompresses_to_plain_output(fmt, monkeypatch):
+    # 작은 flush 단위 (첫 청크 flush + 마지막 flush 는 항상 따로 나옴)
+    monkeypatch.setattr(csv_export, "COMPRESS_FLUSH_BYTES", 64)
+    batches = BATCHES * 50
+    plain = joined(fmt, batches)
+    chunks = list(compress(serialize(iter(batches), fmt, COLUMNS), "gzip"))
+
+    assert len(chunks) >= 2
+    assert gzip.decompress(b"".join(chunks)) == plain
+
+def test_gzip_first_chunk_is_flushed():
+    # 첫 청크만으로도 앞부분을 풀 수 있어야 함 (첫 바이트 지연 없음)
+    chunks = compress(iter([b"[", b'{"a":1}', b"]"]), "gzip")
+    first = next(chunks)
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(first) == b"["
+
+def test_no_encoding_passes_chunks_through():
+    assert list(compress(iter([b"a", b"b"]), None)) == [b"a", b"b"]
+
+@pytest.mark.skipif(not csv_export.ZSTD_AVAILABLE, reason="zstandard 미설치")
+def test_zstd_stream_decompresses_to_plain_output():
+    import zstandard
+    plain = joined("ndjson", BATCHES * 50)
+    compressed = b"".join(compress(serialize(iter(BATCHES * 50), "ndjson", COLUMNS), "zstd"))
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed) == plain
@@ -0,0 +1,71 @@
+# backend/tests/test_services/test_csv_filter.py
+
+import numpy as np
+import pytest
+
+from app.services.csv_dataset import CSVDataset
+from app.services.csv_filter import FilterError, compile_filter
+from app.services.csv_index import get_indexes
+
+ROWS = [
+    ("창원시", "2024-01-01", "100", "해운대"),
+    ("진주시", "2024-02-01", "200", "진주성"),
+    ("창원시", "2024-03-01", "", "해양공원"),
+    ("김해시", "2024-04-01", "50", "수로왕릉"),
+    ("창원시", "2024-05-01", "300", "용지호수"),
+]
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "visitors.csv"
+    lines = ["region,date,visitors,place"] + [",".join(row) for row in ROWS]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return CSVDataset.from_csv(str(path))
+
+def rows(dataset, expression):
+    return compile_filter(expression).row_ids(dataset).tolist()
+
+def test_legacy_equality(dataset):
+    assert rows(dataset, "region=창원시") == [0, 2, 4]
+
+def test_and_or_with_parentheses(dataset):
+    assert rows(dataset, "region = '창원시' and visitors >= 200") == [4]
+    assert rows(dataset, "(region = 김해시 or region = 진주시) and visitors > 60") == [1]
+
+def test_in_between_and_prefix(dataset):
+    assert rows(dataset, "region in ('김해시', '진주시')") == [1, 3]
+    assert rows(dataset, "date between '2024-02-01' and '2024-04-01'") == [1, 2, 3]
+    assert rows(dataset, "place startswith 해") == [0, 2]
+
+def test_not_equal_on_numeric_column(dataset):
+    # 빈 값(NaN)은 != 조건에 포함
+    assert rows(dataset, "visitors != 100") == [1, 2, 3, 4]
+
+def test_numeric_comparison_on_dirty_column(tmp_path):
+    # 숫자가 아닌 값이 섞여 문자열 컬럼이 되어도 숫자로 비교하고, 숫자가 아닌 값은 제외
+    path = tmp_path / "dirty.csv"
+    path.write_text("visitors,region\n99,a\n150,b\n,c\nn/a,d\n1000,e\n150,f\n", encoding="utf-8")
+    dataset = CSVDataset.from_csv(str(path))
+    assert dataset.column("visitors").kind != "numeric"
+
+    assert rows(dataset, "visitors >= 100") == [1, 4, 5]
+    assert rows(dataset, "visitors < 1000") == [0, 1, 5]
+    assert rows(dataset, "visitors between 100 and 200") == [1, 5]
+    assert rows(dataset, "visitors = 'n/a'") == [3]
+    # 인덱스를 써도 같은 결과
+    indexes = get_indexes(dataset)
+    assert compile_filter("visitors between 100 and 200").row_ids(dataset, indexes).tolist() == [1, 5]
+
+def test_expression_is_cached_by_text():
+    assert compile_filter("region = '창원시'") is compile_filter("region = '창원시'")
+
+@pytest.mark.parametrize("expression", [
+    "unknown = 1",
+    "visitors > many",
+    "visitors >",
+    "region in ('a'",
+    "date between '2024-01-01'",
+])
+def test_invalid_expression_raises(dataset, expression):
+    with pytest.raises(FilterError):
+        compile_filter(expression).row_ids(dataset)
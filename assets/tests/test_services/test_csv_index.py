@@ -0,0 +1,40 @@
+# backend/tests/test_services/test_csv_index.py
+
+import os
+
+import pytest
+
+from app.services.csv_dataset import CSVDataset
+from app.services.csv_index import DatasetIndexes, index_path
+
+ROWS = [
+    ("창원시", "100"),
+    ("진주시", "200"),
+    ("창원시", "50"),
+    ("진주시", "70"),
+]
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "visitors.csv"
+    lines = ["region,visitors"] + [",".join(row) for row in ROWS]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return CSVDataset.from_csv(str(path))
+
+def test_saved_index_is_reused(dataset):
+    DatasetIndexes(dataset).equals("region", "창원시")
+    indexes = DatasetIndexes(dataset)
+    assert "region" in indexes._indexes
+    assert indexes.equals("region", "창원시").tolist() == [0, 2]
+
+@pytest.mark.parametrize("content", [b"PK\x03\x04garbage", b"", b"not a zip file"])
+def test_corrupt_index_is_rebuilt(dataset, content):
+    path = index_path(dataset.source_path)
+    with open(path, "wb") as f:
+        f.write(content)
+
+    indexes = DatasetIndexes(dataset)
+    assert indexes.equals("region", "창원시").tolist() == [0, 2]
+    # 깨진 파일은 새 인덱스로 덮어쓰고 임시 파일은 남기지 않음
+    assert "region" in DatasetIndexes(dataset)._indexes
+    assert sorted(os.listdir(os.path.dirname(path))) == ["visitors.csv", "visitors.csv.idx.npz"]
@@ -0,0 +1,189 @@
+# backend/tests/test_services/test_csv_ingest.py
+
+import asyncio
+import csv
+import io
+
+import pytest
+
+from app.core.config import settings
+from app.services import csv_ingest
+from app.services.csv_dataset import CSVDataset
+from app.services.csv_ingest import CSVIngestor
+from app.services.csv_service import CSVService
+
+# 따옴표 안 쉼표/줄바꿈/이스케이프된 따옴표가 섞인 데이터
+QUOTED_CSV = (
+    'region,place,memo\n'
+    '창원시,"용지호수, 공원","첫 줄\n둘째 줄"\n'
+    '진주시,진주성,"따옴표 ""안"" 쉼표, 줄바꿈\r\n끝"\n'
+    '김해시,"수로왕릉","\n"\n'
+    '통영시,케이블카,\n'
+).encode('utf-8')
+
+
+class FakeUpload:
+    """UploadFile 대신 read(size) 만 제공"""
+    def __init__(self, filename, data):
+        self.filename = filename
+        self._stream = io.BytesIO(data)
+
+    async def read(self, size=-1):
+        return self._stream.read(size)
+
+
+def ingest(data, chunk_size):
+    ingestor = CSVIngestor()
+    written = b''.join(
+        ingestor.feed(data[i:i + chunk_size]) for i in range(0, len(data), chunk_size)
+    )
+    written += ingestor.finish()
+    return ingestor.metadata(), written
+
+def expected_rows(data):
+    return list(csv.reader(io.StringIO(data.decode('utf-8-sig'), newline='')))[1:]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+def test_quoted_fields_split_across_chunks(chunk_size):
+    # 작은 청크로 나눠 모든 위치(멀티바이트 문자 중간 포함)에서 경계가 생기게 함
+    whole, _ = ingest(QUOTED_CSV, len(QUOTED_CSV))
+    metadata, written = ingest(QUOTED_CSV, chunk_size)
+
+    assert written == QUOTED_CSV
+    assert metadata["row_count"] == 4 == len(expected_rows(QUOTED_CSV))
+    assert metadata["column_names"] == ["region", "place", "memo"]
+    assert metadata["columns"] == whole["columns"]
+    assert metadata["rejected_rows"] == 0
+    assert metadata["sha256"] == whole["sha256"]
+
+def test_upload_stream_uses_chunk_size(tmp_path, monkeypatch):
+    # 실제 업로드 경로에서 CSV_UPLOAD_CHUNK_SIZE 경계가 따옴표 안에 걸리는 경우
+    monkeypatch.setattr(settings, "CSV_UPLOAD_CHUNK_SIZE", 4)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 1024 * 1024)
+    service = CSVService(str(tmp_path))
+    path = tmp_path / "quoted.csv"
+
+    metadata = asyncio.run(service._stream_to_disk(FakeUpload("quoted.csv", QUOTED_CSV), str(path)))
+
+    assert path.read_bytes() == QUOTED_CSV
+    assert metadata["row_count"] == 4
+    dataset = CSVDataset.from_csv(str(path))
+    assert [record["memo"] for record in dataset.records(dataset.all_rows())] == [
+        row[2] for row in expected_rows(QUOTED_CSV)
+    ]
+
+def test_bom_is_stripped():
+    data = b'\xef\xbb\xbf' + QUOTED_CSV
+    for chunk_size in (1, 2, len(data)):
+        metadata, written = ingest(data, chunk_size)
+        assert metadata["column_names"] == ["region", "place", "memo"]
+        assert metadata["encoding"] == "utf-8"
+        assert written == QUOTED_CSV
+
+def test_bom_then_cp949_is_rejected():
+    # BOM 이 있으면 UTF-8 파일이므로 CP949 로 바꾸지 않음
+    with pytest.raises(ValueError):
+        ingest(b'\xef\xbb\xbf' + 'region\n창원시\n'.encode('cp949'), 4)
+
+def test_bom_file_reads_back_without_bom(tmp_path):
+    path = tmp_path / "bom.csv"
+    path.write_bytes(b'\xef\xbb\xbf' + QUOTED_CSV)
+    dataset = CSVDataset.from_csv(str(path))
+    assert dataset.records(dataset.all_rows())[0]["region"] == "창원시"
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_cp949_fallback_transcodes_to_utf8(chunk_size):
+    text = 'region,place\n창원시,"용지호수, 공원"\n진주시,진주성\n'
+    metadata, written = ingest(text.encode('cp949'), chunk_size)
+
+    assert metadata["encoding"] == "cp949"
+    assert metadata["row_count"] == 2
+    assert written.decode('utf-8') == text
+
+def test_cp949_after_utf8_probe_is_rejected(monkeypatch):
+    # 판별 구간을 UTF-8 로 통과한 뒤 CP949 바이트가 나오면 읽을 수 없음
+    monkeypatch.setattr(csv_ingest, "ENCODING_PROBE_BYTES", 8)
+    data = 'region\n창원시\n'.encode('utf-8') + '진주시\n'.encode('cp949')
+    with pytest.raises(ValueError):
+        ingest(data, 4)
+
+def test_ascii_file_is_utf8():
+    metadata, written = ingest(b'region,visitors\nchangwon,100\n', 3)
+    assert metadata["encoding"] == "utf-8"
+    assert written == b'region,visitors\nchangwon,100\n'
+
+def test_truncated_multibyte_is_rejected():
+    with pytest.raises(ValueError):
+        ingest('region\n창원시\n'.encode('utf-8')[:-2], 4)
+
+def test_malformed_rows_are_rejected():
+    data = (
+        'region,visitors\n'
+        '창원시,100\n'
+        '진주시,200,extra\n'
+        '김해시\n'
+        '"통영시,\n케이블카",1,2,3\n'
+        '거제시,50\n'
+    ).encode('utf-8')
+    metadata, _ = ingest(data, 3)
+
+    assert metadata["rejected_rows"] == 2
+    # 헤더 제외 레코드 번호 (1부터)
+    assert metadata["rejected_samples"] == [2, 4]
+    assert metadata["row_count"] == 3
+    visitors = next(col for col in metadata["columns"] if col["name"] == "visitors")
+    assert visitors["null_count"] == 1
+
+def test_dataset_skips_rejected_rows(tmp_path):
+    path = tmp_path / "malformed.csv"
+    path.write_text('region,visitors\n창원시,100\n진주시,200,extra\n김해시\n', encoding='utf-8')
+    metadata, _ = ingest(path.read_bytes(), 5)
+
+    dataset = CSVDataset.from_csv(str(path))
+    records = dataset.records(dataset.all_rows())
+    assert len(records) == metadata["row_count"] == 2
+    assert [record["region"] for record in records] == ["창원시", "김해시"]
+
+def test_rejected_samples_are_capped():
+    data = ('a,b\n' + '1,2,3\n' * (csv_ingest.REJECTED_SAMPLE_SIZE + 5)).encode('utf-8')
+    metadata, _ = ingest(data, 7)
+    assert metadata["rejected_rows"] == csv_ingest.REJECTED_SAMPLE_SIZE + 5
+    assert len(metadata["rejected_samples"]) == csv_ingest.REJECTED_SAMPLE_SIZE
+
+class WatchingUpload(FakeUpload):
+    """읽을 때마다 기존 파일이 그대로 있는지 기록"""
+    def __init__(self, filename, data, live_path):
+        super().__init__(filename, data)
+        self.live_path = live_path
+        self.seen = []
+
+    async def read(self, size=-1):
+        self.seen.append(self.live_path.read_bytes() if self.live_path.exists() else None)
+        return await super().read(size)
+
+def test_upload_keeps_live_file_until_replaced(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CSV_UPLOAD_CHUNK_SIZE", 16)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 1024 * 1024)
+    live = tmp_path / "data.csv"
+    live.write_bytes(b"region\nold\n")
+    upload = WatchingUpload("data.csv", QUOTED_CSV, live)
+
+    result = asyncio.run(CSVService(str(tmp_path)).upload_and_process(upload))
+
+    assert upload.seen and all(content == b"region\nold\n" for content in upload.seen)
+    assert live.read_bytes() == QUOTED_CSV
+    with open(result["metadata"]["backup_path"], "rb") as f:
+        assert f.read() == b"region\nold\n"
+
+def test_failed_upload_leaves_live_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CSV_UPLOAD_CHUNK_SIZE", 16)
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 32)
+    live = tmp_path / "data.csv"
+    live.write_bytes(b"region\nold\n")
+
+    with pytest.raises(ValueError):
+        asyncio.run(CSVService(str(tmp_path)).upload_and_process(FakeUpload("data.csv", QUOTED_CSV)))
+
+    assert live.read_bytes() == b"region\nold\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["data.csv"]
@@ -0,0 +1,89 @@
+# backend/tests/test_services/test_csv_snapshot.py
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services import csv_dataset, csv_snapshot
+from app.services.csv_dataset import CSVDataset, load_dataset
+
+ROWS = [
+    ("창원시", "2024-01-01", "100", "해운대"),
+    ("진주시", "2024-02-01", "200.5", "진주성"),
+    ("창원시", "2024-03-01", "", "해양공원"),
+    ("김해시", "2024-04-01", "50", "수로왕릉"),
+]
+
+@pytest.fixture
+def csv_path(tmp_path, monkeypatch):
+    # 다른 워커처럼 프로세스 캐시 없이 시작
+    monkeypatch.setattr(csv_dataset, "_datasets", type(csv_dataset._datasets)())
+    path = tmp_path / "visitors.csv"
+    write_csv(path, ROWS)
+    return str(path)
+
+def write_csv(path, rows):
+    lines = ["region,date,visitors,place"] + [",".join(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+def as_records(dataset):
+    return dataset.records(dataset.all_rows())
+
+def reload(path):
+    """프로세스 캐시를 비우고 다시 읽기 (새 워커에서 여는 것과 같음)"""
+    csv_dataset._datasets.clear()
+    return load_dataset(path)
+
+def forbid_parsing(monkeypatch):
+    def fail(cls, file_path):
+        raise AssertionError("CSV 를 다시 파싱하면 안 됨")
+    monkeypatch.setattr(CSVDataset, "from_csv", classmethod(fail))
+
+def test_second_load_reuses_snapshot(csv_path, monkeypatch):
+    first = load_dataset(csv_path)
+    assert os.path.exists(csv_snapshot.snapshot_path(csv_path))
+    expected = as_records(CSVDataset.from_csv(csv_path))
+
+    forbid_parsing(monkeypatch)
+    second = reload(csv_path)
+
+    assert second is not first
+    assert isinstance(second.column("visitors").values, np.memmap)
+    assert as_records(second) == as_records(first) == expected
+    assert second.version == first.version
+
+def test_modified_csv_rebuilds_snapshot(csv_path):
+    first = load_dataset(csv_path)
+    write_csv(Path(csv_path), ROWS + [("통영시", "2024-05-01", "70", "동피랑")])
+
+    second = load_dataset(csv_path)
+
+    assert second.row_count == first.row_count + 1
+    assert second.version != first.version
+    assert second.records(np.array([4]))[0]["region"] == "통영시"
+    # 새로 만든 스냅샷은 바뀐 원본 기준
+    assert csv_snapshot.open_snapshot(csv_path, signature(csv_path)).row_count == 5
+
+@pytest.mark.parametrize("damage", ["truncate", "garbage", "bad_header"])
+def test_corrupt_snapshot_is_rebuilt(csv_path, damage):
+    expected = as_records(load_dataset(csv_path))
+    snap = csv_snapshot.snapshot_path(csv_path)
+    raw = open(snap, "rb").read()
+    if damage == "truncate":
+        raw = raw[:len(raw) - 100]
+    elif damage == "garbage":
+        raw = os.urandom(len(raw))
+    else:
+        raw = raw[:20] + b"{" * 10 + raw[30:]
+    with open(snap, "wb") as f:
+        f.write(raw)
+
+    assert csv_snapshot.open_snapshot(csv_path, signature(csv_path)) is None
+    assert as_records(reload(csv_path)) == expected
+    assert csv_snapshot.open_snapshot(csv_path, signature(csv_path)) is not None
+
+def signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
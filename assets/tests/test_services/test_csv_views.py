@@ -0,0 +1,71 @@
+# backend/tests/test_services/test_csv_views.py
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from app.core.config import settings
+from app.services import csv_dataset, csv_views
+from app.services.csv_service import CSVService
+
+DEFINITION = {"name": "by_region", "group_by": "region", "aggregate": "visitors:sum", "date_range": None}
+
+@pytest.fixture
+def csv_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(csv_dataset, "_datasets", type(csv_dataset._datasets)())
+    monkeypatch.setattr(settings, "MATERIALIZED_VIEWS_PATH", str(tmp_path / "views" / "definitions.json"))
+    path = tmp_path / "visitors.csv"
+    path.write_text("region,visitors\n창원시,100\n진주시,200\n창원시,50\n", encoding="utf-8")
+    csv_views.save_definitions([DEFINITION])
+    return str(path)
+
+def processed(service, path, group_by="region", aggregate="visitors:sum"):
+    return asyncio.run(service.get_processed_data(file_path=path, group_by=group_by, aggregate=aggregate))
+
+def sums(result):
+    return {row["region"]: row["visitors_sum"] for row in result["data"]}
+
+def mark_stored_result(path):
+    """저장된 결과를 표시값으로 바꿔 실제로 파일에서 읽었는지 확인"""
+    views_file = csv_views.views_path(path)
+    with open(views_file, encoding="utf-8") as f:
+        stored = json.load(f)
+    for view in stored["views"].values():
+        view["result"]["data"] = [{"region": "stored", "count": 0, "visitors_sum": -1.0}]
+    with open(views_file, "w", encoding="utf-8") as f:
+        json.dump(stored, f)
+
+def test_refresh_writes_registered_views(csv_path):
+    service = CSVService(os.path.dirname(csv_path))
+    result = asyncio.run(service.refresh_materialized_views(csv_path))
+
+    assert result["views"] == ["by_region"]
+    assert os.path.exists(csv_views.views_path(csv_path))
+
+def test_registered_view_is_served_from_file(csv_path):
+    service = CSVService(os.path.dirname(csv_path))
+    asyncio.run(service.refresh_materialized_views(csv_path))
+    mark_stored_result(csv_path)
+
+    # 공백/대소문자가 달라도 같은 조합
+    result = processed(service, csv_path, group_by=" region ", aggregate="visitors:SUM")
+    assert result["metadata"]["materialized_view"] == "by_region"
+    assert sums(result) == {"stored": -1.0}
+
+    # 등록되지 않은 조합은 실시간 계산
+    other = processed(service, csv_path, aggregate="visitors:max")
+    assert "materialized_view" not in other["metadata"]
+
+def test_view_is_ignored_after_csv_changes(csv_path):
+    service = CSVService(os.path.dirname(csv_path))
+    asyncio.run(service.refresh_materialized_views(csv_path))
+    mark_stored_result(csv_path)
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("김해시,70\n")
+
+    result = processed(service, csv_path)
+    assert "materialized_view" not in result["metadata"]
+    assert sums(result) == {"창원시": 150.0, "진주시": 200.0, "김해시": 70.0}
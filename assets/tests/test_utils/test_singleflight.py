@@ -0,0 +1,75 @@
+# backend/tests/test_utils/test_singleflight.py
+
+import asyncio
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"data": [1, 2, 3]}
+
+    async def run():
+        flight = SingleFlight()
+        results = await asyncio.gather(*[flight.do("weather", fetch) for _ in range(10)])
+        assert flight.in_flight() == 0
+        return results
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result == {"data": [1, 2, 3]} for result in results)
+
+def test_different_keys_run_separately():
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    async def run():
+        flight = SingleFlight()
+        return await asyncio.gather(
+            flight.do("a", lambda: fetch("a")),
+            flight.do("b", lambda: fetch("b"))
+        )
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+def test_exception_is_shared_and_key_is_released():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("upstream down")
+
+    async def run():
+        flight = SingleFlight()
+        results = await asyncio.gather(
+            flight.do("a", fail), flight.do("a", fail), return_exceptions=True
+        )
+        assert flight.in_flight() == 0
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def run():
+        flight = SingleFlight()
+        first = asyncio.ensure_future(flight.do("a", fetch))
+        second = asyncio.ensure_future(flight.do("a", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "ok"
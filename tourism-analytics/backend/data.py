@@ -1,6 +1,7 @@
-from fastapi import APIRouter, UploadFile, File,HTTPException,status
+from fastapi import APIRouter, UploadFile, File,HTTPException,status,BackgroundTasks
 from pathlib import Path
 from datetime import datetime
+import os, json, threading
 import pandas as pd
 
 router = APIRouter(prefix="/data", tags=["Data"])
@@ -8,16 +9,30 @@ router = APIRouter(prefix="/data", tags=["Data"])
 BACKEND_DIR=Path(__file__).resolve().parent
 STORAGE_DIR=BACKEND_DIR/"storage"
 STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+FILE_PATH=STORAGE_DIR/"경상남도_주요관광지점_입장객.xls"
+INDEX_PATH=STORAGE_DIR/"경상남도_주요관광지점_입장객.index.json"
+INDEX_VERSION=1
+TOP_N=20
 
+# 파싱된 데이터셋 캐시 (프로세스 전역)
+# - 파일의 (mtime, size)가 바뀌면 다시 읽어옴
+_dataset_lock=threading.Lock()
+_dataset_cache={"signature": None, "df": None}
+
+# 군구별 상위 관광지 인덱스 캐시
+_index_lock=threading.Lock()
+_index_cache={"mtime": None, "index": None}
 
 
 @router.post("/upload", )
 async def upload_xls(
+    background_tasks:BackgroundTasks,
     file:UploadFile=File(...)
  ):
     """
     엑셀 데이터 파일(xls) 업로드 요청 처리 및 파일 저장(storage 폴더)
     - Content-Type: multipart/form-data 로 구현
+    - 저장 후 군구/월별 상위 관광지 인덱스를 백그라운드에서 생성
     """
     
     # 파일 확장자 확인
@@ -26,7 +41,7 @@ async def upload_xls(
     
     # 파일 저장 경로 설정
     formatted_date=datetime.now().strftime("%Y-%m-%d")
-    file_path=STORAGE_DIR/"경상남도_주요관광지점_입장객.xls"
+    file_path=FILE_PATH
     
     try:
         with open(file_path, "wb") as buffer:
@@ -36,6 +51,11 @@ async def upload_xls(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="업로드에 실패했습니다."
         )
+    finally:
+        # 새 파일이 기록되었으므로 캐시된 데이터셋 무효화
+        invalidate_dataset()
+    
+    background_tasks.add_task(build_index)
     
     return{
         "success": True,
@@ -49,56 +69,166 @@ async def upload_xls(
 async def query_data(
     region:str,
 ):
-    FILE_PATH=STORAGE_DIR/"경상남도_주요관광지점_입장객.xls"
-    
-    df=pd.read_excel(FILE_PATH, header=[0,1])       # 병합된 셀 보완
+    # 전년동기대비 필터링
+    last_year=datetime.now().replace(year=datetime.now().year - 1)
+    target=last_year.strftime('%Y년 %m월')
     
-    df.columns=[col[0] if 'Unnamed' in col[1] else f"{col[0]}_{col[1]}"
-    for col in df.columns.to_list()]
+    # 업로드 시 생성된 인덱스가 최신이면 바로 조회
+    index=load_index()
+    if index is not None:
+        if region not in index["regions"]:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="지정된 군구 데이터가 없습니다.")
+        month=index["months"].get(target)
+        if month is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="지정된 전년동기대비 데이터가 없습니다.")
+        return{
+            "success":True,
+            "region":region,
+            "year-on-year": month["column"],
+            "places": month["places"].get(region, [])
+        }
     
+    # 인덱스가 아직 생성되지 않은 경우 데이터프레임에서 직접 계산
+    df=load_dataset()
+    _check_columns(df)
     
-    # 군구 필터링 및 합계 검색
-    if '군구' not in df.columns and '내/외국인' not in df.columns:
-        raise HTTPException(status_code=500, detail="필수 컬럼(군구, 내/외국인)이 누락되어 있습니다.")
-    
-    filtered_places=df[(df['군구']==region)&(df['내/외국인']=='합계')].copy()
+    filtered_places=df[(df['군구']==region)&(df['내/외국인']=='합계')]
     if filtered_places.empty:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="지정된 군구 데이터가 없습니다.")
     
-    # 전년동기대비 필터링
-    last_year=datetime.now().replace(year=datetime.now().year - 1)
-    target=last_year.strftime('%Y년 %m월')
-    
-    # 해당 월로 끝나는 컬럼명 찾기
-    matching_cols = []
-    print(target)
-    for col in df.columns:
-        if "_" in col:
-            suffix = col.split("_", 1)[1]
-            if suffix == target:
-                matching_cols.append(col)
-    
-    if not matching_cols:
+    month_col=_month_columns(df).get(target)
+    if month_col is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="지정된 전년동기대비 데이터가 없습니다.")
     
-    month_col = matching_cols[0]
-    # 방문자 수 기준 내림차순 정렬
-    sorted_places=filtered_places.sort_values(by=month_col,ascending=False)
-    
-    # dataframe 로우명 설정
-    # 값이 NaN이거나 비어있는 항목은 배제함
-    result=[]
-    for _, row in sorted_places.iterrows():
-        if pd.isna(row[month_col]):
-            continue
-        result.append({
-            "name": row["관광지"],
-            "visitors": int(row[month_col])
-        })
-    
     return{
         "success":True,
         "region":region,
         "year-on-year": month_col,
-        "places": result[0:20]
-    }
\ No newline at end of file
+        "places": _top_places(filtered_places, month_col)
+    }
+
+
+def build_index() -> None:
+    """
+    군구 x 월 컬럼별 방문자 수 상위 TOP_N 관광지 인덱스 생성
+    - 업로드 직후 한 번 계산하여 엑셀 옆에 JSON으로 저장
+    - 원본 파일의 (mtime, size)를 함께 기록하여 최신 여부 판단
+    """
+    try:
+        stat=FILE_PATH.stat()
+        df=load_dataset()
+        _check_columns(df)
+    except HTTPException:
+        return
+    
+    totals=df[df['내/외국인']=='합계']
+    months={}
+    for target, month_col in _month_columns(df).items():
+        places={
+            region: _top_places(rows, month_col)
+            for region, rows in totals.groupby('군구', sort=False)
+        }
+        months[target]={"column": month_col, "places": places}
+    
+    index={
+        "version": INDEX_VERSION,
+        "source": [stat.st_mtime_ns, stat.st_size],
+        "regions": [str(region) for region in totals['군구'].dropna().unique()],
+        "months": months
+    }
+    
+    # 임시 파일에 쓴 뒤 교체하여 읽는 쪽에서 깨진 파일을 보지 않도록 함
+    temp_path=INDEX_PATH.with_name(INDEX_PATH.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(temp_path, INDEX_PATH)
+
+
+def load_index() -> dict | None:
+    """
+    저장된 인덱스 반환
+    - 인덱스가 없거나 현재 엑셀 파일과 맞지 않으면 None
+    """
+    try:
+        index_mtime=INDEX_PATH.stat().st_mtime_ns
+        stat=FILE_PATH.stat()
+    except FileNotFoundError:
+        return None
+    
+    with _index_lock:
+        if _index_cache["mtime"] != index_mtime:
+            try:
+                with open(INDEX_PATH, "r", encoding="utf-8") as f:
+                    index=json.load(f)
+            except (OSError, ValueError):
+                return None
+            _index_cache["mtime"]=index_mtime
+            _index_cache["index"]=index
+        index=_index_cache["index"]
+    
+    if index.get("version") != INDEX_VERSION:
+        return None
+    if index.get("source") != [stat.st_mtime_ns, stat.st_size]:
+        return None
+    return index
+
+
+def _check_columns(df: pd.DataFrame) -> None:
+    # 군구 필터링 및 합계 검색에 필요한 컬럼 확인
+    if '군구' not in df.columns and '내/외국인' not in df.columns:
+        raise HTTPException(status_code=500, detail="필수 컬럼(군구, 내/외국인)이 누락되어 있습니다.")
+
+
+def _month_columns(df: pd.DataFrame) -> dict:
+    """'YYYY년 MM월' 접미사 -> 해당 월로 끝나는 첫 번째 컬럼명"""
+    months={}
+    for col in df.columns:
+        if "_" in col:
+            suffix = col.split("_", 1)[1]
+            months.setdefault(suffix, col)
+    return months
+
+
+def _top_places(places: pd.DataFrame, month_col: str) -> list:
+    """
+    방문자 수 기준 내림차순 상위 TOP_N 관광지
+    - 값이 NaN이거나 비어있는 항목은 배제함
+    """
+    ranked=places[places[month_col].notna()].sort_values(by=month_col, ascending=False).head(TOP_N)
+    return [
+        {"name": name, "visitors": int(visitors)}
+        for name, visitors in zip(ranked["관광지"], ranked[month_col])
+    ]
+
+
+def load_dataset() -> pd.DataFrame:
+    """
+    파싱된 입장객 데이터프레임 반환
+    - 최초 요청 시 한 번만 엑셀을 읽고 다중 헤더를 평탄화하여 메모리에 보관
+    - 파일의 수정 시각/크기가 달라지면 다시 읽음
+    """
+    try:
+        stat=FILE_PATH.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드된 데이터 파일이 없습니다.")
+    signature=(stat.st_mtime_ns, stat.st_size)
+    
+    with _dataset_lock:
+        if _dataset_cache["signature"] == signature:
+            return _dataset_cache["df"]
+        
+        df=pd.read_excel(FILE_PATH, header=[0,1])       # 병합된 셀 보완
+        
+        df.columns=[col[0] if 'Unnamed' in col[1] else f"{col[0]}_{col[1]}"
+        for col in df.columns.to_list()]
+        
+        _dataset_cache["signature"]=signature
+        _dataset_cache["df"]=df
+        return df
+
+
+def invalidate_dataset() -> None:
+    """캐시된 데이터프레임 폐기 (업로드 시 호출)"""
+    with _dataset_lock:
+        _dataset_cache["signature"]=None
+        _dataset_cache["df"]=None
@@ -1,9 +1,17 @@
-# pip install fastapi bcrypt pymupdf openai python-dotenv requests uvicorn xlrd pandas
+# pip install fastapi bcrypt pymupdf openai python-dotenv httpx uvicorn xlrd pandas
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import admin, data, report, proxy
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 외부 API 프록시용 커넥션 풀 생성/종료
+    await proxy.open_clients()
+    yield
+    await proxy.close_clients()
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(admin.router)
 app.include_router(data.router)
@@ -0,0 +1,125 @@
+import os, re, json, hashlib, tempfile, fitz
+
+# ============================================================
+# PDF 페이지 텍스트 인덱스 및 다중 키워드 매칭
+# ============================================================
+
+PAGE_INDEX_VERSION = 1
+PAGE_INDEX_KEEP = 5     # 디스크에 유지할 인덱스 개수
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_page_texts(pdf_path: str, index_dir: str = None, pdf_hash: str = None) -> list:
+    """
+    페이지 번호 -> 추출 텍스트 목록 반환
+    - PDF 내용 해시를 키로 디스크에 저장하여 같은 PDF는 한 번만 텍스트 추출
+    - 해시를 이미 계산한 경우 pdf_hash로 전달
+    """
+    if index_dir is None:
+        index_dir = _default_index_dir(pdf_path)
+    os.makedirs(index_dir, exist_ok=True)
+
+    if pdf_hash is None:
+        pdf_hash = file_sha256(pdf_path)
+    index_path = os.path.join(index_dir, f"{pdf_hash}.pages.json")
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == PAGE_INDEX_VERSION:
+            os.utime(index_path)    # 최근 사용 표시 (정리 기준)
+            return index["pages"]
+    except (OSError, ValueError):
+        pass
+
+    with fitz.open(pdf_path) as pdf:
+        pages = [page.get_text() for page in pdf]
+
+    # 임시 파일에 쓴 뒤 교체 (업로드 직후 생성과 리포트 생성이 겹쳐도 안전)
+    fd, temp_path = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"version": PAGE_INDEX_VERSION, "pages": pages}, f, ensure_ascii=False)
+    os.replace(temp_path, index_path)
+
+    try:
+        _prune_index_dir(index_dir)
+    except OSError:
+        pass
+    return pages
+
+
+def select_pages(page_texts: list, keyword_groups: dict) -> dict:
+    """
+    키워드 그룹별로 키워드가 하나라도 포함된 페이지 번호 반환
+    - 모든 그룹을 한 번의 페이지 순회로 처리
+    """
+    matcher = KeywordMatcher(keyword_groups)
+    selected = {group: [] for group in keyword_groups}
+    for page_num, text in enumerate(page_texts):
+        for group in matcher.match(text):
+            selected[group].append(page_num)
+    return selected
+
+
+class KeywordMatcher:
+    """
+    여러 그룹의 키워드를 한 번에 찾는 매처
+    - 모든 키워드를 하나의 정규식(전방탐색 alternation)으로 컴파일하여 텍스트를 한 번만 훑음
+    - 같은 위치에서 시작하는 짧은 키워드는 긴 키워드 매칭 시 함께 처리
+    """
+    def __init__(self, keyword_groups: dict):
+        keyword_to_groups = {}
+        for group, keywords in keyword_groups.items():
+            for keyword in keywords:
+                if keyword:
+                    keyword_to_groups.setdefault(keyword, set()).add(group)
+
+        # 매칭된 키워드 -> 그 키워드에 포함된 모든 키워드의 그룹
+        self._groups = {
+            keyword: set().union(*(
+                groups for other, groups in keyword_to_groups.items()
+                if other in keyword
+            ))
+            for keyword in keyword_to_groups
+        }
+        self._all_groups = set().union(*keyword_to_groups.values()) if keyword_to_groups else set()
+
+        alternation = "|".join(
+            re.escape(keyword)
+            for keyword in sorted(keyword_to_groups, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))") if alternation else None
+
+    def match(self, text: str) -> set:
+        """텍스트에 등장하는 키워드 그룹 집합"""
+        found = set()
+        if self._pattern is None:
+            return found
+        for m in self._pattern.finditer(text):
+            found |= self._groups[m.group(1)]
+            if found == self._all_groups:
+                break
+        return found
+
+
+def _default_index_dir(pdf_path: str) -> str:
+    return os.getenv("PDF_INDEX_DIR") or os.path.join(
+        os.path.dirname(os.path.abspath(pdf_path)), "page_index"
+    )
+
+
+def _prune_index_dir(index_dir: str) -> None:
+    """최근 사용한 PAGE_INDEX_KEEP개만 남기고 삭제"""
+    entries = [
+        os.path.join(index_dir, name) for name in os.listdir(index_dir)
+        if name.endswith(".pages.json")
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[PAGE_INDEX_KEEP:]:
+        os.remove(path)
@@ -1,60 +1,49 @@
 # pip install pymupdf openai python-dotenv
-import os, fitz
-from openai import OpenAI
+import os, fitz, asyncio
+from openai import AsyncOpenAI, NotFoundError
 from dotenv import load_dotenv
+from pdf_index import file_sha256, load_page_texts, select_pages
+from summary_cache import SummaryCache, excerpt_key, response_key
 
 # ============================================================
 # 외부 호출을 위한 공개 서비스 함수
 # ============================================================
 
-def generate_data_summary(pdf_path: str = None) -> str:
-    if pdf_path is None:
-        pdf_path = os.getenv("SOURCE_PDF_PATH")
-
-    keyword_list = [
-        "전국 주요관광지표",
-        "소셜미디어 언급량",
-        "경남 방문자 현황 1",
-        "경남 방문자 현황 2",
-        "방문자 거주지 분포 비율",
-        "외국인 국가별 방문비율",
-        "식음료, 숙박, 쇼핑몰, 백화점, 일부 교통시설을 제외한"
-    ]
-    extracted_pdf_path = os.getenv("EXTRACTED_DATA_PDF_PATH")
-
-    _extract_pages_by_keywords(
-        pdf_path,
-        extracted_pdf_path,
-        keyword_list
+DATA_KEYWORDS = [
+    "전국 주요관광지표",
+    "소셜미디어 언급량",
+    "경남 방문자 현황 1",
+    "경남 방문자 현황 2",
+    "방문자 거주지 분포 비율",
+    "외국인 국가별 방문비율",
+    "식음료, 숙박, 쇼핑몰, 백화점, 일부 교통시설을 제외한"
+]
+ISSUE_KEYWORDS = ["기사 보러가기"]
+
+
+async def generate_report(pdf_path: str = None) -> dict:
+    """
+    데이터 요약과 이슈 요약을 함께 생성
+    - 원본 PDF는 한 번만 읽어 두 요약에 필요한 페이지를 동시에 선택
+    - 두 요약의 업로드/GPT 호출은 병렬로 실행
+    """
+    data_summary, issue_summary = await _generate(
+        pdf_path, ["data_summary", "issue_summary"]
     )
-    file_id = _upload_pdf(extracted_pdf_path)
+    return {
+        "data_summary": data_summary,
+        "issue_summary": issue_summary
+    }
 
-    return _call_gpt(
-        file_id,
-        _data_summarize_prompt,
-        model=os.getenv("GPT_MODEL_1")
-    )
 
+async def generate_data_summary(pdf_path: str = None) -> str:
+    (summary,) = await _generate(pdf_path, ["data_summary"])
+    return summary
 
-def generate_issue_summary(pdf_path: str = None) -> str:
-    if pdf_path is None:
-        pdf_path = os.getenv("SOURCE_PDF_PATH")
-    
-    keyword_list = ["기사 보러가기"]
-    extracted_pdf_path = os.getenv("EXTRACTED_ISSUE_PDF_PATH")
-
-    _extract_pages_by_keywords(
-        pdf_path,
-        extracted_pdf_path,
-        keyword_list
-    )
-    file_id = _upload_pdf(extracted_pdf_path)
 
-    return _call_gpt(
-        file_id,
-        _issue_summarize_prompt,
-        model=os.getenv("GPT_MODEL_2")
-    )
+async def generate_issue_summary(pdf_path: str = None) -> str:
+    (summary,) = await _generate(pdf_path, ["issue_summary"])
+    return summary
 
 
 # ============================================================
@@ -66,17 +55,101 @@ def _load_prompt(path: str) -> str:
         return f.read()
 
 
-def _upload_pdf(file_path) -> str:
+def _summary_specs() -> dict:
+    """요약 종류별 (키워드, 임시 PDF 경로, 프롬프트, 모델)"""
+    return {
+        "data_summary": (
+            DATA_KEYWORDS,
+            os.getenv("EXTRACTED_DATA_PDF_PATH"),
+            _data_summarize_prompt,
+            os.getenv("GPT_MODEL_1")
+        ),
+        "issue_summary": (
+            ISSUE_KEYWORDS,
+            os.getenv("EXTRACTED_ISSUE_PDF_PATH"),
+            _issue_summarize_prompt,
+            os.getenv("GPT_MODEL_2")
+        ),
+    }
+
+
+async def _generate(pdf_path: str | None, names: list) -> list:
+    if pdf_path is None:
+        pdf_path = os.getenv("SOURCE_PDF_PATH")
+    specs = _summary_specs()
+
+    # PDF 처리는 CPU 작업이므로 이벤트 루프 밖에서 실행
+    pdf_hash = await asyncio.to_thread(file_sha256, pdf_path)
+    page_texts = await asyncio.to_thread(load_page_texts, pdf_path, None, pdf_hash)
+    selected_pages = select_pages(
+        page_texts, {name: specs[name][0] for name in names}
+    )
+
+    return await asyncio.gather(*[
+        _summarize(
+            pdf_path,
+            excerpt_key(pdf_hash, selected_pages[name]),
+            selected_pages[name],
+            *specs[name][1:]
+        )
+        for name in names
+    ])
+
+
+async def _summarize(
+    pdf_path: str, excerpt: str, pages: list,
+    extracted_pdf_path: str, prompt: str, model: str
+) -> str:
+    """
+    추출본 업로드 후 GPT 호출
+    - 같은 추출본/프롬프트/모델/temperature 조합은 저장된 응답 재사용
+    - 같은 추출본은 이전에 업로드한 file id 재사용 (프롬프트만 바뀐 경우 재업로드 없음)
+    """
+    temperature = float(os.getenv("OPENAI_TEMPERATURE"))
+    cached_key = response_key(excerpt, prompt, model, temperature)
+    cached = _cache.get_response(cached_key)
+    if cached is not None:
+        return cached
+
+    file_id = _cache.get_file_id(excerpt)
+    if file_id is not None:
+        try:
+            text = await _call_gpt(file_id, prompt, model=model)
+            _cache.put_response(cached_key, text)
+            return text
+        except NotFoundError:
+            # 원격 파일이 삭제된 경우 다시 업로드
+            _cache.drop_file_id(excerpt)
+
+    await asyncio.to_thread(_write_pages, pdf_path, pages, extracted_pdf_path)
+    file_id = await _upload_pdf(extracted_pdf_path)
+    await _delete_remote_files(_cache.put_file_id(excerpt, file_id))
+
+    text = await _call_gpt(file_id, prompt, model=model)
+    _cache.put_response(cached_key, text)
+    return text
+
+
+async def _upload_pdf(file_path) -> str:
     with open(file_path, "rb") as pdf_file:
-        response = _client.files.create(
+        response = await _client.files.create(
             file=pdf_file,
             purpose="assistants"
         )
     return response.id
 
 
-def _call_gpt(file_id: str, prompt: str, model: str) -> str:
-    response = _client.responses.create(
+async def _delete_remote_files(file_ids: list) -> None:
+    """캐시에서 밀려난 업로드 파일 정리"""
+    for file_id in file_ids:
+        try:
+            await _client.files.delete(file_id)
+        except Exception:
+            pass
+
+
+async def _call_gpt(file_id: str, prompt: str, model: str) -> str:
+    response = await _client.responses.create(
         model=model,
         temperature=float(os.getenv("OPENAI_TEMPERATURE")),
         input=[
@@ -92,25 +165,14 @@ def _call_gpt(file_id: str, prompt: str, model: str) -> str:
     return response.output_text
 
 
-def _extract_pages_by_keywords(
-    input_pdf_path: str, output_pdf_path: str, keyword_list: list
-) -> None:
+def _write_pages(input_pdf_path: str, pages: list, output_pdf_path: str) -> None:
+    """선택된 페이지만 담은 PDF 저장"""
     input_pdf = fitz.open(input_pdf_path)
     output_pdf = fitz.open()
-    selected_pages = set()
-
-    for page_num in range(len(input_pdf)):
-        page = input_pdf[page_num]
-        page_text = page.get_text()
-        for keyword in keyword_list:
-            if keyword in page_text:
-                selected_pages.add(page_num)
-
-    for page_num in sorted(selected_pages):
+    for page_num in pages:
         output_pdf.insert_pdf(
             input_pdf, from_page=page_num, to_page=page_num
         )
-
     output_pdf.save(output_pdf_path)
     output_pdf.close()
     input_pdf.close()
@@ -125,7 +187,12 @@ load_dotenv()
 _data_summarize_prompt = _load_prompt(os.getenv("DATA_SUMMARIZE_PROMPT_PATH"))
 _issue_summarize_prompt = _load_prompt(os.getenv("ISSUE_SUMMARIZE_PROMPT_PATH"))
 
-_client = OpenAI(
+_cache = SummaryCache(
+    os.getenv("SUMMARY_CACHE_PATH")
+    or os.path.join(os.path.dirname(os.path.abspath(os.getenv("SOURCE_PDF_PATH"))), "summary_cache.json")
+)
+
+_client = AsyncOpenAI(
     api_key=os.getenv("OPENAI_API_KEY"),
     #base_url=os.getenv("OPENAI_API_BASE"),
     timeout=int(os.getenv("OPENAI_TIMEOUT"))
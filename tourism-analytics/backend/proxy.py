@@ -1,9 +1,16 @@
-import os, requests
+import os, time, importlib.util
+import httpx
 from dotenv import load_dotenv
 from fastapi import (
     APIRouter, Request, Response, HTTPException, status
 )
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from urllib.parse import parse_qs, urlencode
+from proxy_cache import (
+    CachedResponse, ResponseCache, make_cache_key, parse_cache_control
+)
+from singleflight import SingleFlight
 
 router = APIRouter()
 load_dotenv()
@@ -21,6 +28,93 @@ API_KEY_PARAMS = {
     "tour_data": "serviceKey",
 }
 
+# 타겟별 응답 대기 시간(초), 연결 수립은 공통
+API_TIMEOUTS = {
+    "weather": float(os.getenv("WEATHER_API_TIMEOUT", "10")),
+    "tour_predict": float(os.getenv("TOUR_PREDICT_API_TIMEOUT", "30")),
+    "tour_data": float(os.getenv("TOUR_DATALAB_API_TIMEOUT", "30")),
+}
+CONNECT_TIMEOUT = float(os.getenv("PROXY_CONNECT_TIMEOUT", "5"))
+
+# 타겟별 커넥션 풀 크기
+POOL_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("PROXY_MAX_CONNECTIONS", "50")),
+    max_keepalive_connections=int(os.getenv("PROXY_MAX_KEEPALIVE", "10")),
+)
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# 타겟별 응답 캐시 유지 시간(초), 0이면 캐시하지 않음
+# - stale 구간 동안은 이전 응답을 반환하면서 백그라운드에서 갱신
+CACHE_TTLS = {
+    "weather": int(os.getenv("WEATHER_CACHE_TTL", "600")),
+    "tour_predict": int(os.getenv("TOUR_PREDICT_CACHE_TTL", "3600")),
+    "tour_data": int(os.getenv("TOUR_DATALAB_CACHE_TTL", "3600")),
+}
+CACHE_STALE_TTL = int(os.getenv("PROXY_CACHE_STALE_TTL", "600"))
+
+# 동일한 캐시 키로 동시에 들어온 외부 API 호출은 한 번만 수행
+_inflight = SingleFlight()
+
+CACHE_STATUS_HEADERS = {"fresh": "HIT", "stale": "STALE", "miss": "MISS"}
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("PROXY_CACHE_MAX_ENTRIES", "512"))
+)
+
+# 요청/응답 간에 복사하지 않는 헤더 (HTTP 계층 정보)
+EXCLUDED_REQUEST_HEADERS = {
+    "host",     # 목적지가 현재 프록시로 되어 있음
+    "connection",
+    "content-length",
+    "accept-encoding",   # 압축 해제는 프록시에서 처리
+}
+EXCLUDED_RESPONSE_HEADERS = {
+    "content-encoding",
+    "transfer-encoding",
+    "connection",
+    "content-length",
+}
+
+# 타겟별 공유 클라이언트 (lifespan에서 생성/종료)
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+async def open_clients() -> None:
+    """타겟별 AsyncClient 생성 (앱 시작 시)"""
+    for target in API_BASES:
+        _get_client(target)
+
+
+async def close_clients() -> None:
+    """모든 AsyncClient 종료 (앱 종료 시)"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def _get_client(target: str) -> httpx.AsyncClient:
+    client = _clients.get(target)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(API_TIMEOUTS[target], connect=CONNECT_TIMEOUT),
+            limits=POOL_LIMITS,
+            http2=HTTP2_ENABLED,
+        )
+        _clients[target] = client
+    return client
+
+
+@router.get("/proxy/cache-stats")
+async def proxy_cache_stats():
+    """
+    프록시 응답 캐시 통계 (hit/miss 카운터)
+    """
+    return {**response_cache.stats(), "in_flight": _inflight.in_flight()}
+
+
 @router.api_route(
     "/proxy/{target}/{path:path}",
     methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
@@ -56,28 +150,130 @@ async def proxy(request: Request, target: str, path: str):
     full_query = urlencode(query, doseq=True)
     url = f"{url_path}?{full_query}" if full_query else url_path
 
-    # 외부 API 호출
-    response = requests.request(
+    forward_headers = {
+        k: v for k, v in headers.items()
+        if k.lower() not in EXCLUDED_REQUEST_HEADERS
+    }
+
+    # 조회성 요청은 캐시를 거쳐 처리
+    if method == "GET" and CACHE_TTLS.get(target, 0) > 0:
+        cache_key = make_cache_key(method, target, path, parse_qs(query_string), api_key_param)
+        return await _cached_get(target, cache_key, url, forward_headers)
+
+    # 외부 API 호출 (응답 본문은 스트리밍으로 전달)
+    client = _get_client(target)
+    upstream_request = client.build_request(
         method=method,
         url=url,
-        headers={
-            k: v for k, v in headers.items()
-            if k.lower() != "host"   # 목적지가 현재 프록시로 되어 있음
-        },
-        data=body if body else None
+        headers=forward_headers,
+        content=body if body else None
     )
+    try:
+        response = await client.send(upstream_request, stream=True)
+    except httpx.TimeoutException:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Upstream timeout: {target}"
+        )
+    except httpx.HTTPError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Upstream connection error: {target}"
+        )
 
     # 응답 반환
-    return Response(
-        content=response.content,
+    return StreamingResponse(
+        response.aiter_bytes(),
         status_code=response.status_code,
         headers={
             k: v for k, v in response.headers.items()
-            if k.lower() not in [  # HTTP 계층 정보 제외하여 복사(응답 오류/중복 방지)
-                "content-encoding",
-                "transfer-encoding",
-                "connection",
-                "content-length"
-            ]
+            if k.lower() not in EXCLUDED_RESPONSE_HEADERS  # 응답 오류/중복 방지
+        },
+        background=BackgroundTask(response.aclose)
+    )
+
+
+async def _cached_get(target: str, cache_key: str, url: str, headers: dict) -> Response:
+    """
+    캐시를 거친 GET 요청 처리
+    - fresh: 캐시 응답 반환
+    - stale: 캐시 응답 반환 + 백그라운드 갱신
+    - miss: 외부 API 호출 후 저장
+    """
+    entry, state = response_cache.lookup(cache_key)
+    if state == "stale":
+        response_cache.refresh_in_background(
+            cache_key,
+            lambda: _fetch_coalesced(target, cache_key, url, headers)
+        )
+    if entry is None:
+        try:
+            entry = await _fetch_coalesced(target, cache_key, url, headers)
+        except httpx.TimeoutException:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"Upstream timeout: {target}"
+            )
+        except httpx.HTTPError:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Upstream connection error: {target}"
+            )
+
+    return Response(
+        content=entry.content,
+        status_code=entry.status_code,
+        headers={**entry.headers, "X-Cache": CACHE_STATUS_HEADERS[state]}
+    )
+
+
+async def _fetch_coalesced(target: str, cache_key: str, url: str, headers: dict) -> CachedResponse:
+    """동시에 들어온 동일 요청은 진행 중인 외부 API 호출 결과를 함께 사용"""
+    return await _inflight.do(
+        cache_key,
+        lambda: _fetch_into_cache(target, cache_key, url, headers)
+    )
+
+
+async def _fetch_into_cache(target: str, cache_key: str, url: str, headers: dict) -> CachedResponse:
+    """
+    외부 API 호출 후 캐시에 저장
+    - 이전 응답의 ETag가 있으면 조건부 요청으로 재검증 (304이면 본문 재사용)
+    - Cache-Control의 no-store/no-cache/private은 저장하지 않고, max-age는 TTL 상한으로 사용
+    """
+    previous = response_cache.peek(cache_key)
+    request_headers = dict(headers)
+    if previous is not None and previous.etag:
+        request_headers["If-None-Match"] = previous.etag
+
+    response = await _get_client(target).get(url, headers=request_headers)
+
+    storable, max_age = parse_cache_control(response.headers.get("cache-control"))
+    ttl = CACHE_TTLS[target] if max_age is None else min(max_age, CACHE_TTLS[target])
+
+    if response.status_code == status.HTTP_304_NOT_MODIFIED and previous is not None:
+        response_cache.counters["revalidated"] += 1
+        content = previous.content
+        status_code = previous.status_code
+        response_headers = previous.headers
+    else:
+        content = response.content
+        status_code = response.status_code
+        response_headers = {
+            k: v for k, v in response.headers.items()
+            if k.lower() not in EXCLUDED_RESPONSE_HEADERS
         }
+
+    now = time.monotonic()
+    entry = CachedResponse(
+        status_code=status_code,
+        headers=response_headers,
+        content=content,
+        fresh_until=now + ttl,
+        stale_until=now + ttl + CACHE_STALE_TTL,
+        etag=response.headers.get("etag") or (previous.etag if previous else None),
     )
+    # 정상 응답만 저장
+    if storable and ttl > 0 and status_code == status.HTTP_200_OK:
+        response_cache.store(cache_key, entry)
+    return entry
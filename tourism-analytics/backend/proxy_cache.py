@@ -0,0 +1,132 @@
+import asyncio, time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
+
+# ============================================================
+# 외부 API 응답 캐시 (TTL + stale-while-revalidate)
+# ============================================================
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    headers: dict
+    content: bytes
+    fresh_until: float
+    stale_until: float
+    etag: str | None = None
+    stored_at: float = field(default_factory=time.monotonic)
+
+
+class ResponseCache:
+    """
+    프록시 응답 캐시
+    - fresh: 그대로 반환
+    - stale: 만료 후 stale 구간 동안은 이전 응답을 반환하고 백그라운드에서 한 번만 갱신
+    - 항목 수 기준 LRU로 크기 제한
+    """
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "revalidated": 0,
+            "refresh_errors": 0,
+        }
+
+    def lookup(self, key: str) -> tuple[CachedResponse | None, str]:
+        """(항목, 상태) 반환 - 상태는 'fresh', 'stale', 'miss' 중 하나"""
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is None or entry.stale_until <= now:
+            if entry is not None:
+                del self._entries[key]
+            self.counters["misses"] += 1
+            return None, "miss"
+
+        self._entries.move_to_end(key)
+        if entry.fresh_until > now:
+            self.counters["hits"] += 1
+            return entry, "fresh"
+        self.counters["stale_hits"] += 1
+        return entry, "stale"
+
+    def peek(self, key: str) -> CachedResponse | None:
+        return self._entries.get(key)
+
+    def store(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh_in_background(self, key: str, refresh) -> None:
+        """
+        stale 항목 갱신 예약
+        - 같은 키에 대해 이미 갱신 중이면 새로 시작하지 않음
+        """
+        if key in self._refreshing:
+            return
+        self.counters["refreshes"] += 1
+        task = asyncio.create_task(self._run_refresh(refresh))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _run_refresh(self, refresh) -> None:
+        try:
+            await refresh()
+        except Exception:
+            # 갱신 실패 시 stale 응답을 그대로 유지
+            self.counters["refresh_errors"] += 1
+
+    def stats(self) -> dict:
+        return {
+            **self.counters,
+            "entries": len(self._entries),
+            "refreshing": len(self._refreshing),
+        }
+
+
+def make_cache_key(
+    method: str, target: str, path: str, query: dict, excluded_param: str
+) -> str:
+    """
+    캐시 키 생성
+    - 쿼리 파라미터는 정렬하여 순서와 무관하게 동일한 키가 되도록 함
+    - 서버에서 주입하는 서비스 키는 키에서 제외
+    """
+    items = sorted(
+        (name, value)
+        for name, values in query.items() if name != excluded_param
+        for value in values
+    )
+    return f"{method}:{target}:{path}?{urlencode(items)}"
+
+
+def parse_cache_control(value: str | None) -> tuple[bool, int | None]:
+    """
+    Cache-Control 헤더 해석
+    - (저장 가능 여부, max-age) 반환
+    """
+    if not value:
+        return True, None
+
+    storable = True
+    max_age = None
+    for directive in value.lower().split(","):
+        name, _, arg = directive.strip().partition("=")
+        if name in ("no-store", "no-cache", "private"):
+            storable = False
+        elif name in ("max-age", "s-maxage"):
+            try:
+                seconds = int(arg.strip('"'))
+            except ValueError:
+                continue
+            # s-maxage가 있으면 공유 캐시 기준으로 우선 적용
+            if max_age is None or name == "s-maxage":
+                max_age = seconds
+    return storable, max_age
@@ -1,9 +1,11 @@
-import os, shutil, json
+import os, shutil, json, uuid, asyncio
+from datetime import datetime
 from dotenv import load_dotenv
 from fastapi import (
-    APIRouter, UploadFile, File, HTTPException, status, Response
+    APIRouter, UploadFile, File, HTTPException, status, Response, BackgroundTasks
 )
-from prompt import generate_data_summary, generate_issue_summary
+from prompt import generate_report as generate_summaries
+from pdf_index import load_page_texts
 
 router = APIRouter(prefix="/report", tags=["Report"])
 
@@ -11,11 +13,20 @@ load_dotenv()
 SOURCE_PDF_PATH = os.getenv("SOURCE_PDF_PATH")
 REPORT_JSON_PATH = os.getenv("REPORT_JSON_PATH")
 
+# 리포트 생성 작업 상태 (프로세스 메모리)
+MAX_JOB_HISTORY = 20
+_jobs: dict[str, dict] = {}
+_tasks: set[asyncio.Task] = set()
+
 # 업로드된 PDF 저장
 @router.post("/source", status_code=status.HTTP_204_NO_CONTENT)
-async def upload_source(file: UploadFile = File(...)):
+async def upload_source(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...)
+):
     """
     관리자 PDF 업로드
+    - 저장 후 페이지 텍스트 인덱스를 백그라운드에서 미리 생성
     """
     # 임시 파일로 먼저 저장
     temp_path = SOURCE_PDF_PATH + ".uploading"
@@ -29,16 +40,23 @@ async def upload_source(file: UploadFile = File(...)):
 
     # 최종 저장
     os.rename(temp_path, SOURCE_PDF_PATH)
+
+    background_tasks.add_task(_build_page_index)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 # 리포트 생성
-@router.post("/generate", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/generate", status_code=status.HTTP_202_ACCEPTED)
 async def generate_report():
     """
-    업로드된 PDF에서 리포트 생성(GPT API 호출)
-    - 임시 PDF 삭제, 결과만 남김
+    업로드된 PDF에서 리포트 생성 작업 시작(GPT API 호출)
+    - 작업 ID를 즉시 반환하고 생성은 백그라운드에서 진행
+    - 이미 진행 중인 작업이 있으면 해당 작업 ID 반환
     """
+    for job in _jobs.values():
+        if job["status"] in ("pending", "running"):
+            return job
+
     # 원본 PDF 존재 확인
     if not os.path.exists(SOURCE_PDF_PATH):
         raise HTTPException(
@@ -46,25 +64,84 @@ async def generate_report():
             detail="Source not found"
         )
 
-    # 리포트 생성 (동기 방식)
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = {
+        "job_id": job_id,
+        "status": "pending",
+        "created_at": datetime.now().isoformat(),
+        "finished_at": None,
+        "error": None
+    }
+    # 작업 시작 시점의 원본 PDF (생성 중에 새 PDF가 업로드되면 삭제하지 않기 위해)
+    source_signature = _file_signature(SOURCE_PDF_PATH)
+    task = asyncio.create_task(_run_generation(job_id, source_signature))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+    return _jobs[job_id]
+
+
+# 리포트 생성 작업 상태 조회
+@router.get("/jobs/{job_id}")
+async def get_generation_job(job_id: str):
+    """
+    리포트 생성 작업 상태 반환 (pending, running, completed, failed)
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
+
+
+def _build_page_index() -> None:
     try:
-        data_summary = generate_data_summary()
-        issue_summary = generate_issue_summary()
+        load_page_texts(SOURCE_PDF_PATH)
+    except Exception:
+        # 인덱스는 생성 시점에 다시 시도되므로 실패해도 무시
+        pass
+
+
+def _file_signature(path: str) -> tuple | None:
+    """파일 교체 여부 확인용 (inode, 수정 시각, 크기)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+async def _run_generation(job_id: str, source_signature: tuple | None) -> None:
+    """
+    리포트 생성 작업 실행
+    - 데이터 요약과 이슈 요약을 병렬로 생성
+    - 임시 PDF 삭제, 결과만 남김
+    - 원본 PDF는 작업 시작 때와 같은 파일일 때만 삭제 (작업 중 새로 업로드된 PDF는 유지)
+    """
+    job = _jobs[job_id]
+    job["status"] = "running"
+    try:
+        result = await generate_summaries()
 
         # 결과 저장
-        result = {
-            "data_summary": data_summary,
-            "issue_summary": issue_summary
-        }
         with open(REPORT_JSON_PATH, "w", encoding="utf-8") as f:
             json.dump(result, f, ensure_ascii=False, indent=2)
-        
-        # 원본 pdf 삭제
-        try: os.remove(SOURCE_PDF_PATH)
-        except Exception: pass
+
+        # 원본 pdf 삭제 (작업 중 교체되지 않은 경우만)
+        if source_signature is not None and _file_signature(SOURCE_PDF_PATH) == source_signature:
+            try: os.remove(SOURCE_PDF_PATH)
+            except Exception: pass
+
+        job["status"] = "completed"
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e)
 
     # 프롬프트 실행을 위한 임시 pdf는 예외 발생 여부와 관계없이 항상 삭제
     finally:
+        job["finished_at"] = datetime.now().isoformat()
         for path in [
             os.getenv("EXTRACTED_DATA_PDF_PATH"), 
             os.getenv("EXTRACTED_ISSUE_PDF_PATH")
@@ -73,7 +150,9 @@ async def generate_report():
                 try: os.remove(path)
                 except Exception: pass
 
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+        # 오래된 작업 기록 정리 (최근 작업만 유지)
+        while len(_jobs) > MAX_JOB_HISTORY:
+            _jobs.pop(next(iter(_jobs)))
 
 
 # 리포트 조회
@@ -0,0 +1,80 @@
+import os, json, time, hashlib, tempfile, threading
+
+# ============================================================
+# 요약 결과 캐시 (내용 해시 기반)
+# - 추출 페이지 집합 해시 -> 업로드된 OpenAI file id
+# - (페이지 집합 해시, 프롬프트 해시, 모델, temperature) -> 응답 텍스트
+# ============================================================
+
+MAX_ENTRIES = 50    # 종류별 최대 보관 개수
+
+
+def excerpt_key(pdf_hash: str, pages: list) -> str:
+    """원본 PDF 해시와 선택된 페이지 번호로 추출본 키 생성"""
+    raw = f"{pdf_hash}:{','.join(str(page) for page in sorted(pages))}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def response_key(excerpt: str, prompt: str, model: str, temperature: float) -> str:
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    raw = json.dumps([excerpt, prompt_hash, model, temperature])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    JSON 파일 하나에 저장되는 file id / 응답 캐시
+    - 오래된 항목부터 MAX_ENTRIES 개를 넘는 만큼 제거
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def get_file_id(self, key: str) -> str | None:
+        entry = self._data["files"].get(key)
+        return entry["file_id"] if entry else None
+
+    def put_file_id(self, key: str, file_id: str) -> list:
+        """file id 저장 후 보관 한도를 넘어 제거된 file id 목록 반환"""
+        return self._put("files", key, {"file_id": file_id})
+
+    def drop_file_id(self, key: str) -> None:
+        with self._lock:
+            if self._data["files"].pop(key, None) is not None:
+                self._save()
+
+    def get_response(self, key: str) -> str | None:
+        entry = self._data["responses"].get(key)
+        return entry["text"] if entry else None
+
+    def put_response(self, key: str, text: str) -> None:
+        self._put("responses", key, {"text": text})
+
+    def _put(self, kind: str, key: str, entry: dict) -> list:
+        with self._lock:
+            entries = self._data[kind]
+            entries.pop(key, None)
+            entries[key] = {**entry, "stored_at": time.time()}
+
+            evicted = []
+            while len(entries) > MAX_ENTRIES:
+                evicted.append(entries.pop(next(iter(entries))))
+            self._save()
+        return [entry["file_id"] for entry in evicted if "file_id" in entry]
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {"files": data.get("files", {}), "responses": data.get("responses", {})}
+        except (OSError, ValueError):
+            return {"files": {}, "responses": {}}
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
@@ -63,11 +63,16 @@ export const uploadReportSource = (file) => {
   });
 };
 
-// ✅ AI 리포트 생성 API
+// ✅ AI 리포트 생성 API (작업 ID 반환)
 export const generateReport = () => {
   return axios.post('/report/generate'); // 빈 POST 요청
 };
 
+// ✅ AI 리포트 생성 작업 상태 조회 API
+export const fetchReportJob = (jobId) => {
+  return axios.get(`/report/jobs/${jobId}`);
+};
+
 // ✅ AI 리포트 조회 API
 export const fetchReport = () => {
   return axios.get('/report'); // 리포트 JSON을 가져오는 GET 요청
@@ -1,6 +1,8 @@
 import { useEffect, useState } from 'react';
 import { handleApi } from '../api/handleApi';
-import { adminLogin, changeAdminPassword, uploadExcelFile, uploadReportSource, generateReport } from '../api/internalApi';
+import { adminLogin, changeAdminPassword, uploadExcelFile, uploadReportSource, generateReport, fetchReportJob } from '../api/internalApi';
+
+const JOB_POLL_INTERVAL_MS = 3000;
 
 export default function AdminModal({ isOpen, onClose }) {
   // 인증 관련 상태
@@ -80,8 +82,18 @@ export default function AdminModal({ isOpen, onClose }) {
       setIsGenerating(true); // ⏳ 리포트 생성 시작
   
       try {
-        const { error: generateError } = await handleApi(generateReport);
+        const { data: job, error: generateError } = await handleApi(generateReport);
         if (generateError) return alert(generateError);
+
+        // 생성 작업이 끝날 때까지 상태 조회
+        let status = job.status;
+        while (status === 'pending' || status === 'running') {
+          await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+          const { data, error: jobError } = await handleApi(fetchReportJob, job.job_id);
+          if (jobError) return alert(jobError);
+          status = data.status;
+          if (status === 'failed') return alert(`리포트 생성 실패: ${data.error}`);
+        }
   
         alert('업로드 및 리포트 생성 성공');
         setFile(null);